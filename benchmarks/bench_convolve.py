@@ -0,0 +1,64 @@
+"""
+Benchmark of the convolution methods in pastas.convolve.
+
+Times the 'direct', 'fft' (with a cached spectrum of the stress, as used by
+the tseries) and 'oa' (overlap-add) methods for stresses of 1e3 to 1e6
+steps and block responses of 2 to 8192 steps. The fastest method is printed
+next to the method that is selected by the 'auto' engine, which is used to
+tune DIRECT_MAX_BLOCK and OA_MIN_STRESS.
+
+Run:
+-----
+>>> python bench_convolve.py
+
+"""
+
+from __future__ import print_function, division
+
+from timeit import default_timer
+
+import numpy as np
+from scipy.fftpack import next_fast_len
+
+from pastas import convolve as engine
+
+
+def timeit(func, *args, **kwargs):
+    repeat = kwargs.pop('repeat', 3)
+    times = []
+    for _ in range(repeat):
+        start = default_timer()
+        result = func(*args, **kwargs)
+        times.append(default_timer() - start)
+    return min(times), result
+
+
+def cached_spectrum(stress, nb):
+    nfft = next_fast_len(stress.size + 2 * nb)
+    S = np.fft.rfft(stress, nfft)
+    return lambda nb, dtype: (nfft, S)
+
+
+if __name__ == '__main__':
+    methods = ['direct', 'fft', 'oa']
+    print('%8s %6s %12s %12s %12s %8s %8s' % (
+        'n', 'nb', 'direct [ms]', 'fft [ms]', 'oa [ms]', 'fastest', 'auto'))
+    for n in [int(1e3), int(1e4), int(1e5), int(1e6)]:
+        stress = np.random.rand(n)
+        for nb in [2, 8, 32, 128, 512, 2048, 8192]:
+            if nb > n:
+                continue
+            b = np.exp(-np.arange(nb) / (nb / 4.0))
+            spectrum = cached_spectrum(stress, nb)
+            times = []
+            for method in methods:
+                t, h = timeit(engine.convolve, stress, b, spectrum=spectrum,
+                              method=method, repeat=5)
+                times.append(t * 1e3)
+                if method == 'direct':
+                    h0 = h
+                else:
+                    assert np.allclose(h, h0)
+            print('%8i %6i %12.3f %12.3f %12.3f %8s %8s' % (
+                n, nb, times[0], times[1], times[2],
+                methods[int(np.argmin(times))], engine.get_method(n, nb)))
@@ -0,0 +1,54 @@
+"""
+Benchmark of the nearest-neighbour sampling used by Model.sample.
+
+Compares pastas.utils.get_sample (np.searchsorted) with the previous
+implementation, which built a scipy.interpolate.interp1d(kind='nearest')
+object on every call, for indices of 1e5 to 1e7 points.
+
+Run:
+-----
+>>> python bench_sample.py
+
+"""
+
+from __future__ import print_function, division
+
+from timeit import default_timer
+
+import numpy as np
+import pandas as pd
+from scipy import interpolate
+
+from pastas.utils import get_sample
+
+
+def get_sample_interp1d(tindex, ref_tindex):
+    f = interpolate.interp1d(tindex.asi8, np.arange(0, tindex.size),
+                             kind='nearest', bounds_error=False,
+                             fill_value='extrapolate')
+    return np.unique(f(ref_tindex.asi8).astype(int))
+
+
+def timeit(func, *args, **kwargs):
+    repeat = kwargs.pop('repeat', 3)
+    times = []
+    for _ in range(repeat):
+        start = default_timer()
+        result = func(*args)
+        times.append(default_timer() - start)
+    return min(times), result
+
+
+if __name__ == '__main__':
+    print('%10s %8s %12s %12s %8s' % ('npoints', 'freq', 'interp1d [s]',
+                                      'search [s]', 'speedup'))
+    for n in [int(1e5), int(1e6), int(1e7)]:
+        # irregular observations and a simulation index of n points
+        tindex = pd.DatetimeIndex(pd.Timestamp('1980-01-01') + pd.to_timedelta(
+            np.unique(np.random.randint(0, n * 60, n // 10)), unit='s'))
+        for freq in ['T', 'H']:
+            ref = pd.date_range(tindex[0], tindex[-1], freq=freq)
+            t0, ind0 = timeit(get_sample_interp1d, tindex, ref)
+            t1, ind1 = timeit(get_sample, tindex, ref)
+            assert np.array_equal(ind0, ind1)
+            print('%10i %8s %12.4f %12.4f %8.1f' % (n, freq, t0, t1, t0 / t1))
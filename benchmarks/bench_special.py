@@ -0,0 +1,51 @@
+"""
+Benchmark of the tabulated special functions in pastas.special.
+
+Compares scipy.special.exp1 and scipy.special.gammainc with their tabulated
+versions for 500 to 50000 arguments, the number of time steps of a step
+response. The largest relative error is printed next to the times. The
+tables are built before the timing.
+
+Run:
+-----
+>>> python bench_special.py
+
+"""
+
+from __future__ import print_function, division
+
+from timeit import default_timer
+
+import numpy as np
+from scipy import special as sc
+
+from pastas import special
+
+
+def timeit(func, *args, **kwargs):
+    repeat = kwargs.pop('repeat', 3)
+    times = []
+    for _ in range(repeat):
+        start = default_timer()
+        result = func(*args)
+        times.append(default_timer() - start)
+    return min(times), result
+
+
+if __name__ == '__main__':
+    special.set_tables(True, rtol=1e-10)
+    print('%8s %12s %12s %12s %8s %10s' % ('n', 'function', 'scipy [ms]',
+                                           'table [ms]', 'speedup', 'error'))
+    for n in [500, 5000, 50000]:
+        # the times of a step response with a time step of 1 day
+        x = np.arange(1.0, n + 1) / (n / 10.0)
+        for name, f0, f1 in [
+            ('exp1', sc.exp1, special.exp1),
+            ('gammainc', lambda x: sc.gammainc(1.37, x),
+             lambda x: special.gammainc(1.37, x))]:
+            f1(x)  # build the table
+            t0, y0 = timeit(f0, x, repeat=10)
+            t1, y1 = timeit(f1, x, repeat=10)
+            error = np.abs(y1 / y0 - 1).max()
+            print('%8i %12s %12.3f %12.3f %8.1f %10.1e' % (
+                n, name, t0 * 1e3, t1 * 1e3, t0 / t1, error))
@@ -1,6 +1,8 @@
 from __future__ import print_function, division
 
 import pastas.read as read
+from .cache import SolveCache
+from .collection import ModelCollection
 from .model import Model
 from .recharge.recharge_func import Preferential, Linear, Percolation, \
     Combination
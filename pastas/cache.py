@@ -0,0 +1,250 @@
+"""This module contains the SolveCache class to store solve results on disk.
+
+The cache is keyed on a hash of everything that determines the outcome of
+Model.solve: the observations, the stresses, the model components, their
+settings and initial parameters, tmin and tmax, the weights, the solver
+options, the precision of the model and the global convolution engine and
+special function table settings. When the inputs of a model did not change,
+the stored solution is restored without running the solver.
+
+The keyword arguments of the solver are hashed by their repr, so these have
+to be plain values. Functions and classes are hashed by their full name,
+other objects of which the repr contains a memory address (e.g. lambda
+functions) are rejected, as they are not recognized in a later session.
+
+Examples
+--------
+>>> cache = SolveCache('solve_cache', max_size=500e6, max_age=30)
+>>> ml.solve(cache=cache)
+
+"""
+
+from __future__ import print_function, division
+
+import hashlib
+import os
+import pickle
+import time
+import types
+
+import numpy as np
+import pandas as pd
+
+from . import convolve, special
+from .version import __version__
+
+try:
+    from os import replace
+except ImportError:  # Python 2
+    def replace(src, dst):
+        if os.path.exists(dst):
+            os.remove(dst)
+        os.rename(src, dst)
+
+
+class SolveCache:
+    """On-disk cache of the results of Model.solve.
+
+    Parameters
+    ----------
+    path: str
+        Directory where the results are stored. It is created when it does
+        not exist.
+    max_size: float, optional
+        Maximum total size of the cache in bytes. The least recently used
+        results are removed when the cache is larger.
+    max_age: float, optional
+        Maximum age of a result in days since it was last used.
+
+    """
+
+    def __init__(self, path, max_size=1e9, max_age=30.0):
+        self.path = path
+        self.max_size = max_size
+        self.max_age = max_age
+        if not os.path.isdir(path):
+            os.makedirs(path)
+
+    def get_key(self, ml, tmin, tmax, solver, noise, initial, weights,
+                kwargs):
+        """Returns the hash of the inputs of Model.solve.
+
+        """
+        h = hashlib.sha256()
+        update = self.update_hash
+        update(h, __version__)
+        update(h, ml.oseries)
+        update(h, (ml.freq, ml.warmup, ml.time_offset, tmin, tmax,
+                   ml.dtype.str))
+        update(h, (convolve.get_engine(), convolve.DIRECT_MAX_BLOCK,
+                   convolve.OA_MIN_STRESS))
+        update(h, (special._tables['use'], special._tables['rtol']))
+        for name, ts in ml.tseriesdict.items():
+            update(h, (name, type(ts).__name__, type(ts.rfunc).__name__,
+                       ts.rfunc.up, ts.rfunc.cutoff,
+                       getattr(ts.rfunc, 'tail_tol', None)))
+            if hasattr(ts, 'recharge'):
+                update(h, (type(ts.recharge).__name__,
+                           getattr(ts.recharge, 'solver', None),
+                           getattr(ts.recharge, 'max_substeps', None)))
+            if hasattr(ts, 'r'):
+                update(h, ts.r)
+            update(h, ts.stress)
+        if ml.constant:
+            update(h, type(ml.constant).__name__)
+        if ml.noisemodel and noise:
+            update(h, type(ml.noisemodel).__name__)
+
+        parameters = ml.get_init_parameters(noise=noise)
+        update(h, list(parameters.index))
+        for column in ['initial', 'pmin', 'pmax', 'vary']:
+            update(h, getattr(parameters, column))
+        if not initial:
+            update(h, ml.parameters.to_frame()[['optimal']])
+
+        update(h, (getattr(solver, '__name__', solver), noise, initial))
+        update(h, weights)
+        update(h, self.normalize(kwargs))
+        return h.hexdigest()
+
+    @staticmethod
+    def normalize(obj):
+        """Returns obj with a repr that is the same in each session:
+        dictionaries are sorted and functions and classes are replaced by
+        their full name.
+
+        Raises
+        ------
+        TypeError
+            When the repr of obj contains a memory address, e.g. for lambda
+            functions and objects without a __repr__ method.
+
+        """
+        normalize = SolveCache.normalize
+        if isinstance(obj, (np.ndarray, pd.Series, pd.DataFrame)):
+            return obj
+        if isinstance(obj, dict):
+            return [(key, normalize(obj[key])) for key in sorted(obj)]
+        if isinstance(obj, (list, tuple)):
+            return type(obj)([normalize(item) for item in obj])
+        if isinstance(obj, (type, types.FunctionType,
+                            types.BuiltinFunctionType)):
+            name = getattr(obj, '__qualname__', obj.__name__)
+            if '<' not in name:  # e.g. <lambda> and <locals>
+                return '%s.%s' % (obj.__module__, name)
+        if ' at 0x' in repr(obj):
+            raise TypeError('%r can not be hashed for the cache, solve the '
+                            'model without cache.' % (obj,))
+        return obj
+
+    @staticmethod
+    def update_hash(h, obj):
+        """Updates the hash h with the content of obj.
+
+        """
+        if isinstance(obj, (pd.Series, pd.DataFrame)):
+            SolveCache.update_hash(h, list(pd.DataFrame(obj).columns))
+            SolveCache.update_hash(h, obj.index.values)
+            SolveCache.update_hash(h, obj.values)
+        elif isinstance(obj, np.ndarray):
+            obj = np.ascontiguousarray(obj)
+            h.update(repr((obj.dtype.str, obj.shape)).encode())
+            if obj.dtype.hasobject:
+                h.update(repr(obj.tolist()).encode())
+            else:
+                h.update(obj.tobytes())
+        else:
+            h.update(repr(obj).encode())
+
+    def get_fname(self, key):
+        return os.path.join(self.path, key + '.pkl')
+
+    def load(self, key):
+        """Returns the stored result for key, or None if it is not stored.
+
+        """
+        fname = self.get_fname(key)
+        if not os.path.isfile(fname):
+            return None
+        try:
+            with open(fname, 'rb') as f:
+                result = pickle.load(f)
+        except Exception:
+            # e.g. a file that was not completely written
+            os.remove(fname)
+            return None
+        # mark the result as recently used
+        os.utime(fname, None)
+        return result
+
+    def save(self, key, ml):
+        """Stores the solution of the model ml under key.
+
+        """
+        result = dict(parameters=ml.parameters, fit=FitSummary(ml.fit),
+                      report=ml.report, tmin=ml.tmin, tmax=ml.tmax)
+        fname = self.get_fname(key)
+        with open(fname + '.tmp', 'wb') as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        replace(fname + '.tmp', fname)
+        self.evict()
+
+    def evict(self):
+        """Removes results that are older than max_age and the least
+        recently used results when the cache is larger than max_size.
+
+        """
+        now = time.time()
+        files = []
+        for fname in os.listdir(self.path):
+            if not fname.endswith('.pkl'):
+                continue
+            fname = os.path.join(self.path, fname)
+            stat = os.stat(fname)
+            if now - stat.st_mtime > self.max_age * 86400.0:
+                os.remove(fname)
+            else:
+                files.append((stat.st_mtime, stat.st_size, fname))
+
+        size = sum([f[1] for f in files])
+        for mtime, fsize, fname in sorted(files):
+            if size <= self.max_size:
+                break
+            os.remove(fname)
+            size -= fsize
+
+    def clear(self):
+        """Removes all results from the cache.
+
+        """
+        for fname in os.listdir(self.path):
+            if fname.endswith('.pkl'):
+                os.remove(os.path.join(self.path, fname))
+
+
+class FitSummary:
+    """Picklable summary of the fit object of a solver.
+
+    The fit objects of the solvers hold references to the objective
+    function and the model, so only the attributes that describe the
+    result of the optimization are kept.
+
+    """
+    attributes = ['success', 'status', 'message', 'nfev', 'njev', 'x',
+                  'cost', 'optimality', 'chisqr', 'redchi', 'aic', 'bic',
+                  'params', 'var_names', 'covar', 'nvarys', 'ndata', 'nfree',
+                  'errorbars']
+
+    def __init__(self, fit):
+        for attribute in self.attributes:
+            try:
+                value = getattr(fit, attribute)
+                pickle.dumps(value)
+            except Exception:
+                continue
+            setattr(self, attribute, value)
+
+    def __repr__(self):
+        return 'FitSummary(%s)' % ', '.join(
+            ['%s=%r' % (a, getattr(self, a)) for a in self.attributes if
+             hasattr(self, a) and a not in ['params', 'covar', 'x']])
@@ -0,0 +1,236 @@
+"""This module contains the ModelCollection class to solve many models.
+
+Examples
+--------
+>>> mc = ModelCollection([ml1, ml2, ml3])
+>>> table = mc.solve_all(workers=4, noise=True)
+
+"""
+
+from __future__ import print_function, division
+
+import multiprocessing
+import sys
+import time
+import traceback
+import warnings
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from .cache import FitSummary
+from .solver import LmfitSolve
+
+
+class ModelCollection:
+    """Collection of time series models that are solved in parallel.
+
+    Parameters
+    ----------
+    models: list or dict, optional
+        Models to add to the collection. When a dict is provided, the keys
+        are used as the names of the models, otherwise the name attribute of
+        each model is used.
+
+    Notes
+    -----
+    The models are initialized in the current process, and a copy with only
+    the compiled calibration data and the parameters is sent to a pool of
+    worker processes. Only the results (the optimal parameters, the summary
+    of the fit, the report and the statistics) are sent back, the solved
+    model itself is not.
+
+    """
+
+    def __init__(self, models=None):
+        self.models = OrderedDict()
+        if isinstance(models, dict):
+            for name, ml in models.items():
+                self.add_model(ml, name)
+        elif models is not None:
+            for ml in models:
+                self.add_model(ml)
+
+    def __len__(self):
+        return len(self.models)
+
+    def add_model(self, ml, name=None):
+        """Adds a model to the collection.
+
+        Parameters
+        ----------
+        ml: pastas.Model
+            The time series model.
+        name: str, optional
+            Name of the model in the collection, ml.name by default.
+
+        """
+        if name is None:
+            name = ml.name
+        if name in self.models.keys():
+            warnings.warn('The name for the model you are trying to add '
+                          'already exists in this collection. Select another '
+                          'name.')
+        else:
+            self.models[name] = ml
+
+    def imap_solve(self, workers=None, stats=('evp', 'rmse'), tmin=None,
+                   tmax=None, solver=LmfitSolve, noise=True, initial=True,
+                   weights=None, **kwargs):
+        """Solves the models and yields the results as they finish.
+
+        Parameters
+        ----------
+        workers: int, optional
+            Number of worker processes, the number of cpu's by default. With
+            one worker the models are solved in the current process.
+        stats: tuple of str, optional
+            Names of the methods of pastas.stats.Statistics that are
+            calculated after each model is solved, for the calibration
+            period.
+        tmin, tmax, solver, noise, initial, weights:
+            See Model.solve.
+        kwargs:
+            Keyword arguments that are passed to the solver.
+
+        Yields
+        ------
+        result: dict
+            Dictionary with the name, the optimal parameters, the summary of
+            the fit, the report, the calculated statistics, the captured
+            warnings and, if solving failed, the traceback of the error.
+
+        Notes
+        -----
+        Each model is initialized in the current process. The workers get
+        a copy of the model with only the compiled calibration data and the
+        parameters (see Model.get_calib_model).
+
+        """
+        tasks = (self.get_task(name, ml, stats, tmin, tmax, solver, noise,
+                               initial, weights, kwargs)
+                 for name, ml in self.models.items())
+        if workers == 1:
+            results = map(_solve_model, tasks)
+            for result in results:
+                self.update_model(result)
+                yield result
+        else:
+            pool = multiprocessing.Pool(processes=workers)
+            try:
+                for result in pool.imap_unordered(_solve_model, tasks):
+                    self.update_model(result)
+                    yield result
+            finally:
+                pool.terminate()
+                pool.join()
+
+    @staticmethod
+    def get_task(name, ml, stats, tmin, tmax, solver, noise, initial,
+                 weights, kwargs):
+        """Initializes a model and returns the arguments of _solve_model.
+
+        """
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            try:
+                if noise and ml.noisemodel is None:
+                    warnings.warn('Warning, solution with noise model while '
+                                  'noise model is not defined. No noise '
+                                  'model is used.')
+                    noise = False
+                ml.tmin, ml.tmax = ml.get_tmin_tmax(tmin, tmax)
+                ml.initialize(initial=initial, noise=noise)
+                calib = ml.get_calib_model()
+                ml.del_calib_data()
+            except Exception:
+                calib = ''.join(traceback.format_exception(*sys.exc_info()))
+        caught = [str(w.message) for w in caught]
+        return name, calib, solver, noise, weights, kwargs, stats, caught
+
+    def solve_all(self, workers=None, stats=('evp', 'rmse'), **kwargs):
+        """Solves all the models in the collection.
+
+        Parameters
+        ----------
+        workers: int, optional
+            Number of worker processes, the number of cpu's by default.
+        stats: tuple of str, optional
+            Names of the methods of pastas.stats.Statistics that are
+            calculated after each model is solved.
+        kwargs:
+            Keyword arguments that are passed to imap_solve.
+
+        Returns
+        -------
+        table: pandas.DataFrame
+            DataFrame with a row for each model and columns with the optimal
+            parameters, the statistics, the solve time, the number of
+            warnings and the error message of models that failed.
+
+        """
+        rows = OrderedDict()
+        for result in self.imap_solve(workers, stats, **kwargs):
+            row = OrderedDict()
+            if result['optimal'] is not None:
+                row.update(zip(self.models[result['name']].parameters.index,
+                               result['optimal']))
+            row.update(result['stats'])
+            row['time'] = result['time']
+            row['nwarnings'] = len(result['warnings'])
+            if result['traceback'] is None:
+                row['error'] = None
+            else:
+                row['error'] = result['traceback'].strip().splitlines()[-1]
+            rows[result['name']] = row
+
+        # keep the order of the collection
+        names = [name for name in self.models.keys() if name in rows]
+        return pd.DataFrame.from_dict(rows, orient='index').loc[names]
+
+    def update_model(self, result):
+        """Sets the solution of a worker process on the model.
+
+        """
+        ml = self.models[result['name']]
+        if result['optimal'] is not None:
+            ml.parameters.optimal = result['optimal']
+            ml.fit = result['fit']
+            ml.report = result['report']
+
+
+def _solve_model(args):
+    """Solves one model, this function is executed by the workers.
+
+    """
+    name, ml, solver, noise, weights, kwargs, stats, caught = args
+    result = dict(name=name, optimal=None, fit=None, report=None,
+                  stats=OrderedDict(), warnings=caught, traceback=None,
+                  time=np.nan)
+    if isinstance(ml, str):
+        # the model could not be initialized
+        result['traceback'] = ml
+        return result
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        try:
+            t0 = time.time()
+            ml.solve_calib(solver, noise, weights, **kwargs)
+            result['time'] = time.time() - t0
+            result['optimal'] = ml.parameters.optimal.values
+            result['fit'] = FitSummary(ml.fit)
+            result['report'] = ml.report
+        except Exception:
+            result['traceback'] = ''.join(
+                traceback.format_exception(*sys.exc_info()))
+        else:
+            for stat in stats:
+                try:
+                    result['stats'][stat] = getattr(ml.stats, stat)()
+                except Exception as e:
+                    warnings.warn('Statistic %s could not be calculated: %s'
+                                  % (stat, e))
+                    result['stats'][stat] = np.nan
+    result['warnings'] += [str(w.message) for w in caught]
+    return result
@@ -0,0 +1,201 @@
+"""This module contains the convolution engine that is used by the tseries.
+
+Three methods are available to convolve a stress with a block response:
+
+- 'direct': numpy.convolve, fastest for short block responses.
+- 'fft': multiplication of the spectra of the stress and the block
+  response. The spectrum of the stress is cached by the tseries.
+- 'oa': overlap-add (scipy.signal.oaconvolve), fastest for long stresses.
+
+Response functions of which the block response is a rational function in
+the time step (Exponential and Gamma with an integer n) are simulated with a
+recursive filter (scipy.signal.lfilter) instead. The recursive filter is
+O(n) and the block response is not truncated at the cutoff.
+
+By default ('auto') the recursive filter is used when the response function
+supports it, otherwise the method is selected from the length of the stress
+and the block response. The thresholds below are obtained with
+benchmarks/bench_convolve.py. A fixed method can be set, e.g. for
+reproducible results or for profiling:
+
+>>> from pastas.convolve import set_engine
+>>> set_engine('fft')
+
+The convolutions are computed in the precision of the stress and the block
+response, so that the simulations of a model with dtype float32 keep half
+the memory and are faster (see Model). numpy.fft always computes in double
+precision, the functions rfft and irfft below use scipy.fft for single
+precision arrays. The recursive filter accumulates the response over the
+whole stress and is always computed in double precision.
+
+"""
+
+from __future__ import print_function, division
+
+import numpy as np
+from scipy.signal import fftconvolve, lfilter
+
+try:
+    from scipy import fft as sp_fft
+except ImportError:  # scipy < 1.4
+    sp_fft = None
+
+try:
+    from scipy.signal import oaconvolve
+except ImportError:  # scipy < 1.4
+    oaconvolve = None
+
+ENGINES = ('auto', 'direct', 'fft', 'oa')
+
+# Thresholds of the 'auto' engine, see benchmarks/bench_convolve.py
+DIRECT_MAX_BLOCK = 64  # longest block response for direct convolution
+OA_MIN_STRESS = 50000  # shortest stress for overlap-add
+
+_engine = 'auto'
+
+
+def set_engine(engine='auto'):
+    """Sets the convolution method that is used by all tseries.
+
+    Parameters
+    ----------
+    engine: str, optional
+        One of 'auto' (default), 'direct', 'fft' or 'oa'.
+
+    """
+    global _engine
+    if engine not in ENGINES:
+        raise ValueError('Convolution engine %s is not supported, choose '
+                         'from %s' % (engine, ENGINES))
+    if engine == 'oa' and oaconvolve is None:
+        raise ValueError('Overlap-add convolution needs scipy >= 1.4')
+    _engine = engine
+
+
+def use_recursive():
+    """Returns True if response functions with a recursive form are
+    simulated with a recursive filter. This is the case for the 'auto'
+    engine only.
+
+    """
+    return _engine == 'auto'
+
+
+def get_engine():
+    """Returns the convolution method that is set.
+
+    """
+    return _engine
+
+
+def get_method(n, nb):
+    """Returns the convolution method for a stress of length n and a block
+    response of length nb.
+
+    """
+    if _engine != 'auto':
+        return _engine
+    if nb <= DIRECT_MAX_BLOCK:
+        return 'direct'
+    if n >= OA_MIN_STRESS and nb < n and oaconvolve is not None:
+        return 'oa'
+    return 'fft'
+
+
+def convolve(stress, b, n=None, spectrum=None, method=None, dtype=None):
+    """Convolution of a stress with a block response.
+
+    Parameters
+    ----------
+    stress: numpy.ndarray
+        The stress.
+    b: numpy.ndarray
+        The block response.
+    n: int, optional
+        Number of values that is returned, the length of the stress by
+        default.
+    spectrum: function, optional
+        Function that returns the length of the FFT and the spectrum of the
+        stress for a block response length and a dtype, used by the 'fft'
+        method (see TseriesBase.get_spectrum).
+    method: str, optional
+        Convolution method, selected with get_method by default.
+    dtype: numpy.dtype, optional
+        Precision of the convolution, by default the precision of the
+        stress and the block response.
+
+    Returns
+    -------
+    numpy.ndarray
+        The first n values of the convolution.
+
+    """
+    if n is None:
+        n = stress.size
+    if method is None:
+        method = get_method(stress.size, b.size)
+    if dtype is None:
+        dtype = np.result_type(stress, b)
+    stress = stress.astype(dtype, copy=False)
+    b = b.astype(dtype, copy=False)
+
+    if method == 'direct':
+        return np.convolve(stress, b)[:n]
+    elif method == 'oa':
+        return oaconvolve(stress, b)[:n]
+    elif spectrum is None:
+        return fftconvolve(stress, b, 'full')[:n]
+    else:
+        nfft, S = spectrum(b.size, dtype)
+        return irfft(S * rfft(b, nfft), nfft)[:n]
+
+
+def rfft(x, nfft):
+    """Real FFT along the last axis, in single precision for single
+    precision x.
+
+    """
+    if x.dtype == np.float32 and sp_fft is not None:
+        return sp_fft.rfft(x, nfft)
+    return np.fft.rfft(x, nfft)
+
+
+def irfft(X, nfft):
+    """Inverse of rfft, in single precision for a single precision X.
+
+    """
+    if X.dtype == np.complex64 and sp_fft is not None:
+        return sp_fft.irfft(X, nfft)
+    return np.fft.irfft(X, nfft)
+
+
+def recursive(stress, iir):
+    """Convolution of a stress with a block response, given by its
+    recursive filter.
+
+    Parameters
+    ----------
+    stress: numpy.ndarray
+        The stress.
+    iir: tuple
+        Numerator, pole and multiplicity of the pole of the filter, as
+        returned by the iir method of the response functions.
+
+    Returns
+    -------
+    numpy.ndarray
+        The convolution at the times of the stress.
+
+    Notes
+    -----
+    The denominator (1 - r z^-1)^m is applied as m first-order sections,
+    which are less sensitive to rounding than the expanded polynomial when
+    the pole r is close to one. The filter is applied in double precision
+    and the result is returned in the precision of the stress.
+
+    """
+    num, r, m = iir
+    h = lfilter(num, [1.0], stress.astype(np.float64, copy=False))
+    for _ in range(m):
+        h = lfilter([1.0], [1.0, -r], h)
+    return h.astype(stress.dtype, copy=False)
@@ -4,19 +4,21 @@ import datetime
 import os
 import pickle
 from collections import OrderedDict
-from copy import deepcopy
+from copy import copy
 from warnings import warn
 
 import numpy as np
 import pandas as pd
-from scipy import interpolate
 
+from .cache import SolveCache
 from .checks import check_oseries
+from .parameters import ParameterSet
+from .plan import SimulationPlan, SamplingOperator
 from .plots import Plotting
 from .solver import LmfitSolve
 from .stats import Statistics
-from .tseries import Constant
-from .utils import get_dt, get_time_offset
+from .tseries import Constant, Recharge
+from .utils import get_dt, get_time_offset, get_sample
 from .version import __version__
 
 
@@ -43,6 +45,15 @@ class Model:
         linear interpolation.
     constant: bool, optional
         Add a constant to the model (Default=True).
+    dtype: numpy.dtype, optional
+        Precision of the simulations, residuals and innovations:
+        numpy.float64 (default) or numpy.float32. In single precision the
+        block responses, the recharge and the convolutions are computed in
+        single precision, which halves the memory of large ensembles (see
+        simulate_ensemble), with an error of about 1e-5 m for heads of
+        order 10 m. The step functions, the soil moisture of the recharge
+        models and the recursive filters are accumulated in double
+        precision. The model is always calibrated in double precision.
 
     Examples
     --------
@@ -53,7 +64,7 @@ class Model:
     """
 
     def __init__(self, oseries, xy=(0, 0), name="PASTAS_Model", metadata=None,
-                 warmup=0, fillnan='drop', constant=True):
+                 warmup=0, fillnan='drop', constant=True, dtype=np.float64):
         self.oseries = check_oseries(oseries, fillnan)
         self.oseries_calib = None
 
@@ -67,13 +78,15 @@ class Model:
         self.freq = 'D'
         self.time_offset = pd.to_timedelta(0)
 
-        self.parameters = pd.DataFrame(
-            columns=['initial', 'name', 'optimal', 'pmin', 'pmax', 'vary'])
+        self.parameters = ParameterSet()
         self.nparam = 0
 
         self.tseriesdict = OrderedDict()
         self.tseriesdict_calib = None
-        self.interpolate_simulation = None
+        self.sim_plan = None
+        self.sampler = None
+        self.odelt_calib = None
+        self.dtype = np.dtype(dtype)
 
         self.noisemodel = None
 
@@ -161,7 +174,7 @@ class Model:
                          '%s' % self.tseriesdict.keys())
         else:
             self.nparam -= self.tseriesdict[name].nparam
-            self.parameters = self.parameters.ix[self.parameters.name != name]
+            self.parameters = self.parameters.drop(name)
             self.tseriesdict.pop(name)
 
     def del_constant(self):
@@ -172,8 +185,7 @@ class Model:
             warn("No constant is present in this model.")
         else:
             self.nparam -= self.constant.nparam
-            self.parameters = self.parameters.ix[self.parameters.name !=
-                                                 'constant']
+            self.parameters = self.parameters.drop(self.constant.name)
             self.constant = None
 
     def del_noisemodel(self):
@@ -184,10 +196,67 @@ class Model:
             warn("No noisemodel is present in this model.")
         else:
             self.nparam -= self.noisemodel.nparam
-            self.parameters = self.parameters.ix[self.parameters.name !=
-                                                 self.noisemodel.name]
+            self.parameters = self.parameters.drop(self.noisemodel.name)
             self.noisemodel = None
 
+    def append_data(self, oseries=None, stresses=None, solve=True,
+                    **kwargs):
+        """Extends the observations and the stresses with new data.
+
+        Parameters
+        ----------
+        oseries: pandas.Series, optional
+            New observations. Only observations after the last observation
+            of the model are used.
+        stresses: dict, optional
+            Dictionary with the names of the tseries as keys and the new
+            stress values as values (see TseriesBase.append_stress).
+        solve: bool, optional
+            Solve the model after the data is appended (Default=True). The
+            optimal parameters of the previous solve are used as initial
+            values.
+        kwargs:
+            Keyword arguments that are passed to the solve method.
+
+        Notes
+        -----
+        The tseries keep the contribution of their last simulation. A
+        simulation with the same parameters after the data is appended
+        only convolves the new part of the stresses.
+
+        Examples
+        --------
+        >>> ml.append_data(oseries=new_heads, stresses={'rain': new_rain})
+
+        """
+        if oseries is not None:
+            oseries = oseries.loc[oseries.index > self.oseries.index[-1]]
+            oseries = oseries.dropna()
+            self.oseries = pd.concat([self.oseries, oseries])
+            self.odelt = self.oseries.index.to_series().diff() / \
+                         np.timedelta64(1, 'D')
+
+        if stresses is not None:
+            for name, stress in stresses.items():
+                self.tseriesdict[name].append_stress(stress)
+
+        # the calibration data is made from the old data
+        self.oseries_calib = None
+        self.tseriesdict_calib = None
+        self.sim_plan = None
+        self.sampler = None
+        self.odelt_calib = None
+
+        # keep the tmin of the model and extend tmax
+        self.tmin, self.tmax = self.get_tmin_tmax(self.tmin)
+
+        if solve:
+            if np.isnan(self.parameters.optimal).any():
+                kwargs.setdefault('initial', True)
+            else:
+                kwargs.setdefault('initial', False)
+            self.solve(tmin=self.tmin, **kwargs)
+
     def simulate(self, parameters=None, tmin=None, tmax=None, freq=None):
         """Simulate the time series model.
 
@@ -214,35 +283,47 @@ class Model:
         parameters and no calibration.
 
         """
-        # Default option when tmin and tmax and freq are not provided.
-        if freq is None:
-            freq = self.freq
-        tmin, tmax = self.get_tmin_tmax(tmin, tmax, freq, use_oseries=False)
-
-        tmin = pd.to_datetime(tmin) - pd.DateOffset(days=self.warmup)
-        sim_index = pd.date_range(tmin, tmax, freq=freq)
-        dt = get_dt(freq)
+        plan = self.get_sim_plan(tmin, tmax, freq)
 
         # Get parameters if none are provided
         if parameters is None:
             parameters = self.get_parameters()
 
-        if self.tseriesdict_calib is None:
-            tseriesdict_calib = self.get_tseriesdict_calib()
-        else:
-            tseriesdict_calib = self.tseriesdict_calib
+        h = plan.simulate(parameters)
 
-        h = pd.Series(data=0, index=sim_index)
-        istart = 0  # Track parameters index to pass to ts object
-        for ts in tseriesdict_calib.values():
-            c = ts.simulate(parameters[istart: istart + ts.nparam], sim_index,
-                            dt)
-            h = h.add(c, fill_value=0.0)
-            istart += ts.nparam
-        if self.constant:
-            h += self.constant.simulate(parameters[istart])
+        return pd.Series(h, index=plan.sim_index, copy=True)
+
+    def simulate_ensemble(self, P, tmin=None, tmax=None, freq=None):
+        """Simulate the time series model for many parameter sets at once.
+
+        Parameters
+        ----------
+        P: numpy.ndarray
+            Array of shape (number of parameter sets, nparam) with a
+            parameter set in each row.
+        tmin: str, optional
+        tmax: str, optional
+        freq: str, optional
+            frequency at which the time series are simulated.
+
+        Returns
+        -------
+        H: numpy.ndarray
+            Array of shape (number of parameter sets, number of time steps).
+            Row i equals ml.simulate(P[i], tmin, tmax, freq).values.
 
-        return h
+        Examples
+        --------
+        Prediction intervals from parameter sets drawn from a distribution:
+
+        >>> H = ml.simulate_ensemble(P)
+        >>> index = ml.get_sim_plan().sim_index
+        >>> bounds = pd.DataFrame(np.percentile(H, [2.5, 97.5], axis=0).T,
+        >>>                       index=index)
+
+        """
+        plan = self.get_sim_plan(tmin, tmax, freq)
+        return plan.simulate_ensemble(P)
 
     def residuals(self, parameters=None, tmin=None, tmax=None, freq=None):
         """Calculate the residual series.
@@ -265,34 +346,29 @@ class Model:
         if freq is None:
             freq = self.freq
 
-        tmin, tmax = self.get_tmin_tmax(tmin, tmax, freq, use_oseries=True)
-
-        # simulate model
-        simulation = self.simulate(parameters, tmin, tmax, freq)
+        # Get parameters if none are provided
+        if parameters is None:
+            parameters = self.get_parameters()
 
-        if self.oseries_calib is None:
-            oseries_calib = self.get_oseries_calib(tmin, tmax,
-                                                   simulation.index)
-        else:
+        if self.sampler is not None and self.sampler.key == (tmin, tmax, freq):
+            # Use the calibration data compiled in the initialize method
+            plan = self.sim_plan
+            sampler = self.sampler
             oseries_calib = self.oseries_calib
-
-        obs_index = oseries_calib.index  # times used for calibration
-
-        # Get h_simulated at the correct indices
-        interpolate_simulation = self.interpolate_simulation
-        if interpolate_simulation is None:
-            interpolate_simulation = obs_index.difference(
-                simulation.index).size != 0
-        if interpolate_simulation:
-            # interpolate simulation to measurement-times
-            h_simulated = np.interp(oseries_calib.index.asi8,
-                                    simulation.index.asi8, simulation)
         else:
-            # all of the observation indexes are in the simulation
-            h_simulated = simulation[obs_index]
-        res = oseries_calib - h_simulated
+            tmin, tmax = self.get_tmin_tmax(tmin, tmax, freq,
+                                            use_oseries=True)
+            plan = self.get_sim_plan(tmin, tmax, freq)
+            oseries_calib = self.get_oseries_calib(tmin, tmax,
+                                                   plan.sim_index)
+            sampler = SamplingOperator(plan.sim_index, oseries_calib.index)
 
-        if np.isnan(sum(res ** 2)):
+        # simulate model and get h_simulated at the observation times
+        simulation = plan.simulate(parameters)
+        h_simulated = sampler.sample(simulation)
+        res = oseries_calib.astype(plan.dtype, copy=False) - h_simulated
+
+        if np.isnan(res.values).any():
             print('nan problem in residuals')  # quick and dirty check
         return res
 
@@ -309,11 +385,137 @@ class Model:
         oseries_calib = self.sample(oseries_calib, sim_index)
         return oseries_calib
 
-    def get_tseriesdict_calib(self):
-        # tseriesdict_calib = self.tseriesdict.copy()
-        tseriesdict_calib = deepcopy(self.tseriesdict)
-        for tseries in tseriesdict_calib.values():
-            tseries.change_frequency(self.freq)
+    def get_sim_plan(self, tmin=None, tmax=None, freq=None, dtype=None):
+        """Method to get the simulation plan for tmin, tmax and freq.
+
+        The plan that is compiled in the initialize method is returned if
+        the arguments match, otherwise a new plan is compiled.
+
+        Parameters
+        ----------
+        tmin: str, optional
+        tmax: str, optional
+        freq: str, optional
+            frequency at which the time series are simulated.
+        dtype: numpy.dtype, optional
+            Precision of the simulation, the dtype of the model by default.
+
+        Returns
+        -------
+        plan: pastas.plan.SimulationPlan
+
+        """
+        if dtype is None:
+            dtype = self.dtype
+        self.set_tseries_vary()
+        key = (tmin, tmax, freq)
+        if self.sim_plan is not None and self.sim_plan.key == key and \
+                self.sim_plan.dtype == dtype:
+            return self.sim_plan
+
+        # Default option when tmin and tmax and freq are not provided.
+        if freq is None:
+            freq = self.freq
+        tmin, tmax = self.get_tmin_tmax(tmin, tmax, freq, use_oseries=False)
+
+        tmin = pd.to_datetime(tmin) - pd.DateOffset(days=self.warmup)
+        sim_index = pd.date_range(tmin, tmax, freq=freq)
+        dt = get_dt(freq)
+
+        if self.tseriesdict_calib is None or freq != self.freq:
+            tseriesdict_calib = self.get_tseriesdict_calib(freq)
+        else:
+            tseriesdict_calib = self.tseriesdict_calib
+
+        return SimulationPlan(tseriesdict_calib, self.constant, sim_index, dt,
+                              key=key, dtype=dtype)
+
+    def get_sampler(self, tmin=None, tmax=None, freq=None):
+        """Method to get the operator that samples a simulation at the
+        observation times used for calibration.
+
+        Parameters
+        ----------
+        tmin: str, optional
+        tmax: str, optional
+        freq: str, optional
+            frequency at which the time series are simulated.
+
+        Returns
+        -------
+        sampler: pastas.plan.SamplingOperator
+
+        Examples
+        --------
+        External solvers can reuse the sampler and the simulation plan to
+        calculate the residuals without pandas overhead:
+
+        >>> ml.initialize()
+        >>> sampler = ml.get_sampler(ml.tmin, ml.tmax, ml.freq)
+        >>> plan = ml.get_sim_plan(ml.tmin, ml.tmax, ml.freq)
+        >>> obs = ml.oseries[sampler.obs_index].values
+        >>> res = obs - sampler.sample(plan.simulate(p))
+
+        """
+        if freq is None:
+            freq = self.freq
+        key = (tmin, tmax, freq)
+        if self.sampler is not None and self.sampler.key == key:
+            return self.sampler
+
+        tmin, tmax = self.get_tmin_tmax(tmin, tmax, freq, use_oseries=True)
+        plan = self.get_sim_plan(tmin, tmax, freq)
+        oseries_calib = self.get_oseries_calib(tmin, tmax, plan.sim_index)
+        return SamplingOperator(plan.sim_index, oseries_calib.index, key=key)
+
+    def set_tseries_vary(self):
+        """Passes the vary flags of the model parameters to the tseries.
+
+        Notes
+        -----
+        The tseries only use the recursive filter of a response function
+        when its parameters in rfunc.iir_fixed are fixed (see
+        TseriesBase.get_iir), so a parameter that is fixed with e.g.
+        ml.parameters.fix_parameter has to reach the tseries. This method
+        is called before the model simulates (see get_sim_plan) and by
+        initialize. When the flags changed, the kept contributions are
+        simulated again.
+
+        """
+        changed = False
+        vary = self.parameters.vary.values
+        for name, tseries in self.tseriesdict.items():
+            ip = self.parameters.slices.get(name)
+            if ip is not None and ip.stop - ip.start == tseries.nparam:
+                changed = tseries.set_vary(vary[ip]) or changed
+        if changed and self.sim_plan is not None:
+            self.sim_plan.clear_memo()
+
+    def get_tseriesdict_calib(self, freq=None):
+        """Method to get the tseries at the frequency of the model.
+
+        Parameters
+        ----------
+        freq: str, optional
+            frequency at which the time series are simulated. The
+            frequency of the model is used if not provided.
+
+        Returns
+        -------
+        tseriesdict_calib: collections.OrderedDict
+            Dictionary with the tseries at the frequency freq.
+
+        Notes
+        -----
+        The resampled stresses are cached by each tseries object (see
+        TseriesBase.at_freq), so calling this method is cheap.
+
+        """
+        if freq is None:
+            freq = self.freq
+        tseriesdict_calib = OrderedDict()
+        for name, tseries in self.tseriesdict.items():
+            tseriesdict_calib[name] = tseries.at_freq(freq)
         return tseriesdict_calib
 
     def innovations(self, parameters=None, tmin=None, tmax=None, freq=None):
@@ -343,21 +545,88 @@ class Model:
             warn("Innovations can not be calculated as there is no noisemodel")
             return None
 
-        tmin, tmax = self.get_tmin_tmax(tmin, tmax, freq, use_oseries=True)
+        if freq is None:
+            freq = self.freq
+
+        if self.sampler is not None and self.sampler.key == (tmin, tmax, freq):
+            delt = self.odelt_calib
+        else:
+            tmin, tmax = self.get_tmin_tmax(tmin, tmax, freq,
+                                            use_oseries=True)
+            delt = None
 
         # Get parameters if none are provided
         if parameters is None:
             parameters = self.get_parameters()
+        parameters = np.asarray(parameters, dtype=float)
 
         # Calculate the residuals
         res = self.residuals(parameters, tmin, tmax, freq)
+        if delt is None:
+            delt = self.odelt[res.index].values
+        delt = delt.astype(res.dtype, copy=False)
 
         # Calculate the innovations
-        v = self.noisemodel.simulate(res, self.odelt[res.index],
+        v = self.noisemodel.simulate(res, delt,
                                      parameters[-self.noisemodel.nparam:],
                                      res.index)
         return v
 
+    def jacobian(self, parameters=None, tmin=None, tmax=None, freq=None,
+                 noise=False):
+        """Method to calculate the derivatives of the residuals or the
+        innovations with respect to the parameters.
+
+        Parameters
+        ----------
+        parameters: list, optional
+            Array of the parameters used in the time series model.
+        tmin: str, optional
+        tmax: str, optional
+        freq: str, optional
+            frequency at which the time series are simulated.
+        noise: bool, optional
+            Calculate the derivatives of the innovations (True) or of the
+            residuals (False).
+
+        Returns
+        -------
+        jac: numpy.ndarray
+            Array of shape (number of observations, number of parameters),
+            as used by scipy.optimize.least_squares.
+
+        """
+        if freq is None:
+            freq = self.freq
+
+        # Get parameters if none are provided
+        if parameters is None:
+            parameters = self.get_parameters()
+        parameters = np.asarray(parameters, dtype=float)
+
+        if self.sampler is not None and self.sampler.key == (tmin, tmax, freq):
+            plan = self.sim_plan
+            sampler = self.sampler
+            delt = self.odelt_calib
+        else:
+            tmin, tmax = self.get_tmin_tmax(tmin, tmax, freq,
+                                            use_oseries=True)
+            plan = self.get_sim_plan(tmin, tmax, freq, np.float64)
+            oseries_calib = self.get_oseries_calib(tmin, tmax,
+                                                   plan.sim_index)
+            sampler = SamplingOperator(plan.sim_index, oseries_calib.index)
+            delt = self.odelt[oseries_calib.index].values
+
+        # the residuals are the observations minus the simulation
+        jac = -sampler.sample(plan.jacobian(parameters))
+
+        if noise and self.noisemodel is not None:
+            res = self.residuals(parameters, tmin, tmax, freq)
+            jac = self.noisemodel.jacobian(
+                res, delt, parameters[-self.noisemodel.nparam:], jac)
+
+        return jac.T
+
     def observations(self, tmin=None, tmax=None):
         """Method that returns the observations series.
 
@@ -381,31 +650,99 @@ class Model:
         """
         # Store optimized values in case they are needed
         if not initial:
-            optimal = self.parameters.optimal
+            optimal = self.parameters['optimal']
 
         # make sure calibration data is renewed
+        self.set_calib_data()
+
+        # Set initial parameters
+        self.parameters = self.get_init_parameters(noise=noise)
+        self.nparam = len(self.parameters)
+        self.set_tseries_vary()
+
+        # Set initial parameters to optimal parameters
+        if not initial:
+            optimal = optimal.reindex(self.parameters.index).values
+            self.parameters.initial = np.where(np.isnan(optimal),
+                                               self.parameters.initial,
+                                               optimal)
+
+    def set_calib_data(self):
+        """Compile the calibration data of the model for tmin, tmax and
+        freq: the observations, the tseries, the simulation plan and the
+        sampler. This method is called by initialize, and by the workers of
+        a solver that hold a copy of the model (see
+        BaseSolver.start_pool).
+
+        """
         sim_index = pd.date_range(self.tmin, self.tmax, freq=self.freq)
         self.oseries_calib = self.get_oseries_calib(self.tmin, self.tmax,
                                                     sim_index)
 
-        self.tseries_calib = self.get_tseriesdict_calib()
-
-        self.interpolate_simulation = self.oseries_calib.index.difference(
-            sim_index).size != 0
-        if self.interpolate_simulation:
+        self.tseriesdict_calib = self.get_tseriesdict_calib()
+        # count the recharge series that are reused during this solve and
+        # the iterations of the root zone solver
+        for tseries in self.tseriesdict_calib.values():
+            if isinstance(tseries, Recharge):
+                tseries.hits = 0
+                tseries.misses = 0
+                if hasattr(tseries.recharge, 'reset_stats'):
+                    tseries.recharge.reset_stats()
+        # the solvers need double precision, also for a float32 model
+        self.sim_plan = self.get_sim_plan(self.tmin, self.tmax, self.freq,
+                                          dtype=np.float64)
+        self.sampler = SamplingOperator(self.sim_plan.sim_index,
+                                        self.oseries_calib.index,
+                                        key=(self.tmin, self.tmax, self.freq))
+        self.odelt_calib = self.odelt[self.oseries_calib.index].values
+
+        if self.sampler.interpolate:
             print(
                 'There are observations between the simulation-timesteps. Linear interpolation is used')
 
-        # Set initial parameters
-        self.parameters = self.get_init_parameters(noise=noise)
-        self.nparam = len(self.parameters)
+    def del_calib_data(self):
+        """Removes the calibration data that was compiled by
+        set_calib_data.
 
-        # Set initial parameters to optimal parameters
-        if not initial:
-            self.parameters.initial = optimal
+        """
+        self.oseries_calib = None
+        self.tseriesdict_calib = None
+        self.sim_plan = None
+        self.sampler = None
+        self.odelt_calib = None
+
+    def get_calib_model(self):
+        """Returns a copy of the model with only the data that is needed to
+        solve it with the calibration data compiled by initialize.
+
+        Returns
+        -------
+        ml: pastas.Model
+            Copy of the model with the observations that are used for
+            calibration and the tseries at the frequency of the model. The
+            compiled calibration data is kept when the copy is pickled, so
+            that a worker process solves it without compiling it again.
+
+        Notes
+        -----
+        The statistics of the copy are calculated for the calibration
+        period. The parameters of the model are not changed when the copy
+        is solved.
+
+        """
+        ml = copy(self)
+        ml.oseries = self.oseries_calib
+        ml.odelt = self.odelt[self.oseries_calib.index]
+        ml.tseriesdict = OrderedDict(self.tseriesdict_calib)
+        ml.parameters = self.parameters.copy()
+        ml.pickle_calib = True
+        ml.stats = Statistics(ml)
+        ml.plots = Plotting(ml)
+        ml.plot = ml.plots.plot
+        return ml
 
     def solve(self, tmin=None, tmax=None, solver=LmfitSolve, report=True,
-              noise=True, initial=True, weights=None, **kwargs):
+              noise=True, initial=True, weights=None, cache=None, **kwargs):
         """Methods to solve the time series model.
 
         Parameters
@@ -422,6 +759,13 @@ class Model:
             Use the noise model (True) or not (False).
         initial: bool, optional
             Reset initial parameters.
+        weights: str or list, optional
+            Weights that are applied to the residuals or innovations (see
+            pastas.solver.BaseSolver.minimize).
+        cache: pastas.cache.SolveCache or str, optional
+            Cache (or the directory of a cache) with stored solutions. When
+            the inputs of the model did not change since a solution was
+            stored, that solution is restored without running the solver.
 
         """
         if noise and (self.noisemodel is None):
@@ -436,22 +780,57 @@ class Model:
         # Check series with tmin, tmax
         self.tmin, self.tmax = self.get_tmin_tmax(tmin, tmax)
 
+        if cache is not None:
+            if not isinstance(cache, SolveCache):
+                cache = SolveCache(cache)
+            key = cache.get_key(self, self.tmin, self.tmax, solver, noise,
+                                initial, weights, kwargs)
+            result = cache.load(key)
+            if result is not None:
+                self.parameters = result['parameters']
+                self.nparam = len(self.parameters)
+                self.fit = result['fit']
+                self.report = result['report']
+                if report: print(self.report)
+                return
+
         # Initialize parameters
         self.initialize(initial=initial, noise=noise)
 
         # Solve model
+        self.solve_calib(solver, noise, weights, **kwargs)
+        if cache is not None:
+            cache.save(key, self)
+        if report: print(self.report)
+
+    def solve_calib(self, solver=LmfitSolve, noise=True, weights=None,
+                    **kwargs):
+        """Solves the model with the calibration data and the parameters
+        that were set by the initialize method. This method is called by
+        solve, and by the workers of a ModelCollection.
+
+        Parameters
+        ----------
+        solver: pastas.solver, optional
+            Class used to solve the model. Default is lmfit (LmfitSolve)
+        noise: bool, optional
+            Use the noise model (True) or not (False).
+        weights: str or list, optional
+            Weights that are applied to the residuals or innovations (see
+            pastas.solver.BaseSolver.minimize).
+        kwargs:
+            Keyword arguments that are passed to the solver.
+
+        """
         fit = solver(self, tmin=self.tmin, tmax=self.tmax, noise=noise,
                      freq=self.freq, weights=weights, **kwargs)
 
         # make calibration data empty again (was set in initialize)
-        self.oseries_calib = None
-        self.tseries_calib = None
-        self.interpolate_simulation = None
+        self.del_calib_data()
 
         self.fit = fit.fit
-        self.parameters.optimal = fit.optimal_params
+        self.parameters.optimal = np.asarray(fit.optimal_params, dtype=float)
         self.report = fit.report
-        if report: print(self.report)
 
     def get_tmin_tmax(self, tmin=None, tmax=None, freq=None, use_oseries=True):
         """Method that checks and returns valid values for tmin and tmax.
@@ -618,20 +997,17 @@ class Model:
 
         Returns
         -------
-        parameters: pandas.DataFrame
-            pandas.Dataframe with the parameters.
+        parameters: pastas.parameters.ParameterSet
+            ParameterSet with the parameters.
 
         """
-        parameters = pd.DataFrame(columns=['initial', 'pmin', 'pmax',
-                                           'vary', 'optimal', 'name'])
-        for ts in self.tseriesdict.values():
-            parameters = parameters.append(ts.parameters)
+        parameters = [ts.parameters for ts in self.tseriesdict.values()]
         if self.constant:
-            parameters = parameters.append(self.constant.parameters)
+            parameters.append(self.constant.parameters)
         if self.noisemodel and noise:
-            parameters = parameters.append(self.noisemodel.parameters)
+            parameters.append(self.noisemodel.parameters)
 
-        return parameters
+        return ParameterSet(parameters)
 
     def get_parameters(self, name=None):
         """Helper method to obtain the parameters needed for calculation if
@@ -650,17 +1026,16 @@ class Model:
 
         """
         if name:
-            p = self.parameters[self.parameters.name == name]
+            ip = self.parameters.slices[name]
         else:
-            p = self.parameters
+            ip = slice(None)
 
-        if p.optimal.hasnans:
+        parameters = self.parameters.optimal.values[ip]
+        if np.isnan(parameters).any():
             warn("Model is not optimized yet, initial parameters are used.")
-            parameters = p.initial
-        else:
-            parameters = p.optimal
+            parameters = self.parameters.initial.values[ip]
 
-        return parameters.values
+        return parameters.copy()
 
     def get_contribution(self, name, tindex=None):
         if name not in self.tseriesdict.keys():
@@ -670,13 +1045,9 @@ class Model:
         else:
             p = self.get_parameters(name)
             dt = get_dt(self.freq)
-            if self.freq == self.tseriesdict[name]:
-                return self.tseriesdict[name].simulate(p, tindex=tindex, dt=dt)
-            else:
-                # first change the frequency to that of the model
-                ts_temp = deepcopy(self.tseriesdict[name])
-                ts_temp.change_frequency(self.freq)
-                return ts_temp.simulate(p, tindex=tindex, dt=dt)
+            # use the tseries at the frequency of the model
+            tseries = self.tseriesdict[name].at_freq(self.freq)
+            return tseries.simulate(p, tindex=tindex, dt=dt)
 
     def get_block_response(self, name):
         if name not in self.tseriesdict.keys():
@@ -705,8 +1076,7 @@ class Model:
     def get_stress(self, name):
         # TODO: Rewrite function. possibly add a @property to these get_methods.
         try:
-            p = self.parameters.loc[
-                self.parameters.name == name, 'optimal'].values
+            p = self.parameters.optimal.values[self.parameters.slices[name]]
             return self.tseriesdict[name].get_stress(p)
         except KeyError:
             print("Name not in tseriesdict, available names are: %s"
@@ -733,12 +1103,8 @@ class Model:
         of series.
 
         """
-        f = interpolate.interp1d(series.index.asi8,
-                                 np.arange(0, series.index.size),
-                                 kind='nearest', bounds_error=False,
-                                 fill_value='extrapolate')
-        ind = np.unique(f(tindex.asi8).astype(int))
-        return series[ind]
+        ind = get_sample(series.index, tindex)
+        return series.iloc[ind]
 
     def get_metadata(self, meta=None):
         """Method that returns a metadata dict with the basic information.
@@ -769,6 +1135,26 @@ class Model:
 
         return metadata
 
+    def __getstate__(self):
+        # The stats and plots modules and the calibration data are not
+        # pickled, they are recreated or renewed when needed. The copy of
+        # get_calib_model keeps its calibration data.
+        state = self.__dict__.copy()
+        for key in ['stats', 'plots', 'plot']:
+            state.pop(key, None)
+        if not state.get('pickle_calib', False):
+            for key in ['oseries_calib', 'tseriesdict_calib', 'sim_plan',
+                        'sampler', 'odelt_calib']:
+                state[key] = None
+        return state
+
+    def __setstate__(self, state):
+        state.setdefault('dtype', np.dtype(np.float64))
+        self.__dict__.update(state)
+        self.stats = Statistics(self)
+        self.plots = Plotting(self)
+        self.plot = self.plots.plot
+
     def export_model(self, fname=None):
         """This method exports the model as an pickle (.pkl) file.
 
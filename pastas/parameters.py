@@ -0,0 +1,260 @@
+"""This module contains the ParameterSet class that holds the parameters of a
+time series model.
+
+"""
+
+from __future__ import print_function, division
+
+from collections import OrderedDict
+from copy import copy
+
+import numpy as np
+import pandas as pd
+
+
+def column_property(column):
+    """Returns a property for a column of the ParameterSet. The property
+    returns a pandas Series that shares the memory of the array of the
+    column, and sets the array from a Series (by name) or an array.
+
+    """
+
+    def fget(self):
+        return pd.Series(self.values[column], index=self.index, name=column,
+                         copy=False)
+
+    def fset(self, value):
+        self.set_column(column, value)
+
+    return property(fget, fset, doc='Series with the %s values.' % column)
+
+
+class ParameterSet(object):
+    """Array-backed set of the parameters of a time series model.
+
+    Parameters
+    ----------
+    parameters: list of pandas.DataFrame, optional
+        The parameter DataFrames of the model components (e.g.
+        tseries.parameters), with the columns 'initial', 'pmin', 'pmax',
+        'vary' and 'name'.
+
+    Attributes
+    ----------
+    index: pandas.Index
+        Names of the parameters.
+    values: collections.OrderedDict
+        Contiguous array of each column: float arrays for 'initial', 'pmin',
+        'pmax' and 'optimal' (nan until the model is solved), a boolean
+        array for 'vary' and an object array for 'name', the component each
+        parameter belongs to.
+    initial, pmin, pmax, vary, optimal, name: pandas.Series
+        The columns as Series indexed by the parameter names, which share
+        the memory of the arrays in values.
+    slices: collections.OrderedDict
+        Slice of the parameters of each component.
+
+    Notes
+    -----
+    The ParameterSet behaves like the parameter DataFrame of earlier
+    versions: the columns are Series, and values are read and set with loc
+    or the set_initial, set_min, set_max and fix_parameter methods:
+
+    >>> ml.parameters.loc['rain_A', 'initial'] = 500.0
+    >>> ml.parameters.optimal['rain_A']
+
+    The solvers and the simulation use the arrays directly (e.g.
+    ml.parameters.initial.values). The DataFrame is obtained with the
+    to_frame method.
+
+    """
+    columns = ['initial', 'pmin', 'pmax', 'vary', 'optimal', 'name']
+    dtypes = dict(initial=float, pmin=float, pmax=float, vary=bool,
+                  optimal=float, name=object)
+
+    def __init__(self, parameters=None):
+        if parameters is None:
+            parameters = []
+
+        index = []
+        name = []
+        for p in parameters:
+            index.extend(p.index)
+            name.extend(p['name'].values)
+        self.index = pd.Index(index)
+
+        nparam = len(index)
+        self.values = OrderedDict()
+        for column in ['initial', 'pmin', 'pmax']:
+            self.values[column] = np.empty(nparam)
+        self.values['vary'] = np.empty(nparam, dtype=bool)
+        self.values['optimal'] = np.full(nparam, np.nan)
+        self.values['name'] = np.array(name, dtype=object)
+
+        istart = 0
+        for p in parameters:
+            ip = slice(istart, istart + len(p.index))
+            for column in ['initial', 'pmin', 'pmax']:
+                self.values[column][ip] = np.asarray(p[column], dtype=float)
+            self.values['vary'][ip] = np.asarray(p['vary'], dtype=float) != 0
+            istart = ip.stop
+
+        self.slices = self.get_slices()
+
+    initial = column_property('initial')
+    pmin = column_property('pmin')
+    pmax = column_property('pmax')
+    vary = column_property('vary')
+    optimal = column_property('optimal')
+    name = column_property('name')
+
+    @property
+    def loc(self):
+        """Label based access to the values, like DataFrame.loc. Values
+        are set in the arrays, the parameters can not be added or removed.
+
+        """
+        return ParameterLoc(self)
+
+    def set_column(self, column, value):
+        """Sets the values of a column.
+
+        Parameters
+        ----------
+        column: str
+            Name of the column.
+        value: pandas.Series or array_like
+            The new values. A Series is aligned on the parameter names.
+
+        """
+        if column not in self.columns:
+            raise KeyError(column)
+        if isinstance(value, pd.Series):
+            value = value.reindex(self.index).values
+        value = np.asarray(value, dtype=self.dtypes[column])
+        if value.shape != (len(self),):
+            raise ValueError('The %s values have shape %s, expected (%i,).'
+                             % (column, value.shape, len(self)))
+        self.values[column] = value.copy()
+
+    def set_value(self, name, column, value):
+        """Sets the value of a column for the parameter name.
+
+        """
+        if name not in self.index:
+            raise KeyError(name)
+        self.values[column][self.index.get_loc(name)] = value
+
+    def set_initial(self, name, value):
+        """Method to set the initial parameter value.
+
+        """
+        self.set_value(name, 'initial', value)
+
+    def set_min(self, name, value):
+        """Method to set the minimum value of a parameter.
+
+        """
+        self.set_value(name, 'pmin', value)
+
+    def set_max(self, name, value):
+        """Method to set the maximum value of a parameter.
+
+        """
+        self.set_value(name, 'pmax', value)
+
+    def fix_parameter(self, name):
+        """Method to fix the parameter value.
+
+        """
+        self.set_value(name, 'vary', False)
+
+    def copy(self):
+        """Returns a copy of the ParameterSet with copies of the arrays.
+
+        """
+        parameters = copy(self)
+        parameters.values = OrderedDict([(column, values.copy()) for
+                                         column, values in self.values.items()])
+        return parameters
+
+    def get_slices(self):
+        """Method to get the slice of the parameters of each component.
+
+        Returns
+        -------
+        slices: collections.OrderedDict
+            Dictionary with the component names as keys.
+
+        """
+        name = self.values['name']
+        slices = OrderedDict()
+        istart = 0
+        for i in range(1, name.size + 1):
+            if i == name.size or name[i] != name[istart]:
+                slices[name[istart]] = slice(istart, i)
+                istart = i
+        return slices
+
+    def drop(self, name):
+        """Returns a new ParameterSet without the parameters of a component.
+
+        Parameters
+        ----------
+        name: str
+            Name of the component.
+
+        """
+        keep = self.values['name'] != name
+        parameters = copy(self)
+        parameters.index = self.index[keep]
+        parameters.values = OrderedDict(
+            [(column, values[keep]) for column, values in self.values.items()])
+        parameters.slices = parameters.get_slices()
+        return parameters
+
+    def to_frame(self):
+        """Returns the parameters as a pandas DataFrame.
+
+        """
+        return pd.DataFrame(self.values, index=self.index,
+                            columns=self.columns)
+
+    def __getitem__(self, key):
+        if key not in self.columns:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        self.set_column(key, value)
+
+    def __len__(self):
+        return self.index.size
+
+    def __repr__(self):
+        return self.to_frame().__repr__()
+
+    def _repr_html_(self):
+        return self.to_frame()._repr_html_()
+
+
+class ParameterLoc(object):
+    """Indexer of ParameterSet.loc.
+
+    """
+
+    def __init__(self, parameters):
+        self.parameters = parameters
+
+    def __getitem__(self, key):
+        return self.parameters.to_frame().loc[key]
+
+    def __setitem__(self, key, value):
+        parameters = self.parameters
+        frame = parameters.to_frame()
+        frame.loc[key] = value
+        if not frame.index.equals(parameters.index):
+            raise KeyError('Parameters can not be added with loc: %s'
+                           % list(frame.index.difference(parameters.index)))
+        for column in parameters.columns:
+            parameters.set_column(column, frame[column].values)
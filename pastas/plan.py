@@ -0,0 +1,334 @@
+"""This module contains the simulation plan used by the Model class.
+
+A simulation plan is compiled once for a simulation period and frequency.
+It stores everything that does not change between two evaluations of the
+objective function, so that a simulation reduces to adding NumPy slices.
+
+"""
+
+from __future__ import print_function, division
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+
+class SimulationPlan:
+    """Compiled simulation of a time series model.
+
+    Parameters
+    ----------
+    tseriesdict: collections.OrderedDict
+        Dictionary with the tseries objects, at the frequency of sim_index.
+    constant: pastas.tseries.Constant or None
+        Constant that is added to the simulation.
+    sim_index: pandas.DatetimeIndex
+        Time indices of the simulation (including the warmup period).
+    dt: float
+        Time step of the simulation in days.
+    key: tuple, optional
+        Arguments (tmin, tmax, freq) for which this plan was compiled.
+    dtype: numpy.dtype, optional
+        Precision of the simulations, numpy.float64 (default) or
+        numpy.float32. The block responses, the recharge and the
+        convolutions of the tseries are computed in this precision. The
+        Jacobian is always computed in double precision.
+    memoize: bool, optional
+        Reuse the contribution of a tseries when its parameters did not
+        change since the previous simulation (Default=True).
+
+    Attributes
+    ----------
+    hits, misses: int
+        Number of contributions that were reused and that were simulated.
+
+    Notes
+    -----
+    For each tseries the integer offsets of its stress window inside the
+    simulation window are computed once. Tseries without a stress (e.g.
+    TseriesStep) are simulated directly on the simulation index.
+
+    The contribution of each tseries is kept with a copy of its parameters.
+    When a solver perturbs a single parameter to approximate the Jacobian,
+    only the contribution of the perturbed tseries is simulated again.
+
+    """
+
+    def __init__(self, tseriesdict, constant, sim_index, dt, key=None,
+                 dtype=np.float64, memoize=True):
+        self.sim_index = sim_index
+        self.dt = dt
+        self.key = key
+        self.dtype = np.dtype(dtype)
+        self.constant = constant
+        self.buffer = np.zeros(sim_index.size, dtype=self.dtype)
+        self.memoize = memoize
+        self.hits = 0
+        self.misses = 0
+
+        self.entries = []
+        istart = 0  # Track parameters index to pass to ts object
+        for ts in tseriesdict.values():
+            ip = slice(istart, istart + ts.nparam)
+            if ts.stress.empty:
+                src, dst = None, None
+            else:
+                src, dst = self.get_offsets(ts.stress.index, sim_index)
+            self.entries.append((ts, ip, src, dst))
+            istart += ts.nparam
+        self.iconstant = istart
+        self.clear_memo()
+
+    @staticmethod
+    def get_offsets(index, sim_index):
+        """Method to get the position of index inside sim_index.
+
+        Parameters
+        ----------
+        index: pandas.DatetimeIndex
+            Time indices of the stress.
+        sim_index: pandas.DatetimeIndex
+            Time indices of the simulation.
+
+        Returns
+        -------
+        src, dst: slice or numpy.ndarray
+            Positions in index (src) and the matching positions in
+            sim_index (dst). Slices are returned when both are contiguous.
+
+        """
+        pos = sim_index.get_indexer(index)
+        inside = np.flatnonzero(pos >= 0)
+        if inside.size == 0:
+            return slice(0, 0), slice(0, 0)
+        first, last = inside[0], inside[-1]
+        if (last - first + 1 == inside.size) and \
+                (pos[last] - pos[first] == last - first):
+            return slice(first, last + 1), slice(pos[first], pos[last] + 1)
+        else:
+            return inside, pos[inside]
+
+    def simulate(self, parameters):
+        """Simulate the time series model.
+
+        Parameters
+        ----------
+        parameters: numpy.ndarray
+            Array of the parameters used in the time series model.
+
+        Returns
+        -------
+        h: numpy.ndarray
+            Simulated series at sim_index. This is the buffer of the plan,
+            which is overwritten by the next call.
+
+        """
+        parameters = np.asarray(parameters, dtype=float)
+        h = self.buffer
+        h.fill(0.0)
+        for i, (ts, ip, src, dst) in enumerate(self.entries):
+            p = parameters[ip]
+            memo_p, contribution = self.memo[i]
+            if self.memoize and memo_p is not None and \
+                    np.array_equal(memo_p, p):
+                self.hits += 1
+            else:
+                self.misses += 1
+                if src is None:
+                    contribution = ts.simulate(p, self.sim_index,
+                                               self.dt).values
+                else:
+                    contribution = ts.simulate_array(p, self.dt,
+                                                     self.dtype)[src]
+                if self.memoize:
+                    self.memo[i] = (np.array(p, dtype=float), contribution)
+            if src is None:
+                h += contribution
+            else:
+                h[dst] += contribution
+        if self.constant:
+            h += self.constant.simulate(parameters[self.iconstant])
+        return h
+
+    def clear_memo(self):
+        """Removes the kept contributions, e.g. when the tseries simulate
+        differently for the same parameters.
+
+        """
+        self.memo = [(None, None)] * len(self.entries)
+
+    def cache_info(self):
+        """Returns the number of reused and simulated contributions.
+
+        """
+        return dict(hits=self.hits, misses=self.misses,
+                    memoize=self.memoize)
+
+    def simulate_ensemble(self, P):
+        """Simulate the time series model for many parameter sets.
+
+        Parameters
+        ----------
+        P: numpy.ndarray
+            Array of shape (number of parameter sets, number of parameters).
+
+        Returns
+        -------
+        H: numpy.ndarray
+            Array of shape (number of parameter sets, number of simulation
+            steps) with a simulation in each row.
+
+        """
+        P = np.atleast_2d(np.asarray(P, dtype=float))
+        H = np.zeros((P.shape[0], self.sim_index.size), dtype=self.dtype)
+        for ts, ip, src, dst in self.entries:
+            if src is None:
+                for h, p in zip(H, P[:, ip]):
+                    h += ts.simulate(p, self.sim_index, self.dt).values
+            else:
+                H[:, dst] += ts.simulate_ensemble_array(
+                    P[:, ip], self.dt, self.dtype)[:, src]
+        if self.constant:
+            H += P[:, self.iconstant, np.newaxis].astype(self.dtype)
+        return H
+
+    def jacobian(self, parameters):
+        """Derivatives of the simulation with respect to the parameters.
+
+        Parameters
+        ----------
+        parameters: numpy.ndarray
+            Array of the parameters used in the time series model.
+
+        Returns
+        -------
+        jac: numpy.ndarray
+            Array of shape (number of parameters, number of simulation
+            steps). Parameters that do not influence the simulation (e.g.
+            of the noisemodel) get a row of zeros.
+
+        Notes
+        -----
+        The derivatives are obtained from the jacobian_array method of each
+        tseries. Rows that are not available analytically are approximated
+        with forward differences of the contribution of that tseries only.
+
+        """
+        parameters = np.asarray(parameters, dtype=float)
+        jac = np.zeros((parameters.size, self.sim_index.size))
+        for ts, ip, src, dst in self.entries:
+            p = parameters[ip]
+            if src is None:
+                def simulate(p):
+                    return ts.simulate(p, self.sim_index, self.dt).values
+
+                jac_ts = np.full((ts.nparam, self.sim_index.size), np.nan)
+            else:
+                def simulate(p):
+                    return ts.simulate_array(p, self.dt)
+
+                jac_ts = ts.jacobian_array(p, self.dt)
+            missing = np.flatnonzero(np.isnan(jac_ts).any(axis=1))
+            if missing.size:
+                h0 = simulate(p)
+            for i in missing:
+                p1 = p.copy()
+                step = np.sqrt(np.finfo(float).eps) * max(1.0, abs(p[i]))
+                p1[i] += step
+                jac_ts[i] = (simulate(p1) - h0) / step
+            if src is None:
+                jac[ip] = jac_ts
+            else:
+                jac[ip, dst] = jac_ts[:, src]
+        if self.constant:
+            jac[self.iconstant] = 1.0
+        return jac
+
+
+class SamplingOperator:
+    """Sparse operator that samples a simulation at the observation times.
+
+    Parameters
+    ----------
+    sim_index: pandas.DatetimeIndex
+        Time indices of the simulation.
+    obs_index: pandas.DatetimeIndex
+        Time indices of the observations.
+    key: tuple, optional
+        Arguments (tmin, tmax, freq) for which this operator was compiled.
+
+    Attributes
+    ----------
+    i0, i1: numpy.ndarray
+        Positions of the simulation steps before and after each
+        observation time.
+    w0, w1: numpy.ndarray
+        Linear interpolation weights for the simulation steps i0 and i1.
+    interpolate: bool
+        False if all observation times are simulation time steps.
+
+    Notes
+    -----
+    The sampled simulation equals np.interp(obs_index.asi8,
+    sim_index.asi8, h), but is obtained with one gather-and-blend. The
+    operator can be used as a scipy.sparse matrix through the to_sparse
+    method, e.g. to sample the Jacobian of a simulation.
+
+    """
+
+    def __init__(self, sim_index, obs_index, key=None):
+        self.sim_index = sim_index
+        self.obs_index = obs_index
+        self.key = key
+
+        xp = sim_index.asi8
+        x = obs_index.asi8
+        i0 = np.searchsorted(xp, x, side='right') - 1
+        i0 = np.clip(i0, 0, max(xp.size - 2, 0))
+        i1 = np.minimum(i0 + 1, xp.size - 1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            w1 = (x - xp[i0]) / (xp[i1] - xp[i0]).astype(float)
+        w1 = np.clip(np.nan_to_num(w1), 0.0, 1.0)
+        # observations at a simulation step only need a gather
+        at_i1 = w1 == 1.0
+        i0[at_i1] = i1[at_i1]
+        w1[at_i1] = 0.0
+
+        self.i0 = i0
+        self.i1 = i1
+        self.w0 = 1.0 - w1
+        self.w1 = w1
+        self.interpolate = bool(np.any(w1 > 0.0))
+
+    def sample(self, h):
+        """Sample the simulation at the observation times.
+
+        Parameters
+        ----------
+        h: numpy.ndarray
+            Simulation at sim_index. When h is two-dimensional, each row is
+            sampled.
+
+        Returns
+        -------
+        numpy.ndarray
+            Simulation at obs_index, in the precision of h.
+
+        """
+        if self.interpolate:
+            w0 = self.w0.astype(h.dtype, copy=False)
+            w1 = self.w1.astype(h.dtype, copy=False)
+            return h[..., self.i0] * w0 + h[..., self.i1] * w1
+        else:
+            return h[..., self.i0]
+
+    def to_sparse(self):
+        """Returns the operator as a scipy.sparse matrix of shape (number of
+        observations, number of simulation steps).
+
+        """
+        n = self.obs_index.size
+        rows = np.concatenate([np.arange(n), np.arange(n)])
+        cols = np.concatenate([self.i0, self.i1])
+        data = np.concatenate([self.w0, self.w1])
+        return csr_matrix((data, (rows, cols)),
+                          shape=(n, self.sim_index.size))
@@ -3,9 +3,9 @@ This python script can be used to solve the differential equations that are used
 for the root zone module. The output of the function is the soil state (how
 saturated it is) at each timestep, and the groundwater recharge N.
 
-A .pyx-file is available of this script that can be cythonized and compiled, increasing
-computation speeds up to 35 times. The use of this compiled version is strongly
-recommended. Take a look at cythonize.py for compilation instructions.
+The same functions are available in recharge_cy.pyx, which is compiled when
+Pastas is installed and is used instead of this file when it is available
+(see recharge_func.BACKEND).
 
 Three models can be used:
 -------------------------
@@ -26,6 +26,14 @@ Raphson iteration is used as the root finder, but it is switched to a bisection
 method if this fails. The initial estimate for the the NR-iteration is provided
 by an Explicit Euler solution of the above differential equation.
 
+P and E are rates (e.g. m/day) over time steps of dt days, and the recharge is
+returned as a rate as well. A time step is split into 2, 4, ... substeps (at
+most max_substeps) when the Newton-Raphson iteration does not converge, when
+it switches to bisection or when the soil state changes by more than half of
+Srmax. P and E are constant during the substeps. With daily data the substeps
+are only needed in stiff periods, and coarser (or finer) time steps can be
+used without changing the model.
+
 To Do:
 ------
 - Built in more external / internal checks for water balance
@@ -44,394 +52,371 @@ from __future__ import print_function, division
 import numpy as np
 
 
-def pref(t, P, E, Srmax=0.1, Beta=2.0, Imax=0.001, dt=1.0, solver=1):
-    """
-    In this section the preferential flow model is defined.
-    dS/ Dt = Pe[t] * (1 - (Sr[t] / Srmax)**Beta)- Epu * min(1, Sr/0.5Srmax)
-    """
+def _flux(s, pe, epu, p):
+    # Change of the soil state, p = (Srmax, Kp, Beta, Gamma, percolation,
+    # preferential)
+    Srmax, Kp, Beta, Gamma, percolation, preferential = p
+    q = -epu * min(1.0, s / (0.5 * Srmax))
+    if preferential:
+        q += pe * (1 - (s / Srmax) ** Beta)
+    else:
+        q += pe
+    if percolation:
+        q -= Kp * (s / Srmax) ** Gamma
+    return q
 
-    n = int(len(t) / dt)
-    error = 1.0e-5
 
-    # Create an empty array to store the soil state in
-    S = np.zeros(n)
-    S[0] = 0.5 * Srmax  # Set the initial system state
-    Si = np.zeros(n)
-    Si[0] = 0.0
-    Pe = np.zeros(n)
-    Pe[0] = 0.0
-    Ei = np.zeros(n)
-    Ei[0] = 0.0
-    Epu = np.zeros(n)
-    Epu[0] = 0.0
-    Ea = np.zeros(n)
-    Ea[0] = 0.0
-
-    for t in range(n - 1):
-        Si[t + 1] = Si[t] + P[t + 1]  # Fill intercEpution bucket with new rain
-        Pe[t + 1] = np.max(
-            [0.0, Si[t + 1] - Imax])  # Calculate effective precipitation
-        Si[t + 1] = Si[t + 1] - Pe[t + 1]
-        Ei[t + 1] = np.min(
-            [Si[t + 1], E[t + 1]])  # Evaporation from intercEpution
-        Si[t + 1] = Si[t + 1] - Ei[t + 1]  # Update intercEpution state
-        Epu[t + 1] = E[t + 1] - Ei[
-            t + 1]  # Update potential evapotranspiration
-
-        Last_S = S[t]
+def _step(s0, pe, epu, h, p, solver, counts):
+    """One Euler step of length h from the state s0. Returns the new state,
+    whether the iterations converged and whether bisection was used.
+
+    """
+    Srmax, Kp, Beta, Gamma, percolation, preferential = p
+    error = 1.0e-5
+    converged = True
+    bisection = False
+
+    # Use explicit Euler scheme to find an initial estimate for the
+    # newton raphson-method
+    s1 = max(0.0, s0 + h * _flux(s0, pe, epu, p))
+    if solver != 1:
+        return s1, converged, bisection
+
+    # Start the while loop for the newton-Raphson iteration
+    Last_S = s0
+    iteration = 0
+    while abs(Last_S - s1) > error:
+        if iteration > 100:
+            converged = False  # The number of iterations is too high
+            break
+        iteration += 1
+        Last_S = s1
+
+        g = Last_S - s0 - h * _flux(Last_S, pe, epu, p)
+        # Derivative depends on the state of the system, with the IEEE
+        # results of the compiled kernels for a state of zero (e.g. an
+        # infinite derivative for Beta < 1)
+        g_derivative = 0.0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x = np.float64(Last_S / Srmax)
+            if preferential:
+                g_derivative -= Beta * pe * x ** (Beta - 1)
+            if percolation:
+                g_derivative -= Gamma * Kp * x ** (Gamma - 1)
+            if Last_S <= (0.5 * Srmax):
+                g_derivative -= epu * (0.5 * Srmax)
+            g_derivative = 1.0 - h * g_derivative
+            nan = np.isnan(g / g_derivative)
+
+        # Check if there is no zero-division error
+        if nan:
+            bisection = True
+            break
+        else:  # use newton raphson
+            s1 = Last_S - g / g_derivative
+    counts[0] += iteration
+
+    if bisection:
+        counts[1] += 1
         iteration = 0
-        bisection = 1
+        # the root is between s0 and the last Newton iterate
+        a = min(s0, s1)
+        b = max(s0, s1)
+        c = (a + b) / 2.0
 
-        # Use explicit Euler scheme to find an initial estimate for the newton raphson-method
+        while ((b - a) / 2.0) > error:
+            if iteration > 100:
+                converged = False
+                break
+            iteration += 1  # increase the number of iterations by 1
 
-        S[t + 1] = np.max([0.0, S[t] + dt * (
-            Pe[t] * (1 - (S[t] / Srmax) ** Beta) - Epu[t] * np.min([1.0, (
-                S[t] / (0.5 * Srmax))]))])
+            gc = c - s0 - h * _flux(c, pe, epu, p)
+            if gc == 0.0:
+                break  # c is the root
+            elif (a - s0 - h * _flux(a, pe, epu, p)) * gc > 0.0:
+                a = c  # the root is between c and b
+            else:
+                b = c
 
-        if solver == 1:  # If implicit euler is used
-            # Start the while loop for the newton-Raphson iteration
-            while abs(Last_S - S[t + 1]) > error:
-                if iteration > 100:
-                    break  # Check if the number of iterations is not too high
-                iteration += 1
-                Last_S = S[t + 1]
-
-                g = Last_S - S[t] - dt * (
-                    Pe[t] * (1 - (Last_S / Srmax) ** Beta) -
-                    Epu[t] * np.min([1.0, (Last_S / (0.5 *
-                                                     Srmax))]))
-                # Derivative dEpuends on the state of the system
-                if Last_S > (0.5 * Srmax):
-                    g_derivative = 1.0 - dt * (
-                        -Beta * Pe[t] * (Last_S / Srmax) **
-                        (Beta - 1))
-                else:
-                    g_derivative = 1.0 - dt * (-Beta * Pe[t] * (Last_S / Srmax)
-                                               ** (Beta - 1) - Epu[t] * (
-                                                   0.5 * Srmax))
-
-                # Check if there is no zero-division error
-                if np.isnan(g / g_derivative):
-                    bisection = 0
-                    break
-                # if there is no zero-division error                
-                else:  # use newton raphson
-                    S[t + 1] = Last_S - g / g_derivative
-
-            if bisection == 0:
-                iteration = 0
-                a = S[t]
-                b = S[t + 1]
-                c = a + b / 2.0
-
-                while ((b - a) / 2.0) > error:
-                    if iteration > 100:
-                        print('iteration in bisection method exceeded 100',
-                              iteration)
-                        break
-                    iteration += 1  # increase the number of iterations by 1
-
-                    if (c - S[t] - dt * (
-                                    Pe[t] * (1 - (c / Srmax) ** Beta) - Epu[
-                                t] *
-                                np.min([1.0, (c / (0.5 * Srmax))]))) == 0.0:
-                        return c  # Return the current value if it is correct
-                    elif (a - S[t] - dt * (
-                                    Pe[t] * (1 - (a / Srmax) ** Beta) - Epu[t]
-                                * np.min([1.0, (a / (0.5 * Srmax))]))) * (
-                                    c - S[t] - dt * (
-                                            Pe[t] * (1 - (c / Srmax) ** Beta) -
-                                            Epu[
-                                                t] *
-                                            np.min([1.0, (
-                                                        c / (
-                                                        0.5 * Srmax))]))) > 0.0:
-                        b = c
-                    else:
-                        a = c
-
-                    c = a + b / 2.0
-
-                S[t + 1] = c
-
-            assert ~np.isnan(S[t + 1]), 'NaN value calculated for soil state'
-
-        S[t + 1] = np.min([Srmax,
-                           np.max(
-                               [0.0, S[t + 1]])])  # Make sure the solution is
-        # larger
-        #  then 0.0 and smaller than Srmax
-        Ea[t + 1] = Epu[t + 1] * np.min([1.0, (S[t + 1] / (0.5 * Srmax))])
-
-    R = np.append(0.0, Pe[1:] * dt * 0.5 * (
-        (S[:-1] ** Beta + S[1:] ** Beta) / (Srmax ** Beta)))
+            c = (a + b) / 2.0
 
-    return R, S, Ea, Ei
+        s1 = c
+        counts[0] += iteration
 
+    assert not np.isnan(s1), 'NaN-value calculated for soil state'
+    return s1, converged, bisection
 
-""" -----------------------------------------------
-In this section the percolation model is defined. 
-dS/dt = Pe[t] - Kp * (Sr/Srmax)**Gamma - Epu * min(1, Sr/0.5Srmax) 
------------------------------------------------ """
 
+def _substeps(s0, pe, epu, dt, p, solver, k, max_substeps, counts):
+    """Integrates a time step of dt days from the state s0 with k substeps,
+    doubling k while a substep fails. Returns the new state and the means of
+    (S / Srmax) ** Gamma and (S / Srmax) ** Beta over the time step.
 
-def perc(t, P, E, Srmax=0.1, Kp=0.03, Gamma=2.0, Imax=0.001, dt=1.0, solver=1):
-    n = int(len(t) / dt)
-    error = 1.0e-5
+    """
+    Srmax, Kp, Beta, Gamma, percolation, preferential = p
+    while True:
+        h = dt / k
+        s = s0
+        xg = xb = 0.0
+        for _ in range(k):
+            s1, converged, bisection = _step(s, pe, epu, h, p, solver, counts)
+            if k < max_substeps and (not converged or bisection or
+                                     abs(s1 - s) > 0.5 * Srmax):
+                break
+            counts[2] += not converged
+            # Make sure the solution is larger then 0.0 and smaller than Srmax
+            s1 = min(Srmax, max(0.0, s1))
+            xg += 0.5 * ((s / Srmax) ** Gamma + (s1 / Srmax) ** Gamma)
+            xb += 0.5 * ((s / Srmax) ** Beta + (s1 / Srmax) ** Beta)
+            s = s1
+        else:
+            counts[3] += k > 1
+            return s, xg / k, xb / k
+        k *= 2
+
+
+def _integrate(P, E, Srmax, Imax, Kp, Beta, Gamma, percolation, preferential,
+               dt, solver, max_substeps, counts):
+    # Integrates the root zone of one parameter set along time
+    n = len(P)
+    p = (Srmax, Kp, Beta, Gamma, percolation, preferential)
 
     # Create an empty array to store the soil state in
     S = np.zeros(n)
-    S[0] = 0.5 * Srmax  # Set the initial system state
     Si = np.zeros(n)
-    Si[0] = 0.0
     Pe = np.zeros(n)
-    Pe[0] = 0.0
     Ei = np.zeros(n)
-    Ei[0] = 0.0
     Epu = np.zeros(n)
-    Epu[0] = 0.0
     Ea = np.zeros(n)
-    Ea[0] = 0.0
-
-    for t in range(n - 1):
-        Si[t + 1] = Si[t] + P[t + 1]  # Fill intercEpution bucket with new rain
-        Pe[t + 1] = np.max([0.0, Si[t + 1] - Imax])  # Calculate effective
-        # precipitation
-        Si[t + 1] = Si[t + 1] - Pe[t + 1]
-        Ei[t + 1] = np.min(
-            [Si[t + 1], E[t + 1]])  # Evaporation from intercEpution
-        Si[t + 1] = Si[t + 1] - Ei[t + 1]  # Update intercEpution state
-        Epu[t + 1] = E[t + 1] - Ei[
-            t + 1]  # Update potential evapotranspiration
-
-        Last_S = S[t]
-        iteration = 0
-        bisection = 1
-        # Use explicit Euler scheme to find an initial estimate for the newton raphson-method
-
-        S[t + 1] = np.max(
-            [0.0, S[t] + dt * (Pe[t] - Kp * (S[t] / Srmax) ** Gamma -
-                               Epu[t] * np.min([1.0, (S[t] / (0.5 *
-                                                              Srmax))]))])
-
-        if solver == 1:
-            # Start the while loop for the newton-Raphson iteration
-            while abs(Last_S - S[t + 1]) > error:
-                if iteration > 100:
-                    break  # Check if the number of iterations is not too high
-                iteration += 1
-                Last_S = S[t + 1]
-
-                g = Last_S - S[t] - dt * (
-                    Pe[t] - Kp * (Last_S / Srmax) ** Gamma -
-                    Epu[t] * np.min([1, (Last_S / (0.5 *
-                                                   Srmax))]))
-                # Derivative dEpuends on the state of the system
-                if Last_S > (0.5 * Srmax):
-                    g_derivative = 1.0 - dt * (
-                        -Gamma * Kp * (Last_S / Srmax) ** (Gamma - 1))
-                else:
-                    g_derivative = 1.0 - dt * (
-                        -Gamma * Kp * (Last_S / Srmax) ** (Gamma - 1) - Epu[
-                            t] * (
-                            0.5 * Srmax))
-
-                # Check if there is no zero-division error            
-                if np.isnan(g / g_derivative):
-                    bisection = 0
-                    break
-                # if there is no zero-division error
-                else:  # use newton raphson
-                    S[t + 1] = Last_S - g / g_derivative
-
-            if bisection == 0:
-                iteration = 0
-                a = S[t]
-                b = S[t + 1]
-                c = a + b / 2.0
-
-                while ((b - a) / 2.0) > error:
-                    if iteration > 100:
-                        print('iteration in bisection method exceeded 100',
-                              iteration)
-                        break
-                    iteration += 1  # increase the number of iterations by 1
-
-                    if (c - S[t] - dt * (
-                                    Pe[t] - Kp * (c / Srmax) ** Gamma - Epu[t]
-                                * np.min([1, (c / (0.5 * Srmax))]))) == 0.0:
-                        return c  # Return the current value if it is correct
-                    elif (a - S[t] - dt * (
-                                    Pe[t] - Kp * (a / Srmax) ** Gamma - Epu[
-                                t] * np.min([1.0, (a / (0.5 * Srmax))]))) * (
-                                    c - S[t] - dt
-                                * (Pe[t] - Kp * (c / Srmax) ** Gamma - Epu[
-                                    t] * np.min(
-                                    [
-                                        1.0, (c / (0.5 * Srmax))]))) > 0.0:
-                        b = c
-                    else:
-                        a = c
-
-                    c = a + b / 2.0
-
-                S[t + 1] = c
-
-            assert ~np.isnan(S[t + 1]), 'NaN-value calculated for soil state'
-
-        S[t + 1] = np.min([Srmax,
-                           np.max(
-                               [0.0, S[t + 1]])])  # Make sure the solution is
-        # larger
-        #  then 0.0 and smaller than Srmax
-        Ea[t + 1] = Epu[t + 1] * np.min([1, (S[t + 1] / (0.5 * Srmax))])
-
-    R = np.append(0.0, Kp * dt * 0.5 * (
-        (S[:-1] ** Gamma + S[1:] ** Gamma) / (Srmax ** Gamma)))
+    Xg = np.zeros(n)
+    Xb = np.zeros(n)
+    S[0] = 0.5 * Srmax  # Set the initial system state
 
-    return R, S, Ea, Ei
+    for i in range(n - 1):
+        # Fill interception bucket with new rain
+        Si[i + 1] = Si[i] + P[i + 1] * dt
+        Pe[i + 1] = max(0.0, Si[i + 1] - Imax)  # Effective precipitation
+        Si[i + 1] = Si[i + 1] - Pe[i + 1]
+        # Evaporation from interception
+        Ei[i + 1] = min(Si[i + 1], E[i + 1] * dt)
+        Si[i + 1] = Si[i + 1] - Ei[i + 1]  # Update interception state
+        Pe[i + 1] = Pe[i + 1] / dt
+        Ei[i + 1] = Ei[i + 1] / dt
+        Epu[i + 1] = E[i + 1] - Ei[i + 1]  # Update potential evaporation
 
+        S[i + 1], Xg[i + 1], Xb[i + 1] = _substeps(
+            S[i], Pe[i], Epu[i], dt, p, solver, 1, max_substeps, counts)
+        Ea[i + 1] = Epu[i + 1] * min(1.0, S[i + 1] / (0.5 * Srmax))
 
-"""-----------------------------------------------
-In this section a combination of the percolation and the preferential flow model
-is applied:
+    return S, Pe, Ea, Ei, Xg, Xb
 
-dS/ Dt = Pe[t] * (1 - (Sr[t] / Srmax)**Beta) - Kp * (Sr/Srmax)**Gamma -
-Epu * min(1, Sr/0.5*Srmax)
 
------------------------------------------------ """
+def _add_stats(stats, counts):
+    if stats is not None:
+        # Newton and bisection iterations, bisections, non-converged steps
+        # and time steps that were split into substeps
+        for k in range(4):
+            stats[k] += counts[k]
+
+
+def pref(t, P, E, Srmax=0.1, Beta=2.0, Imax=0.001, dt=1.0, solver=1,
+         max_substeps=64, stats=None):
+    """
+    In this section the preferential flow model is defined.
+    dS/ Dt = Pe[t] * (1 - (Sr[t] / Srmax)**Beta)- Epu * min(1, Sr/0.5Srmax)
+    """
+    counts = [0, 0, 0, 0]
+    S, Pe, Ea, Ei, Xg, Xb = _integrate(
+        P[:len(t)], E, Srmax, Imax, 0.0, Beta, 0.0, False, True, dt, solver,
+        max_substeps, counts)
+    R = Pe * Xb
+    _add_stats(stats, counts)
+    return R, S, Ea, Ei
+
+
+def perc(t, P, E, Srmax=0.1, Kp=0.03, Gamma=2.0, Imax=0.001, dt=1.0,
+         solver=1, max_substeps=64, stats=None):
+    """
+    In this section the percolation model is defined.
+    dS/dt = Pe[t] - Kp * (Sr/Srmax)**Gamma - Epu * min(1, Sr/0.5Srmax)
+    """
+    counts = [0, 0, 0, 0]
+    S, Pe, Ea, Ei, Xg, Xb = _integrate(
+        P[:len(t)], E, Srmax, Imax, Kp, 0.0, Gamma, True, False, dt, solver,
+        max_substeps, counts)
+    R = Kp * Xg
+    _add_stats(stats, counts)
+    return R, S, Ea, Ei
 
 
 def comb(t, P, E, Srmax=0.1, Kp=0.03, Beta=2.0, Gamma=2.0, Imax=0.001,
-         dt=1.0, solver=1):
-    n = int(len(t) / dt)
+         dt=1.0, solver=1, max_substeps=64, stats=None):
+    """
+    In this section a combination of the percolation and the preferential flow
+    model is applied:
+
+    dS/ Dt = Pe[t] * (1 - (Sr[t] / Srmax)**Beta) - Kp * (Sr/Srmax)**Gamma - Epu *
+    min(1, Sr/0.5*Srmax)
+    """
+    counts = [0, 0, 0, 0]
+    S, Pe, Ea, Ei, Xg, Xb = _integrate(
+        P[:len(t)], E, Srmax, Imax, Kp, Beta, Gamma, True, True, dt, solver,
+        max_substeps, counts)
+    Rs = Kp * Xg  # Percolation
+    Rf = Pe * Xb  # Preferential
+    _add_stats(stats, counts)
+    return Rs, Rf, S, Ea, Ei
+
+
+def ensemble(P, E, Srmax, Imax, Kp=None, Beta=None, Gamma=None, dt=1.0,
+             solver=1, max_substeps=64, stats=None):
+    """
+    In this section the root zone is solved for many parameter sets (or
+    many sites) at once. The members of the ensemble are advanced in
+    lock-step along time, the Newton-Raphson updates are applied to all
+    members that have not converged yet. The members that need substeps in
+    a time step are integrated one by one for that time step.
+
+    The terms of the models are selected by the parameters that are given:
+    Beta for preferential flow, Kp and Gamma for percolation, or all three
+    for the combination model. The results equal those of pref, perc and
+    comb for each member. The time loop runs in Python, so this pays off
+    for ensembles of more than about 20 members (e.g. the population of
+    DESolve). The compiled ensemble in recharge_cy.pyx integrates the
+    members one after another in a single call.
+
+    Parameters
+    ----------
+    P, E: numpy.ndarray
+        Precipitation and evaporation, of shape (n,) for one site or of
+        shape (m, n) for a site per member.
+    Srmax, Imax, Kp, Beta, Gamma: float or numpy.ndarray
+        Parameters of the model, a float or an array of shape (m,).
+    stats: numpy.ndarray, optional
+        Array of four integers to which the number of iterations, the
+        number of bisections, the number of steps that did not converge
+        and the number of time steps with substeps, summed over all
+        members, are added.
+
+    Returns
+    -------
+    R, S, Ea, Ei: numpy.ndarray
+        Arrays of shape (m, n). R is the total recharge (the percolation
+        plus the preferential flow).
+
+    """
+    P = np.atleast_2d(np.asarray(P, dtype=float))
+    E = np.atleast_2d(np.asarray(E, dtype=float))
+    params = [Srmax, Imax] + [p for p in (Kp, Beta, Gamma) if p is not None]
+    m = max([P.shape[0], E.shape[0]] + [np.size(p) for p in params])
+    percolation = Kp is not None
+    preferential = Beta is not None
+    Srmax, Imax, Kp, Beta, Gamma = [
+        np.broadcast_to(np.asarray(0.0 if p is None else p, dtype=float),
+                        (m,)) for p in (Srmax, Imax, Kp, Beta, Gamma)]
+
+    n = P.shape[1]
     error = 1.0e-5
+    counts = [0, 0, 0, 0]
+    # the time steps are rows, so that each step updates a contiguous row
+    P = np.broadcast_to(P, (m, P.shape[1])).T
+    E = np.broadcast_to(E, (m, E.shape[1])).T
 
     # Create an empty array to store the soil state in
-    S = np.zeros(n)
+    S = np.zeros((n, m))
+    Si = np.zeros((n, m))
+    Pe = np.zeros((n, m))
+    Ei = np.zeros((n, m))
+    Epu = np.zeros((n, m))
+    Ea = np.zeros((n, m))
+    Xg = np.zeros((n, m))
+    Xb = np.zeros((n, m))
     S[0] = 0.5 * Srmax  # Set the initial system state
-    Si = np.zeros(n)
-    Si[0] = 0.0
-    Pe = np.zeros(n)
-    Pe[0] = 0.0
-    Ei = np.zeros(n)
-    Ei[0] = 0.0
-    Epu = np.zeros(n)
-    Epu[0] = 0.0
-    Ea = np.zeros(n)
-    Ea[0] = 0.0
-
-    for t in range(n - 1):
-        Si[t + 1] = Si[t] + P[t + 1]  # Fill intercEpution bucket with new rain
-        Pe[t + 1] = np.max([0.0, Si[t + 1] - Imax])  # Calculate effective
-        # precipitation
-        Si[t + 1] = Si[t + 1] - Pe[t + 1]
-        Ei[t + 1] = np.min(
-            [Si[t + 1], E[t + 1]])  # Evaporation from interception
-        Si[t + 1] = Si[t + 1] - Ei[t + 1]  # Update interception state
-        Epu[t + 1] = E[t + 1] - Ei[
-            t + 1]  # Update potential evapotranspiration
-
-        Last_S = S[t]
-        iteration = 0
-        bisection = 1
-
-        # Use explicit Euler scheme to find an initial estimate for the newton raphson-method
-
-        S[t + 1] = np.max([0.0, S[t] + dt * (
-            Pe[t] * (1 - (S[t] / Srmax) ** Beta) - Kp * (
-                S[t] / Srmax) ** Gamma -
-            Epu[
-                t] * np.min([1.0, (S[t] / (0.5 * Srmax))]))])
 
+    def flux(s, j, pe, epu):
+        # Change of the soil state of the members j
+        x = s / Srmax[j]
+        q = -epu * np.minimum(1.0, s / (0.5 * Srmax[j]))
+        if preferential:
+            q += pe * (1 - x ** Beta[j])
+        else:
+            q += pe
+        if percolation:
+            q -= Kp[j] * x ** Gamma[j]
+        return q
+
+    for i in range(n - 1):
+        Si[i + 1] = Si[i] + P[i + 1] * dt  # Fill interception bucket
+        Pe[i + 1] = np.maximum(0.0, Si[i + 1] - Imax)
+        Si[i + 1] = Si[i + 1] - Pe[i + 1]
+        Ei[i + 1] = np.minimum(Si[i + 1], E[i + 1] * dt)
+        Si[i + 1] = Si[i + 1] - Ei[i + 1]  # Update interception state
+        Pe[i + 1] = Pe[i + 1] / dt
+        Ei[i + 1] = Ei[i + 1] / dt
+        Epu[i + 1] = E[i + 1] - Ei[i + 1]  # Update potential evaporation
+
+        Last_S = S[i].copy()
+        S1 = S[i + 1]
+
+        # Use explicit Euler scheme to find an initial estimate for the
+        # newton raphson-method
+        j = slice(None)
+        S1[:] = np.maximum(0.0, S[i] + dt * flux(S[i], j, Pe[i], Epu[i]))
+
+        # Members that need substeps or bisection in this time step
+        failed = np.zeros(m, dtype=bool)
         if solver == 1:  # If implicit euler is used
-            # Start the while loop for the newton-Raphson iteration
-            while abs(Last_S - S[t + 1]) > error:
-                if iteration > 100:
-                    break  # Check if the number of iterations is not too high
+            # Newton-Raphson iteration of the members that did not converge
+            j = np.flatnonzero(np.abs(Last_S - S1) > error)
+            iteration = 0
+            while j.size and iteration <= 100:
                 iteration += 1
-                Last_S = S[t + 1]
-
-                g = Last_S - S[t] - dt * (
-                    Pe[t] * (1 - (Last_S / Srmax) ** Beta) - Kp * (
-                        Last_S / Srmax) ** Gamma - Epu[t] * np.min([1.0, (
-                        Last_S / (0.5 * Srmax))]))
+                counts[0] += j.size
+                s = S1[j]
+                Last_S[j] = s
+                pe, epu = Pe[i, j], Epu[i, j]
+                x = s / Srmax[j]
+                d = np.zeros(j.size)
+                if preferential:
+                    d -= Beta[j] * pe * x ** (Beta[j] - 1)
+                if percolation:
+                    d -= Gamma[j] * Kp[j] * x ** (Gamma[j] - 1)
                 # Derivative depends on the state of the system
-                if Last_S > (0.5 * Srmax):
-                    g_derivative = 1.0 - dt * (
-                        -Beta * Pe[t] * (Last_S / Srmax) ** (
-                            Beta - 1) - Gamma * Kp * (
-                            Last_S / Srmax) ** (Gamma - 1))
-                else:
-                    g_derivative = 1.0 - dt * (
-                        -Beta * Pe[t] * (Last_S / Srmax) ** (
-                            Beta - 1) - Gamma * Kp * (
-                            Last_S / Srmax) ** (Gamma - 1) - Epu[t] * (
-                            0.5 * Srmax))
-
-                # Check if there is no zero-division error            
-                if np.isnan(g / g_derivative):
-                    bisection = 0
-                    break
-                # if there is no zero-division error
-                else:  # use newton raphson
-                    S[t + 1] = Last_S - g / g_derivative
-                    #
-            if bisection == 0:
-                iteration = 0
-                a = S[t]
-                b = S[t + 1]
-                c = a + b / 2.0
-                #
-                while ((b - a) / 2.0) > error:
-                    if iteration > 100:
-                        print('iteration in bisection method exceeded 100',
-                              iteration)
-                        break
-                    iteration += 1  # increase the number of iterations by 1
-
-                    if (c - S[t] - dt * (
-                                        Pe[t] * (
-                                        1 - (c / Srmax) ** Beta) - Kp * (
-                                            c / Srmax) ** Gamma - Epu[
-                                t] * np.min([1, (
-                                        c / (0.5 * Srmax))]))) == 0.0:
-                        return c  # Return the current value if it is correct
-                    elif (a - S[t] - dt * (
-                                        Pe[t] * (
-                                                1 - (
-                                                a / Srmax) ** Beta) - Kp * (
-                                            a / Srmax) ** Gamma - Epu[
-                                t] * np.min([
-                                1.0, (
-                                            a / (0.5 * Srmax))]))) * (
-                                    c - S[t] - dt * (
-                                                Pe[t] * (
-                                                        1 - (
-                                                                c / Srmax) ** Beta) - Kp * (
-                                                    c / Srmax) ** Gamma - Epu[
-                                        t] * np.min([
-                                        1.0, (
-                                                    c / (
-                                                            0.5 * Srmax))]))) > 0.0:
-                        b = c
-                    else:
-                        a = c
-
-                    c = a + b / 2.0
-
-                S[t + 1] = c
-
-            assert ~np.isnan(S[t + 1]), 'NaN-value calculated for soil state'
-
-        S[t + 1] = np.min([Srmax, np.max([0.0, S[
-            t + 1]])])  # Make sure the solution is larger then 0.0 and smaller
-        # than Srmax
-        Ea[t + 1] = Epu[t + 1] * np.min([1, (S[t + 1] / (0.5 * Srmax))])
-
-    Rs = np.append(0.0, Kp * dt * 0.5 * (
-        (S[:-1] ** Gamma + S[1:] ** Gamma) / (Srmax ** Gamma)))  # Percolation
-    Rf = np.append(0.0, Pe[1:] * dt * 0.5 * (
-        (S[:-1] ** Beta + S[1:] ** Beta) / (Srmax ** Beta)))  # Preferential
-
-    return Rs, Rf, S, Ea, Ei
+                d -= np.where(s > (0.5 * Srmax[j]), 0.0,
+                              epu * (0.5 * Srmax[j]))
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    g = s - S[i, j] - dt * flux(s, j, pe, epu)
+                    step = g / (1.0 - dt * d)
+
+                # Members with a zero-division error switch to bisection
+                nan = np.isnan(step)
+                failed[j[nan]] = True
+                j, s, step = j[~nan], s[~nan], step[~nan]
+                S1[j] = s - step
+                j = j[np.abs(s - S1[j]) > error]
+            failed[j] = True
+        failed |= np.abs(S1 - S[i]) > 0.5 * Srmax
+
+        # Make sure the solution is larger then 0.0 and smaller than Srmax
+        S1[:] = np.minimum(Srmax, np.maximum(0.0, S1))
+        Xg[i + 1] = 0.5 * ((S[i] / Srmax) ** Gamma + (S1 / Srmax) ** Gamma)
+        Xb[i + 1] = 0.5 * ((S[i] / Srmax) ** Beta + (S1 / Srmax) ** Beta)
+
+        # the substeps (or the bisection) of a member are not vectorized
+        for j in np.flatnonzero(failed):
+            p = (Srmax[j], Kp[j], Beta[j], Gamma[j], percolation,
+                 preferential)
+            S1[j], Xg[i + 1, j], Xb[i + 1, j] = _substeps(
+                S[i, j], Pe[i, j], Epu[i, j], dt, p, solver,
+                min(2, max_substeps), max_substeps, counts)
+
+        Ea[i + 1] = Epu[i + 1] * np.minimum(1.0, S1 / (0.5 * Srmax))
+
+    R = np.zeros((n, m))
+    if percolation:
+        R += Kp * Xg
+    if preferential:
+        R += Pe * Xb
+
+    _add_stats(stats, counts)
+    return R.T.copy(), S.T.copy(), Ea.T.copy(), Ei.T.copy()
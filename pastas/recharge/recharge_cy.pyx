@@ -0,0 +1,359 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True
+"""
+This cython script can be used to solve the differential equations that are used
+for the root zone module. The output of the function is the soil state (how
+saturated it is) at each timestep, and the groundwater recharge N.
+
+This .pyx-file is compiled when pastas is installed and Cython is available,
+increasing computation speeds up to 35 times compared to recharge.py. The
+functions are the same as in recharge.py, which is used when the compiled
+module is not available (see recharge_func.BACKEND). To compile the module
+in a source tree:
+
+>>> python setup.py build_ext --inplace
+
+The kernels are declared noexcept and nogil, which needs Cython 3. The
+recharge_cy.c file that is shipped with the source is generated with Cython
+3 and compiles for Python 3.8 and newer. When the module is not compiled,
+recharge.py is used.
+
+Three models can be used:
+-------------------------
+- Percolation Flow:
+dS/dt = Pe[t] - Kp * (Sr/Srmax)**Gamma - Epu * min(1, Sr/0.5Srmax)
+
+- Preferential Flow:
+dS/ Dt = Pe[t] * (1 - (Sr[t] / Srmax)**Beta)- Epu * min(1, Sr/0.5Srmax)
+
+- Combination:
+dS/ Dt = Pe[t] * (1 - (Sr[t] / Srmax)**Beta) - Kp * (Sr/Srmax)**Gamma - Epu
+         * min(1, Sr/0.5*Srmax)
+
+Numerical info:
+---------------
+The soil module can be solved with an implicit or explicit euler scheme. Newton
+Raphson iteration is used as the root finder, but it is switched to a bisection
+method if this fails. The initial estimate for the the NR-iteration is provided
+by an Explicit Euler solution of the above differential equation. A time step
+is split into substeps when this fails, see recharge.py.
+
+References:
+-----------
+- R.A. Collenteur [2016] Non-linear time series analysis of deep groundwater
+levels: Application to the Veluwe. MSc. thesis, TU Delft.
+http://repository.tudelft.nl/view/ir/uuid:baf4fc8c-6311-407c-b01f-c80a96ecd584/
+
+@author: Raoul Collenteur
+"""
+
+import numpy as np
+
+from libc.math cimport pow, fabs, isnan
+
+
+# Define some C-function for more efficient computation
+cdef inline double c_max(double a, double b) noexcept nogil:
+    return a if a >= b else b
+cdef inline double c_min(double a, double b) noexcept nogil:
+    return a if a <= b else b
+
+
+cdef struct Params:
+    double Srmax, Kp, Beta, Gamma
+    bint percolation, preferential
+
+
+cdef inline double flux(double s, double pe, double epu,
+                        Params *p) noexcept nogil:
+    # Change of the soil state
+    cdef double q = -epu * c_min(1.0, s / (0.5 * p.Srmax))
+    if p.preferential:
+        q += pe * (1 - pow(s / p.Srmax, p.Beta))
+    else:
+        q += pe
+    if p.percolation:
+        q -= p.Kp * pow(s / p.Srmax, p.Gamma)
+    return q
+
+
+cdef double step(double s0, double pe, double epu, double h, Params *p,
+                 int solver, Py_ssize_t *counts, bint *converged,
+                 bint *bisection) except? -1.0 nogil:
+    # One Euler step of length h from the state s0, see recharge._step
+    cdef int iteration = 0
+    cdef double error = 1.0e-5, Last_S, g, g_derivative, a, b, c, gc, s1
+    converged[0] = True
+    bisection[0] = False
+
+    # Use explicit Euler scheme to find an initial estimate for the
+    # newton raphson-method
+    s1 = c_max(0.0, s0 + h * flux(s0, pe, epu, p))
+    if solver != 1:
+        return s1
+
+    # Start the while loop for the newton-Raphson iteration
+    Last_S = s0
+    while fabs(Last_S - s1) > error:
+        if iteration > 100:
+            converged[0] = False  # The number of iterations is too high
+            break
+        iteration += 1
+        Last_S = s1
+
+        g = Last_S - s0 - h * flux(Last_S, pe, epu, p)
+        # Derivative depends on the state of the system
+        g_derivative = 0.0
+        if p.preferential:
+            g_derivative -= p.Beta * pe * pow(Last_S / p.Srmax, p.Beta - 1)
+        if p.percolation:
+            g_derivative -= p.Gamma * p.Kp * pow(Last_S / p.Srmax,
+                                                 p.Gamma - 1)
+        if Last_S <= (0.5 * p.Srmax):
+            g_derivative -= epu * (0.5 * p.Srmax)
+        g_derivative = 1.0 - h * g_derivative
+
+        # Check if there is no zero-division error
+        if isnan(g / g_derivative):
+            bisection[0] = True
+            break
+        else:  # use newton raphson
+            s1 = Last_S - g / g_derivative
+    counts[0] += iteration
+
+    if bisection[0]:
+        counts[1] += 1
+        iteration = 0
+        # the root is between s0 and the last Newton iterate
+        a = c_min(s0, s1)
+        b = c_max(s0, s1)
+        c = (a + b) / 2.0
+
+        while ((b - a) / 2.0) > error:
+            if iteration > 100:
+                converged[0] = False
+                break
+            iteration += 1  # increase the number of iterations by 1
+
+            gc = c - s0 - h * flux(c, pe, epu, p)
+            if gc == 0.0:
+                break  # c is the root
+            elif (a - s0 - h * flux(a, pe, epu, p)) * gc > 0.0:
+                a = c  # the root is between c and b
+            else:
+                b = c
+
+            c = (a + b) / 2.0
+
+        s1 = c
+        counts[0] += iteration
+
+    assert not isnan(s1), 'NaN-value calculated for soil state'
+    return s1
+
+
+cdef double substeps(double s0, double pe, double epu, double dt, Params *p,
+                     int solver, int k, int max_substeps, Py_ssize_t *counts,
+                     double *xg, double *xb) except? -1.0 nogil:
+    # Integrates a time step with k or more substeps, see recharge._substeps
+    cdef int l
+    cdef double h, s, s1
+    cdef bint converged, bisection, accepted
+    while True:
+        h = dt / k
+        s = s0
+        xg[0] = 0.0
+        xb[0] = 0.0
+        accepted = True
+        for l in range(k):
+            s1 = step(s, pe, epu, h, p, solver, counts, &converged,
+                      &bisection)
+            if k < max_substeps and (not converged or bisection or
+                                     fabs(s1 - s) > 0.5 * p.Srmax):
+                accepted = False
+                break
+            if not converged:
+                counts[2] += 1
+            # Make sure the solution is larger then 0.0 and smaller than Srmax
+            s1 = c_min(p.Srmax, c_max(0.0, s1))
+            xg[0] += 0.5 * (pow(s / p.Srmax, p.Gamma) +
+                            pow(s1 / p.Srmax, p.Gamma))
+            xb[0] += 0.5 * (pow(s / p.Srmax, p.Beta) +
+                            pow(s1 / p.Srmax, p.Beta))
+            s = s1
+        if accepted:
+            if k > 1:
+                counts[3] += 1
+            xg[0] /= k
+            xb[0] /= k
+            return s
+        k *= 2
+
+
+cdef int integrate(const double[:] P, const double[:] E, double Imax,
+                   Params *p, double dt, int solver, int max_substeps,
+                   double[:] S, double[:] Pe, double[:] Ea, double[:] Ei,
+                   double[:] Xg, double[:] Xb,
+                   Py_ssize_t *counts) except -1 nogil:
+    # Integrates the root zone of one parameter set along time, the arrays
+    # S to Xb are filled
+    cdef int i, n = S.shape[0]
+    cdef double Si = 0.0, Epu = 0.0, Epu1
+    S[0] = 0.5 * p.Srmax  # Set the initial system state
+
+    for i in range(n - 1):
+        Si = Si + P[i + 1] * dt  # Fill interception bucket with new rain
+        Pe[i + 1] = c_max(0.0, Si - Imax)  # Effective precipitation
+        Si = Si - Pe[i + 1]
+        Ei[i + 1] = c_min(Si, E[i + 1] * dt)  # Evaporation from interception
+        Si = Si - Ei[i + 1]  # Update interception state
+        Pe[i + 1] = Pe[i + 1] / dt
+        Ei[i + 1] = Ei[i + 1] / dt
+        Epu1 = E[i + 1] - Ei[i + 1]  # Update potential evaporation
+
+        S[i + 1] = substeps(S[i], Pe[i], Epu, dt, p, solver, 1, max_substeps,
+                            counts, &Xg[i + 1], &Xb[i + 1])
+        Ea[i + 1] = Epu1 * c_min(1.0, S[i + 1] / (0.5 * p.Srmax))
+        Epu = Epu1
+    return 0
+
+
+cdef add_stats(Py_ssize_t[:] stats, Py_ssize_t *counts):
+    # Newton and bisection iterations, bisections, non-converged steps and
+    # time steps that were split into substeps
+    cdef int k
+    if stats is not None:
+        for k in range(4):
+            stats[k] += counts[k]
+
+
+def root_zone(P, E, double Srmax, double Imax, double Kp, double Beta,
+              double Gamma, bint percolation, bint preferential, double dt,
+              int solver, int max_substeps, Py_ssize_t[:] stats):
+    cdef Params p = Params(Srmax, Kp, Beta, Gamma, percolation, preferential)
+    cdef Py_ssize_t counts[4]
+    counts[:] = [0, 0, 0, 0]
+    n = len(P)
+    # the kernel does not check the bounds of E
+    if len(E) < n:
+        raise ValueError('E has %i values, at least %i are needed.'
+                         % (len(E), n))
+    S_, Pe_, Ea_, Ei_, Xg_, Xb_ = [np.zeros(n) for _ in range(6)]
+    cdef const double[:] P_ = P, E_ = E
+    cdef double[:] S = S_, Pe = Pe_, Ea = Ea_, Ei = Ei_, Xg = Xg_, Xb = Xb_
+    # the GIL is released, so that models can be simulated in threads
+    with nogil:
+        integrate(P_, E_, Imax, &p, dt, solver, max_substeps, S, Pe, Ea, Ei,
+                  Xg, Xb, counts)
+    add_stats(stats, counts)
+    return S_, Pe_, Ea_, Ei_, Xg_, Xb_
+
+
+"""-----------------------------------------------
+In this section the preferential flow model is defined.
+dS/ Dt = Pe[t] * (1 - (Sr[t] / Srmax)**Beta)- Epu * min(1, Sr/0.5Srmax)
+----------------------------------------------- """
+
+def pref(t, const double[:] P, const double[:] E, double Srmax=0.1,
+         double Beta=2.0, double Imax=0.001, double dt=1.0, int solver=1,
+         int max_substeps=64, Py_ssize_t[:] stats=None):
+    S_, Pe_, Ea_, Ei_, Xg_, Xb_ = root_zone(
+        P[:len(t)], E, Srmax, Imax, 0.0, Beta, 0.0, False, True, dt, solver,
+        max_substeps, stats)
+    R = Pe_ * Xb_
+    return R, S_, Ea_, Ei_
+
+
+"""-----------------------------------------------
+In this section the percolation model is defined.
+dS/dt = Pe[t] - Kp * (Sr/Srmax)**Gamma - Epu * min(1, Sr/0.5Srmax)
+----------------------------------------------- """
+
+def perc(t, const double[:] P, const double[:] E, double Srmax=0.1,
+         double Kp=0.03, double Gamma=2.0, double Imax=0.001, double dt=1.0,
+         int solver=1, int max_substeps=64, Py_ssize_t[:] stats=None):
+    S_, Pe_, Ea_, Ei_, Xg_, Xb_ = root_zone(
+        P[:len(t)], E, Srmax, Imax, Kp, 0.0, Gamma, True, False, dt, solver,
+        max_substeps, stats)
+    R = Kp * Xg_
+    return R, S_, Ea_, Ei_
+
+
+"""-----------------------------------------------
+In this section a combination of the percolation and the preferential flow
+model is applied:
+
+dS/ Dt = Pe[t] * (1 - (Sr[t] / Srmax)**Beta) - Kp * (Sr/Srmax)**Gamma - Epu *
+min(1, Sr/0.5*Srmax)
+----------------------------------------------- """
+
+def comb(t, const double[:] P, const double[:] E, double Srmax=0.1,
+         double Kp=0.03, double Beta=2.0, double Gamma=2.0,
+         double Imax=0.001, double dt=1.0, int solver=1,
+         int max_substeps=64, Py_ssize_t[:] stats=None):
+    S_, Pe_, Ea_, Ei_, Xg_, Xb_ = root_zone(
+        P[:len(t)], E, Srmax, Imax, Kp, Beta, Gamma, True, True, dt, solver,
+        max_substeps, stats)
+    Rs = Kp * Xg_  # Percolation
+    Rf = Pe_ * Xb_  # Preferential
+    return Rs, Rf, S_, Ea_, Ei_
+
+
+""" -----------------------------------------------
+In this section the root zone is solved for many parameter sets at once.
+The terms of the model are selected by the parameters that are given.
+----------------------------------------------- """
+
+def ensemble(P, E, Srmax, Imax, Kp=None, Beta=None, Gamma=None,
+             double dt=1.0, int solver=1, int max_substeps=64,
+             Py_ssize_t[:] stats=None):
+
+    cdef int j, k, l, n, m
+    cdef Params p
+    cdef Py_ssize_t counts[4]
+    cdef bint percolation = Kp is not None, preferential = Beta is not None
+    counts[:] = [0, 0, 0, 0]
+
+    P_ = np.ascontiguousarray(np.atleast_2d(np.asarray(P, dtype=float)))
+    E_ = np.ascontiguousarray(np.atleast_2d(np.asarray(E, dtype=float)))
+    params = [Srmax, Imax] + [x for x in (Kp, Beta, Gamma) if x is not None]
+    m = max([P_.shape[0], E_.shape[0]] + [np.size(x) for x in params])
+    n = P_.shape[1]
+    # the kernel does not check the bounds of P and E
+    if E_.shape[1] < n:
+        raise ValueError('E has %i values, at least %i are needed.'
+                         % (E_.shape[1], n))
+    if P_.shape[0] not in (1, m) or E_.shape[0] not in (1, m):
+        raise ValueError('P and E need 1 or %i rows.' % m)
+
+    cdef const double[:, ::1] P2 = P_, E2 = E_
+    Srmax_a, Imax_a, Kp_a, Beta_a, Gamma_a = [
+        np.array(np.broadcast_to(np.asarray(
+            0.0 if x is None else x, dtype=float), (m,)))
+        for x in (Srmax, Imax, Kp, Beta, Gamma)]
+    cdef double[::1] Srmax_ = Srmax_a, Imax_ = Imax_a, Kp_ = Kp_a
+    cdef double[::1] Beta_ = Beta_a, Gamma_ = Gamma_a
+
+    # Create an empty array to store the soil state in
+    S_, Pe_, Ea_, Ei_, Xg_, Xb_ = [np.zeros((m, n)) for _ in range(6)]
+    cdef double[:, ::1] S = S_, Pe = Pe_, Ea = Ea_, Ei = Ei_
+    cdef double[:, ::1] Xg = Xg_, Xb = Xb_
+
+    # Each member is integrated along time with its own iterations, the
+    # rows of P and E are shared by all members when there is only one.
+    for j in range(m):
+        k = j if P_.shape[0] > 1 else 0
+        l = j if E_.shape[0] > 1 else 0
+        p = Params(Srmax_[j], Kp_[j], Beta_[j], Gamma_[j], percolation,
+                   preferential)
+        with nogil:
+            integrate(P2[k], E2[l], Imax_[j], &p, dt, solver, max_substeps,
+                      S[j], Pe[j], Ea[j], Ei[j], Xg[j], Xb[j], counts)
+
+    R = np.zeros((m, n))
+    if percolation:
+        R += Kp_a[:, np.newaxis] * Xg_
+    if preferential:
+        R += Pe_ * Xb_
+
+    add_stats(stats, counts)
+    return R, S_, Ea_, Ei_
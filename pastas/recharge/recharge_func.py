@@ -16,8 +16,27 @@ set_parameters(self, name)
     recharge function. Columns of the dataframe need to be ['value', 'pmin',
     'pmax', 'vary']. Rows of the DataFrame have names of the parameters. Input
     name is used as a prefix. This function is called by a Tseries object.
-simulate(self, evaporation, precipitation, p=None)
-    A function that returns an array of the simulated recharge series.
+simulate(self, precip, evap, p=None, dt=1.0, dtype=numpy.float64)
+    A function that returns an array of the simulated recharge series. The
+    precipitation, evaporation and recharge are rates over time steps of dt
+    days. The recharge is returned in the precision dtype.
+simulate_ensemble(self, precip, evap, P, dt=1.0, dtype=numpy.float64)
+    A function that returns an array with the simulated recharge series of
+    many parameter sets, one row for each row of P.
+
+The non-linear models count the iterations of the root zone solver in their
+stats attribute (calls, iterations, bisections, nonconverged, substeps and
+time, summed over all calls since reset_stats) and in last_stats (the last
+call). A time step of the root zone is split into at most max_substeps
+substeps where the solver needs it, so that these models can be used at any
+frequency.
+
+The non-linear models use the compiled kernels of recharge_cy.pyx, which are
+built when Pastas is installed. When these are not available the Python
+kernels of recharge.py are used. BACKEND is 'cython' or 'python'
+accordingly. The soil moisture is a running balance over the whole series,
+so the kernels always integrate it in double precision, also when the
+recharge is returned in single precision.
 
 References
 ----------
@@ -28,10 +47,19 @@ http://repository.tudelft.nl/view/ir/uuid:baf4fc8c-6311-407c-b01f-c80a96ecd584/
 
 from __future__ import print_function, division
 
+from time import time
+
 import numpy as np
 import pandas as pd
 
-from .recharge import pref, perc, comb
+try:
+    from .recharge_cy import pref, perc, comb, ensemble
+
+    BACKEND = 'cython'
+except ImportError:
+    from .recharge import pref, perc, comb, ensemble
+
+    BACKEND = 'python'
 
 
 class Linear:
@@ -52,12 +80,53 @@ class Linear:
         parameters.loc[name + '_f'] = (-1.0, -5.0, 0.0, 1, name)
         return parameters
 
-    def simulate(self, precip, evap, p=None):
+    def simulate(self, precip, evap, p=None, dt=1.0, dtype=np.float64):
         recharge = precip + p * evap
-        return recharge
+        return recharge.astype(dtype, copy=False)
+
+    def simulate_ensemble(self, precip, evap, P, dt=1.0, dtype=np.float64):
+        return (precip + P[:, :1] * evap).astype(dtype, copy=False)
+
+
+class RootZoneBase:
+    """
+    Base class of the non-linear recharge models
 
+    The root zone is solved with an implicit Euler scheme, using
+    Newton-Raphson iterations and bisection when these fail. A time step is
+    split into 2, 4, ... substeps (at most max_substeps) when the iterations
+    fail or the soil state changes by more than half of Srmax. The counters
+    of the solver are kept in the stats attribute, summed over all calls
+    since reset_stats, and in last_stats for the last call.
 
-class Preferential:
+    """
+
+    def __init__(self):
+        self.solver = 1  # 1 = implicit, 2 = explicit
+        self.max_substeps = 64
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.stats = dict(calls=0, iterations=0, bisections=0,
+                          nonconverged=0, substeps=0, time=0.0)
+        self.last_stats = None
+
+    def _solve(self, func, *args, **kwargs):
+        # Call a kernel of the root zone and add its counters to stats
+        counts = np.zeros(4, dtype=np.intp)
+        start = time()
+        result = func(*args, max_substeps=self.max_substeps, stats=counts,
+                      **kwargs)
+        last = dict(calls=1, iterations=int(counts[0]),
+                    bisections=int(counts[1]), nonconverged=int(counts[2]),
+                    substeps=int(counts[3]), time=time() - start)
+        for key, value in last.items():
+            self.stats[key] += value
+        self.last_stats = last
+        return result
+
+
+class Preferential(RootZoneBase):
     """
     Preferential flow recharge model
 
@@ -67,9 +136,8 @@ class Preferential:
     """
 
     def __init__(self):
+        RootZoneBase.__init__(self)
         self.nparam = 3
-        self.dt = 1  # Has to be 1 right now.
-        self.solver = 1  # 1 = implicit, 2 = explicit
 
     def set_parameters(self, name):
         parameters = pd.DataFrame(
@@ -79,14 +147,20 @@ class Preferential:
         parameters.loc[name + '_Imax'] = (1.5e-3, np.nan, np.nan, 0, name)
         return parameters
 
-    def simulate(self, precip, evap, p=None):
+    def simulate(self, precip, evap, p=None, dt=1.0, dtype=np.float64):
         t = np.arange(len(precip))
-        recharge = pref(t, precip, evap, p[0], p[1], p[2],
-                        self.dt, self.solver)[0]
-        return recharge
+        recharge = self._solve(pref, t, precip, evap, p[0], p[1], p[2],
+                               dt, self.solver)[0]
+        return recharge.astype(dtype, copy=False)
+
+    def simulate_ensemble(self, precip, evap, P, dt=1.0, dtype=np.float64):
+        Srmax, Beta, Imax = np.asarray(P, dtype=float).T
+        recharge = self._solve(ensemble, precip, evap, Srmax, Imax,
+                               Beta=Beta, dt=dt, solver=self.solver)[0]
+        return recharge.astype(dtype, copy=False)
 
 
-class Percolation:
+class Percolation(RootZoneBase):
     """
     Percolation flow recharge model
 
@@ -97,9 +171,8 @@ class Percolation:
     """
 
     def __init__(self):
+        RootZoneBase.__init__(self)
         self.nparam = 4
-        self.dt = 1
-        self.solver = 1
 
     def set_parameters(self, name):
         parameters = pd.DataFrame(
@@ -110,14 +183,20 @@ class Percolation:
         parameters.loc[name + '_Imax'] = (1.5e-3, 0.0, np.nan, 0, name)
         return parameters
 
-    def simulate(self, precip, evap, p=None):
+    def simulate(self, precip, evap, p=None, dt=1.0, dtype=np.float64):
         t = np.arange(len(precip))
-        recharge = perc(t, precip, evap, p[0], p[1], p[2], p[3],
-                        self.dt, self.solver)[0]
-        return recharge
+        recharge = self._solve(perc, t, precip, evap, p[0], p[1], p[2],
+                               p[3], dt, self.solver)[0]
+        return recharge.astype(dtype, copy=False)
+
+    def simulate_ensemble(self, precip, evap, P, dt=1.0, dtype=np.float64):
+        Srmax, Kp, Gamma, Imax = np.asarray(P, dtype=float).T
+        recharge = self._solve(ensemble, precip, evap, Srmax, Imax, Kp=Kp,
+                               Gamma=Gamma, dt=dt, solver=self.solver)[0]
+        return recharge.astype(dtype, copy=False)
 
 
-class Combination:
+class Combination(RootZoneBase):
     """
     Combination flow recharge model
 
@@ -129,9 +208,8 @@ class Combination:
     """
 
     def __init__(self):
+        RootZoneBase.__init__(self)
         self.nparam = 5
-        self.dt = 1
-        self.solver = 1
 
     def set_parameters(self, name):
         parameters = pd.DataFrame(
@@ -143,9 +221,16 @@ class Combination:
         parameters.loc[name + '_Imax'] = (1.5e-3, 0.0, np.nan, 0, name)
         return parameters
 
-    def simulate(self, precip, evap, p=None):
+    def simulate(self, precip, evap, p=None, dt=1.0, dtype=np.float64):
         t = np.arange(len(precip))
-        Rs, Rf = comb(t, precip, evap, p[0], p[1], p[2], p[3],
-                      p[4], self.dt, self.solver)[0:2]
+        Rs, Rf = self._solve(comb, t, precip, evap, p[0], p[1], p[2], p[3],
+                             p[4], dt, self.solver)[0:2]
         recharge = Rs + Rf  # Slow plus fast recharge
-        return recharge
+        return recharge.astype(dtype, copy=False)
+
+    def simulate_ensemble(self, precip, evap, P, dt=1.0, dtype=np.float64):
+        Srmax, Kp, Beta, Gamma, Imax = np.asarray(P, dtype=float).T
+        recharge = self._solve(ensemble, precip, evap, Srmax, Imax, Kp=Kp,
+                               Beta=Beta, Gamma=Gamma, dt=dt,
+                               solver=self.solver)[0]
+        return recharge.astype(dtype, copy=False)
@@ -9,7 +9,10 @@ from __future__ import print_function, division
 
 import numpy as np
 import pandas as pd
-from scipy.special import gammainc, gammaincinv, k0, exp1, erfc, lambertw
+from scipy.special import gammainc, gammaincinv, gammaln, k0, k1, exp1, \
+    erfc, erfcinv, lambertw
+
+from . import special
 
 _class_doc = """
 Parameters
@@ -26,6 +29,9 @@ cutoff: float
     percentage after which the step function is cut off.
 tmax: float
     time corresponding to the cutoff
+tail_tol: float
+    error budget for the cut off tail of the step function, per unit of
+    stress. When set, it replaces cutoff (see get_cutoff).
 
 """
 
@@ -39,6 +45,9 @@ class RfuncBase:
         self.meanstress = meanstress
         self.cutoff = cutoff
         self.tmax = 0
+        # parameters that have to be fixed to use the recursive filter
+        self.iir_fixed = []
+        self.tail_tol = None
 
     def set_parameters(self, name):
         pass
@@ -46,9 +55,185 @@ class RfuncBase:
     def step(self, p, dt=1):
         pass
 
-    def block(self, p, dt=1):
+    def block(self, p, dt=1, dtype=np.float64):
+        """Returns the block response, the differences of the step function
+        at the time steps.
+
+        The step function is calculated in double precision and only the
+        block response is returned in dtype: the differences of a single
+        precision step function would lose the tail of the response.
+
+        """
         pass
 
+    def calc_tmax(self, p, cutoff=None):
+        pass
+
+    def gain(self, p):
+        """Returns the final value of the step function.
+
+        """
+        return p[0]
+
+    def get_cutoff(self, p):
+        """Returns the fraction of the final value of the step function
+        after which it is cut off.
+
+        When tail_tol is set, the cut off tail of the step function is at
+        most tail_tol, so that the cutoff depends on the parameters: a
+        response that is small compared to tail_tol gets a short block
+        response. The cutoff is at least 0.5.
+
+        """
+        if self.tail_tol is None:
+            return self.cutoff
+        with np.errstate(divide='ignore'):
+            cutoff = 1.0 - self.tail_tol / np.abs(self.gain(p))
+        return np.clip(cutoff, 0.5, 1.0 - 1e-10)
+
+    def iir(self, p, dt=1):
+        """Returns the recursive filter of the block response, or None if
+        the response function has no recursive form.
+
+        When the recursive form only exists for some values of a parameter,
+        that parameter is listed in iir_fixed. The recursive filter is then
+        only used when the parameter is not calibrated, so that the
+        simulation is continuous in the calibrated parameters.
+
+        """
+        return None
+
+    def get_iir(self, p, dt, m, r):
+        """Recursive filter of a block response that is a polynomial of
+        degree m - 1 in the time step times r to the power of the time step.
+
+        Parameters
+        ----------
+        p: 1D array
+            Parameters of the response function.
+        dt: float
+            Time step in days.
+        m: int
+            Multiplicity of the pole r.
+        r: float
+            Pole of the filter.
+
+        Returns
+        -------
+        num: numpy.ndarray
+            Numerator of the transfer function, of length m.
+        r: float
+            Pole of the filter.
+        m: int
+            Multiplicity of the pole, the number of first-order sections.
+
+        Notes
+        -----
+        The block response is not truncated. The numerator follows from the
+        first m values of the block response and the denominator (1 - r
+        z^-1)^m, see pastas.convolve.recursive.
+
+        """
+        s = self.step(p, dt * np.arange(1, m + 2))
+        num = np.convolve(s[1:] - s[:-1], np.poly(np.full(m, r)))[:m]
+        return num, r, m
+
+    def block_ensemble(self, P, dt=1, dtype=np.float64):
+        """Block responses for many parameter sets at once.
+
+        Parameters
+        ----------
+        P: numpy.ndarray
+            Array of shape (number of parameter sets, nparam).
+        dt: float, optional
+            Time step in days.
+        dtype: numpy.dtype, optional
+            Precision of the block responses. The step functions are
+            calculated in double precision, see block.
+
+        Returns
+        -------
+        B: numpy.ndarray
+            Array with a block response in each row. The block responses are
+            padded with zeros to the length of the longest one, so that each
+            row equals the block method for that parameter set.
+
+        Notes
+        -----
+        The step function is evaluated once for all parameter sets, with
+        the parameters as column vectors. Response functions of which the
+        step method does not broadcast override this method.
+
+        """
+        P = np.atleast_2d(np.asarray(P, dtype=float))
+        tmax = np.maximum(self.calc_tmax(P.T), 3 * dt)
+        nt = np.ceil((tmax - dt) / dt).astype(int)  # len(np.arange)
+        t = np.arange(dt, tmax.max(), dt)
+        s = self.step(P.T[:, :, np.newaxis], t)
+        B = s[:, 1:] - s[:, :-1]
+        B[np.arange(B.shape[1]) >= nt[:, np.newaxis] - 1] = 0.0
+        return B.astype(dtype, copy=False)
+
+    def stack_blocks(self, blocks, dtype=np.float64):
+        """Stacks block responses of different lengths into an array,
+        padded with zeros.
+
+        """
+        B = np.zeros((len(blocks), max([b.size for b in blocks])), dtype)
+        for i, b in enumerate(blocks):
+            B[i, :b.size] = b
+        return B
+
+    def get_t(self, p, dt=1):
+        """Returns the times at which the step function is calculated.
+
+        """
+        if isinstance(dt, np.ndarray):
+            return dt
+        self.step(p, dt)  # sets self.tmax
+        return np.arange(dt, self.tmax, dt)
+
+    def step_jac(self, p, dt=1):
+        """Derivatives of the step function with respect to the parameters.
+
+        The derivatives are approximated with forward differences, response
+        functions with analytic derivatives override this method. The
+        derivatives of Exponential, Hantush, Theis and Bruggeman are
+        analytic. Those of Gamma are analytic except for n, which has no
+        closed form and is approximated with central differences.
+
+        Returns
+        -------
+        ds: numpy.ndarray
+            Array of shape (nparam, number of time steps). Row i contains
+            the derivative with respect to parameter i.
+
+        """
+        t = self.get_t(p, dt)
+        s = self.step(p, t)
+        return np.vstack([self.step_diff(p, t, i, s)
+                          for i in range(self.nparam)])
+
+    def step_diff(self, p, t, i, s=None):
+        """Forward difference of the step function with respect to
+        parameter i at the times t.
+
+        """
+        if s is None:
+            s = self.step(p, t)
+        p1 = np.array(p, dtype=float)
+        h = np.sqrt(np.finfo(float).eps) * max(1.0, abs(p1[i]))
+        p1[i] += h
+        return (self.step(p1, t) - s) / h
+
+    def block_jac(self, p, dt=1):
+        """Derivatives of the block response with respect to the
+        parameters, with the same shape convention as step_jac.
+
+        """
+        ds = self.step_jac(p, dt)
+        return ds[:, 1:] - ds[:, :-1]
+
 
 class Gamma(RfuncBase):
     __doc__ = """Gamma response function with 3 parameters A, a, and n.
@@ -62,6 +247,7 @@ class Gamma(RfuncBase):
     def __init__(self, up=True, meanstress=1, cutoff=0.99):
         RfuncBase.__init__(self, up, meanstress, cutoff)
         self.nparam = 3
+        self.iir_fixed = [1]  # n
 
     def set_parameters(self, name):
         parameters = pd.DataFrame(
@@ -77,16 +263,40 @@ class Gamma(RfuncBase):
         if isinstance(dt, np.ndarray):
             t = dt
         else:
-            self.tmax = gammaincinv(p[1], self.cutoff) * p[2]
+            self.tmax = self.calc_tmax(p)
             self.tmax = max(self.tmax, 3 * dt)
             t = np.arange(dt, self.tmax, dt)
 
-        s = self.up * p[0] * gammainc(p[1], t / p[2])
+        s = self.up * p[0] * special.gammainc(p[1], t / p[2])
         return s
 
-    def block(self, p, dt=1):
+    def calc_tmax(self, p, cutoff=None):
+        if cutoff is None:
+            cutoff = self.get_cutoff(p)
+        return gammaincinv(p[1], cutoff) * p[2]
+
+    def iir(self, p, dt=1):
+        # for integer n the step function is 1 - exp(-t/a) times a
+        # polynomial of degree n - 1 in t
+        n = p[1]
+        if n < 1 or n != np.round(n):
+            return None
+        return self.get_iir(p, dt, int(n), np.exp(-dt / p[2]))
+
+    def step_jac(self, p, dt=1):
+        t = self.get_t(p, dt)
+        A, n, a = p[0], p[1], p[2]
+        x = t / a
+        P = gammainc(n, x)
+        # there is no closed form for the derivative of gammainc to n
+        h = 1e-6 * max(1.0, n)
+        dPdn = (gammainc(n + h, x) - gammainc(n - h, x)) / (2 * h)
+        dPdx = np.exp((n - 1) * np.log(x) - x - gammaln(n))
+        return self.up * np.vstack([P, A * dPdn, -A * dPdx * x / a])
+
+    def block(self, p, dt=1, dtype=np.float64):
         s = self.step(p, dt)
-        return s[1:] - s[:-1]
+        return (s[1:] - s[:-1]).astype(dtype, copy=False)
 
 
 class Exponential(RfuncBase):
@@ -114,15 +324,28 @@ class Exponential(RfuncBase):
         if isinstance(dt, np.ndarray):
             t = dt
         else:
-            self.tmax = -np.log(1.0 / p[1]) * p[1]
+            self.tmax = self.calc_tmax(p)
             self.tmax = max(self.tmax, 3 * dt)
             t = np.arange(dt, self.tmax, dt)
         s = self.up * p[0] * (1.0 - np.exp(-t / p[1]))
         return s
 
-    def block(self, p, dt=1):
+    def calc_tmax(self, p, cutoff=None):
+        if cutoff is None:
+            cutoff = self.get_cutoff(p)
+        return -np.log(1.0 - cutoff) * p[1]
+
+    def iir(self, p, dt=1):
+        return self.get_iir(p, dt, 1, np.exp(-dt / p[1]))
+
+    def step_jac(self, p, dt=1):
+        t = self.get_t(p, dt)
+        e = np.exp(-t / p[1])
+        return self.up * np.vstack([1.0 - e, -p[0] * e * t / p[1] ** 2])
+
+    def block(self, p, dt=1, dtype=np.float64):
         s = self.step(p, dt)
-        return s[1:] - s[:-1]
+        return (s[1:] - s[:-1]).astype(dtype, copy=False)
 
 
 class Hantush(RfuncBase):
@@ -156,11 +379,13 @@ class Hantush(RfuncBase):
         parameters.loc[name + '_cS'] = (100, 1e-3, 1e3, 1, name)
         return parameters
 
-    def calc_tmax(self, p):
+    def calc_tmax(self, p, cutoff=None):
+        if cutoff is None:
+            cutoff = self.get_cutoff(p)
         rho = p[1]
         cS = p[2]
         k0rho = k0(rho)
-        return lambertw(1 / ((1 - self.cutoff) * k0rho)).real * cS
+        return lambertw(1 / ((1 - cutoff) * k0rho)).real * cS
 
     def step(self, p, dt=1):
         rho = p[1]
@@ -170,23 +395,70 @@ class Hantush(RfuncBase):
             t = dt
         else:
             # approximate formula for tmax
-            self.tmax = lambertw(1 / ((1 - self.cutoff) * k0rho)).real * cS
+            self.tmax = self.calc_tmax(p)
             self.tmax = max(self.tmax, 3 * dt)
             t = np.arange(dt, self.tmax, dt)
-        tau = t / cS
-        tau1 = tau[tau < rho / 2]
-        tau2 = tau[tau >= rho / 2]
         w = (exp1(rho) - k0rho) / (exp1(rho) - exp1(rho / 2))
-        F = np.zeros_like(tau)
-        F[tau < rho / 2] = w * exp1(rho ** 2 / (4 * tau1)) - (w - 1) * exp1(
-            tau1 + rho ** 2 / (4 * tau1))
-        F[tau >= rho / 2] = 2 * k0rho - w * exp1(tau2) + (w - 1) * exp1(
-            tau2 + rho ** 2 / (4 * tau2))
+        # the parameters may be arrays that broadcast with t
+        tau, rho, k0rho, w = np.broadcast_arrays(t / cS, rho, k0rho, w)
+        small = tau < rho / 2
+        tau1, rho1, w1 = tau[small], rho[small], w[small]
+        tau2, rho2, w2 = tau[~small], rho[~small], w[~small]
+        F = np.zeros(tau.shape)
+        F[small] = w1 * special.exp1(rho1 ** 2 / (4 * tau1)) - \
+            (w1 - 1) * special.exp1(tau1 + rho1 ** 2 / (4 * tau1))
+        F[~small] = 2 * k0rho[~small] - w2 * special.exp1(tau2) + \
+            (w2 - 1) * special.exp1(tau2 + rho2 ** 2 / (4 * tau2))
         return self.up * p[0] * F / (2 * k0rho)
 
-    def block(self, p, dt=1):
+    def step_jac(self, p, dt=1):
+        # derivatives of the approximation of Veling & Maas (2010) in step,
+        # with a = rho ** 2 / 4 and d exp1(z) / dz = -exp(-z) / z
+        A, rho, cS = p[0], p[1], p[2]
+        t = self.get_t(p, dt)
+        k0rho = k0(rho)
+        k1rho = k1(rho)
+        e1 = exp1(rho)
+        N = e1 - k0rho
+        D = e1 - exp1(rho / 2)
+        w = N / D
+        dw = ((k1rho - np.exp(-rho) / rho) * D -
+              N * (np.exp(-rho / 2) - np.exp(-rho)) / rho) / D ** 2
+
+        tau = t / cS
+        a = rho ** 2 / 4
+        z = tau + a / tau
+        ez = np.exp(-z) / z
+        small = tau < rho / 2
+        F = np.zeros(tau.shape)
+        dFdtau = np.zeros(tau.shape)
+        dFdrho = np.zeros(tau.shape)
+
+        ts, zs, ezs = tau[small], z[small], ez[small]
+        E1a = special.exp1(a / ts)
+        E1z = special.exp1(zs)
+        F[small] = w * E1a - (w - 1) * E1z
+        dFdtau[small] = w * np.exp(-a / ts) / ts + \
+            (w - 1) * ezs * (1 - a / ts ** 2)
+        dFdrho[small] = dw * (E1a - E1z) - w * np.exp(-a / ts) * 2 / rho + \
+            (w - 1) * ezs * rho / (2 * ts)
+
+        tl, zl, ezl = tau[~small], z[~small], ez[~small]
+        E1t = special.exp1(tl)
+        E1z = special.exp1(zl)
+        F[~small] = 2 * k0rho - w * E1t + (w - 1) * E1z
+        dFdtau[~small] = w * np.exp(-tl) / tl - \
+            (w - 1) * ezl * (1 - a / tl ** 2)
+        dFdrho[~small] = -2 * k1rho + dw * (E1z - E1t) - \
+            (w - 1) * ezl * rho / (2 * tl)
+
+        c = self.up / (2 * k0rho)
+        return np.vstack([c * F, c * A * (dFdrho + F * k1rho / k0rho),
+                          -c * A * dFdtau * tau / cS])
+
+    def block(self, p, dt=1, dtype=np.float64):
         s = self.step(p, dt)
-        return s[1:] - s[:-1]
+        return (s[1:] - s[:-1]).astype(dtype, copy=False)
 
 
 class Theis(RfuncBase):
@@ -197,6 +469,11 @@ class Theis(RfuncBase):
     Theis may not be very appropiate, as the drawdown will continue
     indefinitely.
 
+    The step function has no final value, so tail_tol is not an error
+    budget for the cut off tail as for the other response functions: the
+    tail is infinite. With tail_tol the step function is cut off where it
+    increases less than tail_tol per day, see calc_tmax.
+
     References
     ----------
     Theis, C. V. (1935). The relation between the lowering of the Piezometric surface and the rate and duration of discharge of a well using groundwater storage. Eos, Transactions American Geophysical Union, 16(2), 519-524.
@@ -219,17 +496,41 @@ class Theis(RfuncBase):
         if isinstance(dt, np.ndarray):
             t = dt
         else:
-            self.tmax = 10000  # This should be changed with some analytical expression
+            self.tmax = self.calc_tmax(p)
             self.tmax = max(self.tmax, 3 * dt)
             t = np.arange(dt, self.tmax, dt)
         r = p[2]
         u = r ** 2.0 * p[0] / (4.0 * p[1] * t)
-        s = self.up * exp1(u)
+        s = self.up * special.exp1(u)
         return s
 
-    def block(self, p, dt=1):
+    def calc_tmax(self, p, cutoff=None):
+        # The step function keeps increasing, by exp(-a / t) / t per day
+        # with a = r ** 2 * S / (4 * T). Without tail_tol it is cut off
+        # after 10000 days. With tail_tol it is cut off where it increases
+        # tail_tol per day, at t = a / x with x * exp(-x) = a * tail_tol.
+        # The increase is at most 1 / (e * a) per day, at t = a. When that
+        # is less than tail_tol, it is cut off at t = a.
+        a = p[2] ** 2.0 * p[0] / (4.0 * p[1])
+        if self.tail_tol is None:
+            return np.full(np.shape(a), 10000.0)
+        y = np.minimum(a * self.tail_tol, np.exp(-1.0))
+        x = -lambertw(-y).real
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(x > 0.0, a / x, 1.0 / self.tail_tol)
+
+    def gain(self, p):
+        return np.full(np.shape(p[0]), np.inf)
+
+    def step_jac(self, p, dt=1):
+        t = self.get_t(p, dt)
+        u = p[2] ** 2.0 * p[0] / (4.0 * p[1] * t)
+        e = self.up * np.exp(-u)
+        return np.vstack([-e / p[0], e / p[1], -2.0 * e / p[2]])
+
+    def block(self, p, dt=1, dtype=np.float64):
         s = self.step(p, dt)
-        return s[1:] - s[:-1]
+        return (s[1:] - s[:-1]).astype(dtype, copy=False)
 
 
 class Bruggeman(RfuncBase):
@@ -257,24 +558,46 @@ class Bruggeman(RfuncBase):
         return parameters
 
     def step(self, p, dt=1):
-        # TODO: find tmax from cutoff, below is just an opproximation
         if isinstance(dt, np.ndarray):
             t = dt
         else:
-            self.tmax = 4 * p[0] / p[1] ** 2
+            self.tmax = self.calc_tmax(p)
             self.tmax = max(self.tmax, 3 * dt)
             t = np.arange(dt, self.tmax, dt)
         s = self.up * p[2] * self.polder_function(p[0], p[1] * np.sqrt(t))
         return s
 
+    def calc_tmax(self, p, cutoff=None):
+        # The tail of the polder function is smaller than
+        # erfc(y - x / y) / 2 times its final value, with y = b * sqrt(t).
+        if cutoff is None:
+            cutoff = self.get_cutoff(p)
+        z = erfcinv(2 * (1 - cutoff))
+        y = (z + np.sqrt(z ** 2 + 4 * p[0])) / 2
+        return (y / p[1]) ** 2
+
+    def gain(self, p):
+        return p[2] * np.exp(-2 * p[0])
+
+    def step_jac(self, p, dt=1):
+        t = self.get_t(p, dt)
+        x = p[0]
+        y = p[1] * np.sqrt(t)
+        e = np.exp(-x ** 2 / y ** 2 - y ** 2) / np.sqrt(np.pi)
+        dPdx = np.exp(2 * x) * erfc(x / y + y) - \
+               np.exp(-2 * x) * erfc(x / y - y) - 2 * e / y
+        dPdy = 2 * x * e / y ** 2
+        return self.up * np.vstack([p[2] * dPdx, p[2] * dPdy * np.sqrt(t),
+                                    self.polder_function(x, y)])
+
     def polder_function(self, x, y):
         s = .5 * np.exp(2 * x) * erfc(x / y + y) + \
             .5 * np.exp(-2 * x) * erfc(x / y - y)
         return s
 
-    def block(self, p, dt=1):
+    def block(self, p, dt=1, dtype=np.float64):
         s = self.step(p, dt)
-        return s[1:] - s[:-1]
+        return (s[1:] - s[:-1]).astype(dtype, copy=False)
 
 
 class One(RfuncBase):
@@ -298,5 +621,8 @@ class One(RfuncBase):
         else:
             return p[0] * np.ones(2)
 
-    def block(self, p, dt=1):
-        return p[0] * np.ones(2)
+    def block(self, p, dt=1, dtype=np.float64):
+        return np.full(2, p[0], dtype)
+
+    def block_ensemble(self, P, dt=1, dtype=np.float64):
+        return self.stack_blocks([self.block(p, dt) for p in P], dtype)
@@ -22,16 +22,43 @@ criterion (default), use te following syntax.
 
 >>> ml.solve(solver=LmfitSolve)
 
+The finite-difference Jacobian of LeastSquares and LmfitSolve can be computed
+on a pool of workers, one perturbed parameter set per worker. Each worker
+holds its own copy of the model and its calibration data. A pool of
+processes is used by default, use pool='thread' for a pool of threads.
+
+>>> ml.solve(solver=LmfitSolve, workers=8)
+
 """
 
 from __future__ import print_function, division
 
+import pickle
+import threading
+from multiprocessing.pool import Pool, ThreadPool
 from warnings import warn
 
 import lmfit
 import numpy as np
 from scipy.optimize import least_squares, differential_evolution
 
+# the model of a worker of the pool of a solver, see BaseSolver.start_pool
+_worker = threading.local()
+
+
+def _init_worker(state):
+    model = pickle.loads(state)
+    model.set_calib_data()
+    _worker.model = model
+
+
+def _worker_residuals(args):
+    # the residuals of a worker, as minimized by the solver
+    parameters, tmin, tmax, noise, freq, weights = args
+    res = BaseSolver().minimize(parameters, tmin, tmax, noise, _worker.model,
+                                freq, weights)
+    return np.asarray(res, dtype=float)
+
 
 class BaseSolver:
     """ Basesolver class that contains the basic function for each solver.
@@ -54,6 +81,75 @@ class BaseSolver:
         else:
             return self.default_kwargs
 
+    def start_pool(self, model, workers, pool='process'):
+        """Start a pool of workers for the finite-difference Jacobian.
+
+        Parameters
+        ----------
+        model: pastas.Model
+            Pastas Model instance, initialized for the solve.
+        workers: int
+            Number of workers.
+        pool: str, optional
+            'process' for a pool of processes, or 'thread' for a pool of
+            threads.
+
+        Notes
+        -----
+        Each worker unpickles its own copy of the model and compiles the
+        calibration data of that copy (see Model.set_calib_data), so the
+        workers do not share the caches of the tseries. Threads only run
+        concurrently where numpy, scipy and the compiled recharge kernels
+        release the GIL.
+
+        """
+        if pool not in ('process', 'thread'):
+            raise ValueError("pool must be 'process' or 'thread', not %r"
+                             % (pool,))
+        state = pickle.dumps(model, pickle.HIGHEST_PROTOCOL)
+        Executor = Pool if pool == 'process' else ThreadPool
+        self.pool = Executor(workers, _init_worker, (state,))
+
+    def stop_pool(self):
+        if getattr(self, 'pool', None) is not None:
+            self.pool.terminate()
+            self.pool.join()
+            self.pool = None
+
+    def jacobian_fd(self, parameters, steps, tmin, tmax, noise, freq,
+                    weights=None):
+        """Forward differences of the minimized residuals to the
+        parameters, computed on the pool of workers (see start_pool).
+
+        Parameters
+        ----------
+        parameters: numpy.ndarray
+            Array with the parameters.
+        steps: numpy.ndarray
+            Step of each parameter, the derivatives to the parameters with a
+            step of 0 are 0.
+
+        Returns
+        -------
+        jac: numpy.ndarray
+            Array of shape (number of residuals, number of parameters).
+
+        """
+        parameters = np.asarray(parameters, dtype=float)
+        cols = np.flatnonzero(steps)
+        args = [(parameters, tmin, tmax, noise, freq, weights)]
+        for i in cols:
+            p = parameters.copy()
+            p[i] += steps[i]
+            args.append((p, tmin, tmax, noise, freq, weights))
+        # the residuals at the parameters and at the perturbed parameters
+        # are calculated concurrently
+        res = self.pool.map(_worker_residuals, args, chunksize=1)
+        jac = np.zeros((res[0].size, parameters.size))
+        for i, r in zip(cols, res[1:]):
+            jac[:, i] = (r - res[0]) / steps[i]
+        return jac
+
     def minimize(self, parameters, tmin, tmax, noise, model, freq,
                  weights=None):
         """This method is called by all solvers to obtain a series that are
@@ -151,6 +247,21 @@ class LeastSquares(BaseSolver):
 
     >>> ml.solve(solver=LeastSquares)
 
+    By default the analytic Jacobian of the model is used (jac='analytic'),
+    see Model.jacobian. Derivatives without a closed form (to n of Gamma,
+    see RfuncBase.step_jac, and to the parameters of a non-linear recharge
+    model) are approximated with finite differences. The finite
+    differences of scipy are used when weights are applied or when the jac
+    keyword is set to e.g. '2-point'.
+
+    >>> ml.solve(solver=LeastSquares, jac='2-point')
+
+    With workers=n the forward differences are computed on a pool of n
+    workers instead (see BaseSolver.start_pool), with the relative step of
+    '2-point'. The analytic Jacobian is still used when it is available.
+
+    >>> ml.solve(solver=LeastSquares, jac='2-point', workers=8)
+
     References
     ----------
     https://docs.scipy.org/doc/scipy/reference/generated/scipy.optimize.least_squares.html
@@ -162,26 +273,41 @@ class LeastSquares(BaseSolver):
         BaseSolver.__init__(self)
 
         # Update the kwargs going to the solver
-        self.default_kwargs = dict(ftol=1e-3)
+        self.default_kwargs = dict(ftol=1e-3, jac='analytic', workers=None,
+                                   pool='process')
         kwargs = self.update_kwargs(kwargs)
-
-        parameters = model.parameters.initial.values
+        workers = kwargs.pop('workers')
+        pool = kwargs.pop('pool')
+        if kwargs['jac'] == 'analytic':
+            if weights is None:
+                kwargs['jac'] = self.jacobian
+            else:
+                kwargs['jac'] = '2-point'
+        if workers and kwargs['jac'] == '2-point':
+            self.start_pool(model, workers, pool)
+            kwargs['jac'] = self.jacobian_pool
+
+        parameters = model.parameters.initial.values.copy()
 
         # Set the boundaries
-        pmin = np.where(model.parameters.pmin.isnull(), -np.inf,
+        pmin = np.where(np.isnan(model.parameters.pmin), -np.inf,
                         model.parameters.pmin)
-        pmax = np.where(model.parameters.pmax.isnull(), np.inf,
+        pmax = np.where(np.isnan(model.parameters.pmax), np.inf,
                         model.parameters.pmax)
         bounds = (pmin, pmax)
 
-        if False in model.parameters.vary.values.astype('bool'):
+        if not model.parameters.vary.all():
             warn("Fixing parameters is not supported with this solver. Please"
                  "use LmfitSolve or apply small boundaries as a solution.")
 
-        self.fit = least_squares(self.objfunction, x0=parameters,
-                                 bounds=bounds,
-                                 args=(tmin, tmax, noise, model, freq,
-                                       weights), **kwargs)
+        self.bounds = bounds
+        try:
+            self.fit = least_squares(self.objfunction, x0=parameters,
+                                     bounds=bounds,
+                                     args=(tmin, tmax, noise, model, freq,
+                                           weights), **kwargs)
+        finally:
+            self.stop_pool()
         self.optimal_params = self.fit.x
         self.report = None
 
@@ -206,26 +332,72 @@ class LeastSquares(BaseSolver):
                             weights)
         return res
 
+    def jacobian(self, parameters, tmin, tmax, noise, model, freq, weights):
+        return model.jacobian(parameters, tmin, tmax, freq, noise=noise)
+
+    def jacobian_pool(self, parameters, tmin, tmax, noise, model, freq,
+                      weights):
+        # the steps of '2-point', reversed where they cross a bound
+        sign = np.where(parameters >= 0.0, 1.0, -1.0)
+        steps = np.finfo(float).eps ** 0.5 * sign * np.maximum(
+            1.0, np.abs(parameters))
+        steps = (parameters + steps) - parameters
+        p = parameters + steps
+        steps = np.where((p < self.bounds[0]) | (p > self.bounds[1]), -steps,
+                         steps)
+        return self.jacobian_fd(parameters, steps, tmin, tmax, noise, freq,
+                                weights)
+
 
 class LmfitSolve(BaseSolver):
+    """Solving the model using the minimize function of lmfit.
+
+    Notes
+    -----
+    This class is usually called by the pastas Model solve method. E.g.
+
+    >>> ml.solve(solver=LmfitSolve)
+
+    With workers=n the forward differences of the leastsq method are
+    computed on a pool of n workers (see BaseSolver.start_pool), and passed
+    to lmfit as the Dfun. The step of a parameter x is sqrt(epsfcn) * |x|,
+    as in leastsq.
+
+    >>> ml.solve(solver=LmfitSolve, workers=8)
+
+    """
+
     def __init__(self, model, tmin=None, tmax=None, noise=True, freq='D',
                  weights=None, **kwargs):
         BaseSolver.__init__(self)
 
         # Update the kwargs going to the solver
-        self.default_kwargs = dict(ftol=1e-3, epsfcn=1e-4)
+        self.default_kwargs = dict(ftol=1e-3, epsfcn=1e-4, workers=None,
+                                   pool='process')
         kwargs = self.update_kwargs(kwargs)
+        workers = kwargs.pop('workers')
+        pool = kwargs.pop('pool')
+        self.epsfcn = kwargs['epsfcn']
 
         # Deal with the parameters
         parameters = lmfit.Parameters()
-        p = model.parameters[['initial', 'pmin', 'pmax', 'vary']]
-        for k in p.index:
-            pp = np.where(p.loc[k].isnull(), None, p.loc[k])
-            parameters.add(k, value=pp[0], min=pp[1], max=pp[2], vary=pp[3])
-
-        self.fit = lmfit.minimize(fcn=self.objfunction, params=parameters,
-                                  args=(tmin, tmax, noise, model, freq,
-                                        weights), **kwargs)
+        p = model.parameters
+        for k, value, pmin, pmax, vary in zip(p.index, p.initial, p.pmin,
+                                              p.pmax, p.vary):
+            parameters.add(k, value=value,
+                           min=None if np.isnan(pmin) else pmin,
+                           max=None if np.isnan(pmax) else pmax,
+                           vary=bool(vary))
+
+        if workers:
+            self.start_pool(model, workers, pool)
+            kwargs['Dfun'] = self.jacobian_pool
+        try:
+            self.fit = lmfit.minimize(fcn=self.objfunction, params=parameters,
+                                      args=(tmin, tmax, noise, model, freq,
+                                            weights), **kwargs)
+        finally:
+            self.stop_pool()
         self.optimal_params = np.array([p.value for p in
                                         self.fit.params.values()])
         self.report = lmfit.fit_report(self.fit)
@@ -236,24 +408,95 @@ class LmfitSolve(BaseSolver):
                             weights)
         return res
 
+    def jacobian_pool(self, parameters, tmin, tmax, noise, model, freq,
+                      weights):
+        # the derivatives to the varying parameters, with the steps of
+        # leastsq away from the upper bound
+        param = np.array([p.value for p in parameters.values()])
+        vary = np.array([p.vary for p in parameters.values()])
+        pmax = np.array([np.inf if p.max is None else p.max
+                         for p in parameters.values()])
+        steps = self.epsfcn ** 0.5 * np.abs(param)
+        steps[steps == 0.0] = self.epsfcn ** 0.5
+        steps = np.where(param + steps > pmax, -steps, steps) * vary
+        jac = self.jacobian_fd(param, steps, tmin, tmax, noise, freq,
+                               weights)
+        return jac[:, vary]
+
 
 class DESolve(BaseSolver):
-    def __init__(self, model, tmin=None, tmax=None, noise=True, freq='D'):
+    """Solving the model using Scipy's differential_evolution method.
+
+    Notes
+    -----
+    This class is usually called by the pastas Model solve method. E.g.
+
+    >>> ml.solve(solver=DESolve)
+
+    With vectorized=True the whole population of each generation is
+    simulated in one call (see Model.simulate_ensemble). This is much
+    faster for models with a non-linear recharge model, as the root zone
+    is then integrated for all members at once. Weights are not applied by
+    this solver. The vectorized keyword of differential_evolution is
+    available from scipy 1.9.
+
+    >>> ml.solve(solver=DESolve, vectorized=True)
+
+    All varying parameters need finite boundaries (pmin and pmax), e.g.
+    those of the constant:
+
+    >>> ml.constant.set_min('constant_d', 0.0)
+    >>> ml.constant.set_max('constant_d', 50.0)
+
+    References
+    ----------
+    https://docs.scipy.org/doc/scipy/reference/generated/scipy.optimize.differential_evolution.html
+
+    """
+
+    def __init__(self, model, tmin=None, tmax=None, noise=True, freq='D',
+                 weights=None, **kwargs):
         BaseSolver.__init__(self)
 
+        # Update the kwargs going to the solver
+        self.default_kwargs = dict(vectorized=False)
+        kwargs = self.update_kwargs(kwargs)
+        vectorized = kwargs.pop('vectorized')
+
         self.freq = freq
         self.model = model
         self.tmin = tmin
         self.tmax = tmax
         self.noise = noise
-        self.parameters = self.model.parameters.initial.values
-        self.vary = self.model.parameters.vary.values.astype('bool')
+        self.parameters = self.model.parameters.initial.values.copy()
+        self.vary = self.model.parameters.vary.values
         self.pmin = self.model.parameters.pmin.values[self.vary]
         self.pmax = self.model.parameters.pmax.values[self.vary]
-        self.fit = differential_evolution(self.objfunction,
-                                          zip(self.pmin, self.pmax))
-        self.optimal_params = self.model.parameters.initial.values
-        self.optimal_params[self.vary] = self.fit.values()[3]
+
+        unbounded = np.isnan(self.pmin) | np.isnan(self.pmax)
+        if unbounded.any():
+            names = self.model.parameters.index[self.vary][unbounded]
+            raise ValueError("DESolve needs finite boundaries (pmin and "
+                             "pmax) for the varying parameters %s."
+                             % ', '.join(names))
+
+        objfunction = self.objfunction
+        if vectorized:
+            # the population is evaluated after each generation
+            kwargs['vectorized'] = True
+            kwargs['updating'] = 'deferred'
+            self.plan = model.get_sim_plan(tmin, tmax, freq,
+                                           dtype=np.float64)
+            self.sampler = model.get_sampler(tmin, tmax, freq)
+            self.obs = model.oseries[self.sampler.obs_index].values
+            self.delt = model.odelt[self.sampler.obs_index].values
+            objfunction = self.objfunction_population
+
+        self.fit = differential_evolution(objfunction,
+                                          list(zip(self.pmin, self.pmax)),
+                                          **kwargs)
+        self.optimal_params = self.model.parameters.initial.values.copy()
+        self.optimal_params[self.vary] = self.fit.x
         self.report = str(self.fit)
 
     def objfunction(self, parameters):
@@ -268,3 +511,34 @@ class DESolve(BaseSolver):
                                        tmax=self.tmax, freq=self.freq)
 
         return sum(res ** 2)
+
+    def objfunction_population(self, parameters):
+        """Objective function of all members of a population.
+
+        Parameters
+        ----------
+        parameters: numpy.ndarray
+            Array of shape (number of varying parameters, number of members),
+            or of shape (number of varying parameters,) for one member (e.g.
+            when the best member is polished).
+
+        Returns
+        -------
+        numpy.ndarray
+            The sum of squared residuals or innovations of each member.
+
+        """
+        if parameters.ndim == 1:
+            return self.objfunction_population(parameters[:, np.newaxis])[0]
+        P = np.repeat(self.parameters[np.newaxis], parameters.shape[1],
+                      axis=0)
+        P[:, self.vary] = parameters.T
+
+        H = self.plan.simulate_ensemble(P)
+        res = self.obs - self.sampler.sample(H)
+        if self.noise and self.model.noisemodel is not None:
+            # the noise parameters are the last ones, as in Model.innovations
+            res = self.model.noisemodel.simulate_ensemble(
+                res, self.delt, P[:, -self.model.noisemodel.nparam:])
+
+        return np.sum(res ** 2, axis=1)
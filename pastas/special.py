@@ -0,0 +1,306 @@
+"""This module contains tabulated versions of the special functions that are
+used by the response functions.
+
+The exponential integral exp1 (Hantush, Theis) and the regularized lower
+incomplete gamma function gammainc (Gamma) dominate the time of a
+simulation with these response functions. When the tables are switched on,
+these functions are evaluated by interpolation in precomputed tables:
+
+- log(exp1(x)) is tabulated on a uniform grid in log(x) and interpolated
+  with cubic Hermite polynomials, using the exact derivatives.
+- log(gammainc(n, x)) is tabulated in the same way for each n on a uniform
+  grid of n, and is interpolated in n with cubic Lagrange polynomials.
+
+The grid spacing is halved until the relative error is below rtol at the
+midpoint and the quarter points of every interval, where the error of the
+interpolation is largest. The n intervals of gammainc are computed and
+checked when they are first used. Intervals that do not meet rtol, and
+arguments outside the tables, are evaluated with scipy.special.
+
+Examples
+--------
+>>> from pastas import special
+>>> special.set_tables(True, rtol=1e-10)
+
+"""
+
+from __future__ import print_function, division
+
+import numpy as np
+from scipy import special as sc
+
+_tables = {'use': False, 'rtol': 1e-10}
+
+
+def set_tables(use=True, rtol=1e-10):
+    """Switches the tabulated special functions on or off.
+
+    Parameters
+    ----------
+    use: bool, optional
+        Use the tables (True) or scipy.special (False).
+    rtol: float, optional
+        Bound on the relative error of the tabulated functions.
+
+    """
+    if rtol != _tables['rtol']:
+        _tables.pop('exp1', None)
+        _tables.pop('gammainc', None)
+    _tables['use'] = use
+    _tables['rtol'] = rtol
+
+
+def get_table(name):
+    """Returns the table of a special function, which is computed when it is
+    first used.
+
+    """
+    if name not in _tables:
+        if name == 'exp1':
+            _tables[name] = Exp1Table(_tables['rtol'])
+        else:
+            _tables[name] = GammaincTable(_tables['rtol'])
+    return _tables[name]
+
+
+def exp1(x):
+    """Exponential integral, see scipy.special.exp1.
+
+    """
+    if not _tables['use'] or np.ndim(x) == 0:
+        return sc.exp1(x)
+    return get_table('exp1')(x)
+
+
+def gammainc(n, x):
+    """Regularized lower incomplete gamma function, see
+    scipy.special.gammainc. Only a scalar n is tabulated.
+
+    """
+    if not _tables['use'] or np.ndim(n) > 0 or np.ndim(x) == 0:
+        return sc.gammainc(n, x)
+    return get_table('gammainc')(n, x)
+
+
+def coefficients(g, d, h):
+    """Returns the coefficients of the cubic Hermite polynomials in the
+    fraction s of each interval, for the values g and the derivatives d on
+    a uniform grid with spacing h.
+
+    """
+    dg = g[1:] - g[:-1]
+    return np.vstack([g[:-1], h * d[:-1], 3 * dg - h * (2 * d[:-1] + d[1:]),
+                      -2 * dg + h * (d[:-1] + d[1:])])
+
+
+def horner(u, u0, h, c):
+    """Cubic Hermite interpolation at u on the uniform grid u0 + h * i,
+    with the coefficients c of the intervals.
+
+    """
+    s = (u - u0) / h
+    i = s.astype(np.intp)
+    np.clip(i, 0, c.shape[1] - 1, out=i)
+    s -= i
+    return ((c[3][i] * s + c[2][i]) * s + c[1][i]) * s + c[0][i]
+
+
+def hermite(u, u0, h, g, d):
+    """Cubic Hermite interpolation of the values g and the derivatives d on
+    the uniform grid u0 + h * i.
+
+    """
+    return horner(u, u0, h, coefficients(g, d, h))
+
+
+def grid(xmin, xmax, m):
+    """Returns a grid of m intervals from log(xmin) to log(xmax) and the
+    grid spacing. The nodes are computed like in hermite, so that the
+    rounding of the spacing does not shift them.
+
+    """
+    h = (np.log(xmax) - np.log(xmin)) / m
+    return np.log(xmin) + h * np.arange(m + 1), h
+
+
+def check_points(u):
+    """Returns the midpoint and the quarter points of each interval of the
+    grid u.
+
+    """
+    du = np.diff(u)
+    return np.concatenate([u[:-1] + 0.25 * du, u[:-1] + 0.5 * du,
+                           u[:-1] + 0.75 * du])
+
+
+class Exp1Table:
+    """Table of log(exp1(x)) on a uniform grid of log(x).
+
+    Parameters
+    ----------
+    rtol: float
+        Bound on the relative error.
+    xmin, xmax: float, optional
+        Range of the table.
+
+    Attributes
+    ----------
+    error: float
+        Largest relative error at the check points.
+
+    """
+
+    def __init__(self, rtol, xmin=1e-10, xmax=700.0):
+        self.rtol = rtol
+        self.xmin = xmin
+        self.xmax = xmax
+        m = 128
+        while True:
+            self.build(m)
+            u = check_points(self.u)
+            g = self.func(u)[0]
+            self.error = np.abs(np.expm1(self.interpolate(u) - g)).max()
+            if self.error <= rtol:
+                break
+            m *= 2
+
+    @staticmethod
+    def func(u):
+        """Returns log(exp1(x)) and its derivative to u = log(x).
+
+        """
+        x = np.exp(u)
+        g = np.log(sc.exp1(x))
+        return g, -np.exp(-x - g)
+
+    def build(self, m):
+        self.u, self.h = grid(self.xmin, self.xmax, m)
+        self.c = coefficients(*self.func(self.u), h=self.h)
+
+    def interpolate(self, u):
+        return horner(u, self.u[0], self.h, self.c)
+
+    def __call__(self, x):
+        x = np.asarray(x, dtype=float)
+        inside = (x >= self.xmin) & (x <= self.xmax)
+        if inside.all():
+            return np.exp(self.interpolate(np.log(x)))
+        y = np.empty(x.shape)
+        y[inside] = np.exp(self.interpolate(np.log(x[inside])))
+        y[~inside] = sc.exp1(x[~inside])
+        return y
+
+
+class GammaincTable:
+    """Table of log(gammainc(n, x)) on a uniform grid of n and log(x).
+
+    Parameters
+    ----------
+    rtol: float
+        Bound on the relative error.
+    nmin, nmax: float, optional
+        Range of n of the table.
+    xmin, xmax: float, optional
+        Range of x of the table.
+
+    Notes
+    -----
+    The table contains r = log(gammainc(n, x)) - n * log(x) +
+    gammaln(n + 1), which tends to zero for small x and is smooth in n,
+    also for small n.
+
+    A row of the table contains the values for one n. The rows are
+    computed when they are first needed, as during a calibration n only
+    varies in a small range.
+
+    """
+
+    def __init__(self, rtol, nmin=0.05, nmax=10.0, xmin=1e-8, xmax=100.0):
+        self.rtol = rtol
+        self.nmin = nmin
+        self.nmax = nmax
+        self.xmin = xmin
+        self.xmax = xmax
+        # grid of log(x), checked for the exact rows of a few n
+        m = 128
+        while True:
+            self.u, self.h = grid(xmin, xmax, m)
+            uc = check_points(self.u)
+            error = 0.0
+            for n in [nmin, 0.5, 1.0, 2.5, nmax]:
+                r, d = self.func(n, self.u)
+                rc = self.func(n, uc)[0]
+                error = max(error, np.abs(np.expm1(
+                    hermite(uc, self.u[0], self.h, r, d) - rc)).max())
+            if error <= rtol / 2:
+                break
+            m *= 2
+        # grid of n, checked for a few intervals
+        self.dn = 0.1
+        while True:
+            self.rows = {}
+            self.checked = {}
+            kmax = (nmax - nmin) / self.dn - 2
+            if all([self.check(int(k)) for k in np.linspace(1, kmax, 8)]):
+                break
+            self.dn /= 2
+
+    @staticmethod
+    def func(n, u):
+        """Returns r and its derivative to u = log(x).
+
+        """
+        x = np.exp(u)
+        g = np.log(sc.gammainc(n, x))
+        return g - n * u + sc.gammaln(n + 1), \
+            np.exp(n * u - x - sc.gammaln(n) - g) - n
+
+    def row(self, k):
+        if k not in self.rows:
+            self.rows[k] = self.func(self.nmin + k * self.dn, self.u)
+        return self.rows[k]
+
+    def interpolate_row(self, k, t, part=slice(None)):
+        """Returns r and its derivative for n = nmin + (k + t) * dn, with
+        0 <= t < 1, from the rows k - 1 to k + 2.
+
+        """
+        w = [-t * (t - 1) * (t - 2) / 6, (t + 1) * (t - 1) * (t - 2) / 2,
+             -(t + 1) * t * (t - 2) / 2, (t + 1) * t * (t - 1) / 6]
+        rows = [self.row(k + j) for j in range(-1, 3)]
+        r = sum([wj * row[0][part] for wj, row in zip(w, rows)])
+        d = sum([wj * row[1][part] for wj, row in zip(w, rows)])
+        return r, d
+
+    def check(self, k):
+        """Returns True if the interpolation between the rows k and k + 1
+        meets rtol.
+
+        """
+        if k not in self.checked:
+            r, d = self.interpolate_row(k, 0.5)
+            uc = np.concatenate([self.u, check_points(self.u)])
+            rc = self.func(self.nmin + (k + 0.5) * self.dn, uc)[0]
+            error = np.abs(np.expm1(
+                hermite(uc, self.u[0], self.h, r, d) - rc)).max()
+            self.checked[k] = error <= self.rtol
+        return self.checked[k]
+
+    def __call__(self, n, x):
+        kt = (n - self.nmin) / self.dn
+        k = int(kt)
+        if k < 1 or n > self.nmax or not self.check(k):
+            return sc.gammainc(n, x)
+        x = np.asarray(x, dtype=float)
+        inside = (x >= self.xmin) & (x <= self.xmax)
+        y = np.empty(x.shape)
+        u = np.log(x[inside])
+        if u.size:
+            # only the part of the rows between the smallest and largest u
+            i0 = max(int((u.min() - self.u[0]) / self.h), 0)
+            i1 = min(int((u.max() - self.u[0]) / self.h) + 2, self.u.size)
+            r, d = self.interpolate_row(k, kt - k, slice(i0, i1))
+            y[inside] = np.exp(hermite(u, self.u[i0], self.h, r, d) +
+                               n * u - sc.gammaln(n + 1))
+        y[~inside] = sc.gammainc(n, x[~inside])
+        return y
@@ -4,15 +4,21 @@
 
 from __future__ import print_function, division
 
+from collections import OrderedDict
+from copy import copy
 from warnings import warn
 
 import numpy as np
 import pandas as pd
+from scipy.fftpack import next_fast_len
 from scipy.signal import fftconvolve
+from scipy.special import k0
 
+from . import convolve as engine
 from .checks import check_tseries
+from .recharge.recharge_func import Linear
 from .rfunc import One
-from .utils import get_dt
+from .utils import get_dt, checksum
 
 
 class TseriesBase:
@@ -39,7 +45,50 @@ class TseriesBase:
         self.tmin = tmin
         self.tmax = tmax
         self.freq = None
-        self.stress = pd.DataFrame()
+        self._stress = pd.DataFrame()
+        self._freq_cache = {}
+        # (p, dt, engine, h, checksum of the stress) of the last simulation
+        self._contribution = None
+        self._spectra = {}
+        # vary flags of the parameters in a model, see set_vary
+        self._vary = None
+
+    def __getstate__(self):
+        # the resampled tseries are not pickled, they are cheap to recreate
+        state = self.__dict__.copy()
+        state['_freq_cache'] = {}
+        state['_contribution'] = None
+        state['_spectra'] = {}
+        return state
+
+    def __setstate__(self, state):
+        # tseries that were pickled before stress was a property
+        if 'stress' in state:
+            state['_stress'] = state.pop('stress')
+        self.__dict__.update(state)
+
+    @property
+    def stress(self):
+        """DataFrame with the stress(es). Assigning a new DataFrame removes
+        the data that was derived from the previous stress (see
+        del_stress_cache).
+
+        """
+        return self._stress
+
+    @stress.setter
+    def stress(self, stress):
+        self._stress = stress
+        self.del_stress_cache()
+
+    def del_stress_cache(self):
+        """Removes the resampled copies and the spectra of the stress. The
+        contribution of the last simulation is kept, as it is only reused
+        when the checksum of the stress matches (see convolve).
+
+        """
+        self._freq_cache = {}
+        self._spectra = {}
 
     def set_initial(self, name, value):
         """Method to set the initial parameter value.
@@ -73,6 +122,86 @@ class TseriesBase:
         else:
             print('Warning:', name, 'does not exist')
 
+    def get_vary(self):
+        """Returns the vary flags of the parameters as a boolean array:
+        those that were set with set_vary, otherwise those of
+        self.parameters.
+
+        """
+        if self._vary is not None:
+            return self._vary
+        return self.parameters['vary'].values.astype(bool)
+
+    def set_vary(self, vary):
+        """Sets the vary flags of the parameters in the model that holds
+        this tseries (see Model.set_tseries_vary). These flags replace the
+        vary column of self.parameters in get_iir.
+
+        Parameters
+        ----------
+        vary: array_like or None
+            Vary flag of each parameter of this tseries. None returns to
+            the vary column of self.parameters.
+
+        Returns
+        -------
+        bool
+            True when the flags of the parameters in rfunc.iir_fixed
+            changed. The contributions are then simulated again, as these
+            flags decide whether the recursive filter is used.
+
+        """
+        fixed = self.rfunc.iir_fixed
+        old = self.get_vary()[fixed]
+        if vary is not None:
+            vary = np.array(vary, dtype=bool)
+        self._vary = vary
+        for tseries in self._freq_cache.values():
+            tseries.set_vary(vary)
+        if np.array_equal(self.get_vary()[fixed], old):
+            return False
+        self.del_contribution()
+        return True
+
+    def del_contribution(self):
+        """Removes the kept contributions of this tseries and of its
+        resampled copies (see convolve).
+
+        """
+        self._contribution = None
+        for tseries in self._freq_cache.values():
+            tseries.del_contribution()
+
+    def set_tail_tol(self, tail_tol):
+        """Sets the error budget for cutting off the response function.
+
+        Parameters
+        ----------
+        tail_tol: float or None
+            Mean error of the head contribution that is caused by cutting
+            off the response function, in the unit of the head. When None,
+            the step function is cut off at the fraction cutoff of its
+            final value.
+
+        Notes
+        -----
+        The error is the convolution of the stress with the cut off tail of
+        the block response. On average it is the tail of the step function
+        times the mean of the stress, so the rfunc gets tail_tol divided by
+        the mean absolute value of the stress (of the sum of the stresses
+        for multiple stresses), see RfuncBase.get_cutoff. The error after a
+        period with large stresses can be larger. A constant error is
+        absorbed by the constant of the model.
+
+        """
+        if tail_tol is None:
+            self.rfunc.tail_tol = None
+        else:
+            scale = np.abs(self.stress).sum(axis=1).mean()
+            self.rfunc.tail_tol = tail_tol / scale
+        # the contributions were simulated with the previous block responses
+        self.del_contribution()
+
     def change_frequency(self, freq):
         """change the frequency.
 
@@ -98,6 +227,281 @@ class TseriesBase:
             # upsample (for example from week to day), use bfill
             self.stress = self.stress.resample(freq).bfill()
         self.freq = freq
+        self._contribution = None
+
+    def at_freq(self, freq):
+        """Returns this tseries with the stress at the frequency freq.
+
+        Parameters
+        ----------
+        freq: str
+            Frequency to which the stress series are transformed.
+
+        Returns
+        -------
+        tseries: pastas.tseries
+            The tseries itself when freq equals its frequency, otherwise a
+            shallow copy with resampled stresses.
+
+        Notes
+        -----
+        The resampled copies are cached per frequency, so the stresses are
+        resampled only once. Because the copy is shallow, the rfunc and
+        parameters are shared with the original tseries.
+
+        """
+        if freq == self.freq:
+            return self
+        if freq not in self._freq_cache:
+            tseries = copy(self)
+            tseries._freq_cache = {}
+            tseries._contribution = None
+            tseries._spectra = {}
+            tseries.change_frequency(freq)
+            self._freq_cache[freq] = tseries
+        return self._freq_cache[freq]
+
+    def simulate(self, p, tindex=None, dt=1):
+        """Simulates the head contribution.
+
+        Parameters
+        ----------
+        p: 1D array
+           Parameters used for simulation.
+        tindex: pandas.Series, optional
+           Time indices to simulate the model.
+        dt: float, optional
+           Time step of the stress in days.
+
+        Returns
+        -------
+        pandas.Series
+            The simulated head contribution.
+
+        """
+        h = pd.Series(self.simulate_array(p, dt), index=self.stress.index,
+                      name=self.name, copy=True)
+        if tindex is not None:
+            h = h.reindex(tindex)
+        return h
+
+    def get_spectrum(self, name, stress, nb, key=None, nfft=None):
+        """Returns the real FFT of a stress, padded for the convolution with
+        block responses of length nb.
+
+        Parameters
+        ----------
+        name: str
+            Name under which the spectrum is kept.
+        stress: numpy.ndarray
+            The stress at the stress indices, or an array with a stress in
+            each row.
+        nb: int
+            Length of the block response.
+        key: tuple, optional
+            Identifies the values of a stress that depends on parameters
+            (e.g. the recharge parameters).
+        nfft: int, optional
+            Length of the FFT, by default an FFT-friendly length.
+
+        Returns
+        -------
+        nfft: int
+            Length of the FFT.
+        spectrum: numpy.ndarray
+            The real FFT of the stress.
+
+        Notes
+        -----
+        The spectrum is renewed when the key or the length of the stress
+        changes, when the block response does not fit in the padding, or
+        when the frequency is changed. The padding leaves room for block
+        responses twice as long as nb, so that the spectrum is not renewed
+        each time the block response grows during calibration. The
+        spectrum of a single precision stress is single precision and is
+        kept apart from the double precision spectrum.
+
+        """
+        n = stress.shape[-1]
+        c = self._spectra.get((name, stress.dtype))
+        if c is None or c[0] != key or c[1] != n or nb - 1 > c[2] - n or \
+                (nfft is not None and c[2] != nfft):
+            if nfft is None:
+                nfft = next_fast_len(n + 2 * nb)
+            c = (key, n, nfft, engine.rfft(stress, nfft))
+            self._spectra[(name, stress.dtype)] = c
+        return c[2], c[3]
+
+    @staticmethod
+    def fft_convolve(spectrum, b, nfft, n):
+        """Convolution of a stress, given by its spectrum, with the block
+        response(s) b. Only the first n values are returned.
+
+        """
+        b = b.astype(spectrum.real.dtype, copy=False)
+        return engine.irfft(spectrum * engine.rfft(b, nfft), nfft)[..., :n]
+
+    def get_iir(self, prfunc, dt=1):
+        """Returns the recursive filter of the response function, or None
+        when the block response is convolved (see pastas.convolve).
+
+        The recursive filter is only used when the parameters in
+        rfunc.iir_fixed are fixed. A model passes the vary flags of its
+        parameters to the tseries before it simulates, see set_vary.
+
+        """
+        if not engine.use_recursive():
+            return None
+        if self.get_vary()[self.rfunc.iir_fixed].any():
+            return None
+        return self.rfunc.iir(prfunc, dt)
+
+    def convolve(self, stress, p, prfunc, dt=1, spectrum=None,
+                 dtype=np.float64):
+        """Convolution of the stress with the block response.
+
+        Parameters
+        ----------
+        stress: numpy.ndarray
+            The stress at the stress indices.
+        p: 1D array
+           Parameters used for simulation.
+        prfunc: 1D array
+           Parameters of the response function.
+        dt: float, optional
+           Time step of the stress in days.
+        spectrum: function, optional
+            Function that returns the length of the FFT and the spectrum of
+            the stress for a block response length and a dtype (see
+            get_spectrum).
+        dtype: numpy.dtype, optional
+            Precision of the block response and the convolution.
+
+        Returns
+        -------
+        numpy.ndarray
+            The head contribution at the stress indices.
+
+        Notes
+        -----
+        The convolution method is selected by pastas.convolve. When the
+        response function has a recursive form, the stress is filtered
+        and the block response is not calculated. The result
+        of the last convolution is kept, with a checksum of the stress.
+        When it is called again with the same parameters after the stress
+        was extended with the append_stress method, only the new tail is
+        convolved. The result is only reused when the checksum of the
+        first part of the stress is unchanged.
+
+        """
+        n = stress.size
+        stress = stress.astype(dtype, copy=False)
+        c = self._contribution
+        hit = c is not None and c[1] == dt and c[2] == engine.get_engine() \
+            and c[3].dtype == dtype and c[3].size <= n \
+            and np.array_equal(c[0], p) \
+            and c[4] == checksum(stress[:c[3].size])
+        if hit and c[3].size == n:
+            return c[3]
+
+        iir = self.get_iir(prfunc, dt)
+        if iir is not None:
+            h = engine.recursive(stress, iir)
+        elif hit:
+            n0 = c[3].size
+            b = self.rfunc.block(prfunc, dt, dtype)
+            # only the stresses within the length of b affect the tail
+            i0 = max(n0 - b.size + 1, 0)
+            tail = engine.convolve(stress[i0:], b, n - i0)[n0 - i0:]
+            h = np.concatenate([c[3], tail])
+        else:
+            b = self.rfunc.block(prfunc, dt, dtype)
+            h = engine.convolve(stress, b, n, spectrum)
+        self._contribution = (np.array(p, dtype=float), dt,
+                              engine.get_engine(), h, checksum(stress))
+        return h
+
+    def append_stress(self, stress, fillnan='mean'):
+        """Appends new values at the end of the stress(es).
+
+        Parameters
+        ----------
+        stress: pandas.Series or pandas.DataFrame
+            The new values of the stress. A DataFrame needs a column for
+            each stress of the tseries, in the same order as self.stress.
+            Only indices after the last index of the current stress are
+            used.
+        fillnan: str or float, optional
+            Method to fill the missing values of the new period: 'mean'
+            (mean of the stress), 'ffill' (last value) or a float.
+
+        """
+        stress = pd.DataFrame(stress)
+        stress.columns = self.stress.columns
+        stress.index = pd.to_datetime(stress.index)
+
+        index = pd.date_range(self.stress.index[-1], stress.index.max(),
+                              freq=self.freq)[1:]
+        if index.empty:
+            return
+        stress = stress.reindex(index)
+        if stress.isnull().values.any():
+            if fillnan == 'mean':
+                stress = stress.fillna(self.stress.mean())
+            elif fillnan == 'ffill':
+                stress = pd.concat([self.stress.iloc[-1:], stress]).ffill()
+                stress = stress.iloc[1:]
+            else:
+                stress = stress.fillna(fillnan)
+
+        self.stress = pd.concat([self.stress, stress])
+        self.tmax = self.stress.index.max()
+
+    def jacobian_array(self, p, dt=1):
+        """Derivatives of the head contribution at the stress indices with
+        respect to the parameters.
+
+        Parameters
+        ----------
+        p: 1D array
+           Parameters used for simulation.
+        dt: float, optional
+           Time step of the stress in days.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of shape (nparam, number of stress indices). Rows of
+            parameters without analytic derivatives are nan, these are
+            approximated with finite differences by the SimulationPlan.
+
+        """
+        return np.full((self.nparam, self.stress.index.size), np.nan)
+
+    def simulate_ensemble_array(self, P, dt=1, dtype=np.float64):
+        """Simulates the head contribution for many parameter sets.
+
+        Parameters
+        ----------
+        P: numpy.ndarray
+           Array of shape (number of parameter sets, nparam).
+        dt: float, optional
+           Time step of the stress in days.
+        dtype: numpy.dtype, optional
+           Precision of the convolution and of the returned array
+           (numpy.float64 or numpy.float32).
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of shape (number of parameter sets, number of stress
+            indices) with the head contribution of each parameter set.
+
+        """
+        H = np.empty((len(P), self.stress.index.size), dtype=dtype)
+        for h, p in zip(H, P):
+            h[:] = self.simulate_array(p, dt, dtype)
+        return H
 
     def get_stress(self, p=None, tindex=None):
         """Returns the stress or stresses of the time series object as a pandas
@@ -148,12 +552,15 @@ class Tseries(TseriesBase):
     norm_stress: Boolean, optional
         normalize the stress by subtracting the mean. For example this is
         convenient when simulating river levels.
+    tail_tol: float, optional
+        Error budget for cutting off the response function, see
+        set_tail_tol.
 
     """
 
     def __init__(self, stress, rfunc, name, metadata=None, xy=(0, 0),
                  freq=None, fillnan='mean', up=True, cutoff=0.99,
-                 normalize_stress=False):
+                 normalize_stress=False, tail_tol=None):
         stress = check_tseries(stress, freq, fillnan, name=name)
         TseriesBase.__init__(self, rfunc, name, xy, metadata,
                              stress.index.min(), stress.index.max(),
@@ -165,6 +572,7 @@ class Tseries(TseriesBase):
 
         self.stress[name] = stress
         self.set_init_parameters()
+        self.set_tail_tol(tail_tol)
 
     def set_init_parameters(self):
         """Set the initial parameters (back) to their default values.
@@ -172,29 +580,45 @@ class Tseries(TseriesBase):
         """
         self.parameters = self.rfunc.set_parameters(self.name)
 
-    def simulate(self, p, tindex=None, dt=1):
-        """Simulates the head contribution.
+    def simulate_array(self, p, dt=1, dtype=np.float64):
+        """Simulates the head contribution at the stress indices.
 
         Parameters
         ----------
         p: 1D array
            Parameters used for simulation.
-        tindex: pandas.Series, optional
-           Time indices to simulate the model.
+        dt: float, optional
+           Time step of the stress in days.
+        dtype: numpy.dtype, optional
+           Precision of the simulation (numpy.float64 or numpy.float32).
 
         Returns
         -------
-        pandas.Series
+        numpy.ndarray
             The simulated head contribution.
 
         """
-        b = self.rfunc.block(p, dt)
         self.npoints = self.stress.index.size  # Why recompute?
-        h = pd.Series(fftconvolve(self.stress[self.name], b, 'full')[
-                      :self.npoints], index=self.stress.index, name=self.name)
-        if tindex is not None:
-            h = h[tindex]
-        return h
+        return self.convolve(self.stress[self.name].values, p, p, dt,
+                             self.stress_spectrum, dtype)
+
+    def stress_spectrum(self, nb, dtype=np.float64):
+        stress = self.stress[self.name].values.astype(dtype, copy=False)
+        return self.get_spectrum('stress', stress, nb)
+
+    def simulate_ensemble_array(self, P, dt=1, dtype=np.float64):
+        if any([self.get_iir(p, dt) for p in P]):
+            return TseriesBase.simulate_ensemble_array(self, P, dt, dtype)
+        B = self.rfunc.block_ensemble(P, dt, dtype)
+        nfft, S = self.stress_spectrum(B.shape[1], dtype)
+        return self.fft_convolve(S, B, nfft, self.stress.index.size)
+
+    def jacobian_array(self, p, dt=1):
+        if self.get_iir(p, dt) is not None:
+            return TseriesBase.jacobian_array(self, p, dt)
+        db = self.rfunc.block_jac(p, dt)
+        nfft, S = self.stress_spectrum(db.shape[1])
+        return self.fft_convolve(S, db, nfft, self.stress.index.size)
 
 
 class Tseries2(TseriesBase):
@@ -227,12 +651,15 @@ class Tseries2(TseriesBase):
         'mean'. Currently supported options are: 'interpolate', float,
         and 'mean'. Interpolation is performed with a standard linear
         interpolation.
+    tail_tol: float, optional
+        Error budget for cutting off the response function, see
+        set_tail_tol.
 
     """
 
     def __init__(self, stress0, stress1, rfunc, name, metadata=None, xy=(0, 0),
                  freq=None, fillnan=('mean', 'interpolate'),
-                 up=True, cutoff=0.99):
+                 up=True, cutoff=0.99, tail_tol=None):
         # First check the series, then determine tmin and tmax
         stress0 = check_tseries(stress0, freq, fillnan[0], name=name)
         stress1 = check_tseries(stress1, freq, fillnan[1], name=name)
@@ -253,6 +680,7 @@ class Tseries2(TseriesBase):
 
         self.freq = stress0.index.freqstr
         self.set_init_parameters()
+        self.set_tail_tol(tail_tol)
 
     def set_init_parameters(self):
         """Set the initial parameters back to their default values.
@@ -262,32 +690,62 @@ class Tseries2(TseriesBase):
         self.parameters.loc[self.name + '_f'] = (-1.0, -2.0, 2.0, 1, self.name)
         self.nparam += 1
 
-    def simulate(self, p, tindex=None, dt=1):
-        """Simulates the head contribution.
+    def simulate_array(self, p, dt=1, dtype=np.float64):
+        """Simulates the head contribution at the stress indices.
 
         Parameters
         ----------
         p: 1D array
            Parameters used for simulation.
-        tindex: pandas.Series, optional
-           Time indices to simulate the model.
+        dt: float, optional
+           Time step of the stress in days.
+        dtype: numpy.dtype, optional
+           Precision of the simulation (numpy.float64 or numpy.float32).
 
         Returns
         -------
-        pandas.Series
+        numpy.ndarray
             The simulated head contribution.
 
         """
-        b = self.rfunc.block(p[:-1], dt)
         self.npoints = self.stress.index.size  # Why recompute?
-        h = pd.Series(
-            fftconvolve(
-                self.stress["stress0"] + p[-1] * self.stress["stress1"],
-                b, 'full')[:self.npoints], index=self.stress.index,
-            name=self.name)
-        if tindex is not None:
-            h = h[tindex]
-        return h
+        stress = self.stress["stress0"].values + \
+                 p[-1] * self.stress["stress1"].values
+        return self.convolve(
+            stress, p, p[:-1], dt,
+            lambda nb, dtype: self.stress_spectrum(nb, p[-1], dtype), dtype)
+
+    def stress_spectrum(self, nb, f=None, dtype=np.float64):
+        """Returns the length of the FFT and the spectrum of stress0 +
+        f * stress1, or of both stresses when f is None.
+
+        """
+        stress0 = self.stress["stress0"].values.astype(dtype, copy=False)
+        stress1 = self.stress["stress1"].values.astype(dtype, copy=False)
+        nfft, S0 = self.get_spectrum('stress0', stress0, nb)
+        nfft, S1 = self.get_spectrum('stress1', stress1, nb, nfft=nfft)
+        if f is None:
+            return nfft, S0, S1
+        return nfft, S0 + f * S1
+
+    def simulate_ensemble_array(self, P, dt=1, dtype=np.float64):
+        P = np.asarray(P, dtype=float)
+        if any([self.get_iir(p, dt) for p in P[:, :-1]]):
+            return TseriesBase.simulate_ensemble_array(self, P, dt, dtype)
+        B = self.rfunc.block_ensemble(P[:, :-1], dt, dtype)
+        nfft, S0, S1 = self.stress_spectrum(B.shape[1], dtype=dtype)
+        S = S0[np.newaxis, :] + P[:, -1:].astype(dtype) * S1[np.newaxis, :]
+        return self.fft_convolve(S, B, nfft, self.stress.index.size)
+
+    def jacobian_array(self, p, dt=1):
+        if self.get_iir(p[:-1], dt) is not None:
+            return TseriesBase.jacobian_array(self, p, dt)
+        db = self.rfunc.block_jac(p[:-1], dt)
+        b = self.rfunc.block(p[:-1], dt)
+        nfft, S0, S1 = self.stress_spectrum(max(db.shape[1], b.size))
+        n = self.stress.index.size
+        return np.vstack([self.fft_convolve(S0 + p[-1] * S1, db, nfft, n),
+                          self.fft_convolve(S1, b, nfft, n)])
 
     def get_stress(self, p=None, tindex=None):
         if p is not None:
@@ -332,11 +790,28 @@ class Recharge(TseriesBase):
         Currently supported options are: 'interpolate', float,
         and 'mean'. Interpolation is performed with a standard linear
         interpolation.
+    tail_tol: float, optional
+        Error budget for cutting off the response function, see
+        set_tail_tol.
+    cache_size: int, optional
+        Number of recharge series that are kept (Default=8), see
+        get_recharge. Use 0 to disable the cache.
+
+    Attributes
+    ----------
+    hits, misses: int
+        Number of recharge series that were reused and that were
+        calculated. The counters are reset when a model is solved.
 
     Notes
     -----
     Please check the documentation of the recharge_func classes for more details.
 
+    The precipitation and the evaporation are rates (e.g. m/day), as the
+    other stresses. The recharge is calculated at the frequency of the
+    stresses, with a time step of get_dt(freq) days, so that hourly data can
+    be used without resampling to days.
+
     References
     ----------
     R.A. Collenteur [2016] Non-linear time series analysis of deep groundwater levels: Application to the Veluwe. MSc. thesis, TU Delft. http://repository.tudelft.nl/view/ir/uuid:baf4fc8c-6311-407c-b01f-c80a96ecd584/
@@ -345,7 +820,8 @@ class Recharge(TseriesBase):
 
     def __init__(self, precip, evap, rfunc, recharge,
                  name, metadata=None, xy=(0, 0), freq=(None, None),
-                 fillnan=('mean', 'interpolate'), cutoff=0.99):
+                 fillnan=('mean', 'interpolate'), cutoff=0.99,
+                 tail_tol=None, cache_size=8):
         # Check and name the time series
         P = check_tseries(precip, freq[0], fillnan[0], name=name + '_P')
         E = check_tseries(evap, freq[1], fillnan[1], name=name + '_E')
@@ -364,33 +840,227 @@ class Recharge(TseriesBase):
                              index.max(), True,
                              precip.mean() - evap.mean(), cutoff)
 
-        self.stress[P.name] = P[index]
-        self.stress[E.name] = E[index]
+        stress = pd.DataFrame()
+        stress[P.name] = P[index]
+        stress[E.name] = E[index]
+        self.stress = stress
         self.freq = self.stress.index.freqstr
 
-        # The recharge calculation needs arrays
-        self.precip_array = np.array(self.stress[P.name])
-        self.evap_array = np.array(self.stress[E.name])
-
         self.recharge = recharge()
         self.set_init_parameters()
         self.nparam = self.rfunc.nparam + self.recharge.nparam
+        self.set_tail_tol(tail_tol)
+
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+
+    def __getstate__(self):
+        state = TseriesBase.__getstate__(self)
+        state['_recharge'] = OrderedDict()
+        state['_linear'] = None
+        state['_linear_spectrum'] = None
+        return state
 
     def set_init_parameters(self):
         self.parameters = pd.concat([self.rfunc.set_parameters(self.name),
                                      self.recharge.set_parameters(self.name)])
 
-    def simulate(self, p, tindex=None, dt=1):
-        dt = int(dt)
-        b = self.rfunc.block(p[:-self.recharge.nparam], dt)  # Block response
-        rseries = self.recharge.simulate(self.precip_array, self.evap_array,
-                                         p[-self.recharge.nparam:])
+    def del_contribution(self):
+        TseriesBase.del_contribution(self)
+        self._linear = None
+
+    def del_stress_cache(self):
+        TseriesBase.del_stress_cache(self)
+        # The recharge calculation needs arrays
+        self.precip_array = self.stress.iloc[:, 0].values
+        self.evap_array = self.stress.iloc[:, 1].values
+        self._recharge = OrderedDict()
+        self._linear = None  # (prfunc, dt, engine, n, conv, dtype) of Linear
+        self._linear_spectrum = None  # (key, spectrum) of Linear
+
+    def get_recharge(self, p, dtype=np.float64):
+        """Returns the recharge series for the recharge parameters p.
+
+        Parameters
+        ----------
+        p: 1D array
+           Parameters of the recharge model.
+        dtype: numpy.dtype, optional
+           Precision of the recharge series.
+
+        Returns
+        -------
+        numpy.ndarray
+            The recharge at the stress indices. The array is read-only, as
+            it may be shared with later calls.
+
+        Notes
+        -----
+        The last cache_size recharge series are kept, with the least
+        recently used series dropped first. The series are keyed on the
+        recharge parameters and the dtype, and renewed when the stresses
+        change (see del_stress_cache). When a solver perturbs only the
+        parameters of the response function, the root zone is not
+        integrated again.
+
+        """
+        key = tuple(np.asarray(p, dtype=float)) + (np.dtype(dtype).str,)
+        rseries = self._recharge.pop(key, None)
+        if rseries is None:
+            self.misses += 1
+            rseries = self.recharge.simulate(self.precip_array,
+                                             self.evap_array, p,
+                                             get_dt(self.freq), dtype)
+            rseries = np.asarray(rseries, dtype=dtype)
+            rseries.flags.writeable = False
+        else:
+            self.hits += 1
+        if self.cache_size > 0:
+            self._recharge[key] = rseries
+            while len(self._recharge) > self.cache_size:
+                self._recharge.popitem(last=False)
+        return rseries
+
+    def cache_info(self):
+        """Returns the number of reused and calculated recharge series.
+
+        """
+        return dict(hits=self.hits, misses=self.misses,
+                    maxsize=self.cache_size, currsize=len(self._recharge))
+
+    def convolve_linear(self, prfunc, wP, wE, dt=1, dtype=np.float64):
+        """Convolution of wP * P + wE * E with the block response, for the
+        Linear recharge model.
+
+        Parameters
+        ----------
+        prfunc: 1D array
+           Parameters of the response function.
+        wP, wE: float
+           Weights of the precipitation and the evaporation, 1 and f for
+           the head contribution.
+        dt: float, optional
+           Time step of the stress in days.
+        dtype: numpy.dtype, optional
+           Precision of the convolution.
+
+        Returns
+        -------
+        numpy.ndarray
+            The convolution at the stress indices.
+
+        Notes
+        -----
+        The convolution is linear, so the head contribution of P + f * E
+        is formed from the precipitation and the evaporation separately.
+        The spectra of both stresses are kept by get_spectrum, and the
+        spectrum of the block response is kept for the parameters of the
+        response function. A change of f then only costs a complex
+        multiply-add and the inverse FFT, a change of the response function
+        costs the FFT of the block response and the inverse FFT. When the stresses are filtered or
+        convolved directly, the two convolutions are kept instead.
+
+        """
+        n = self.precip_array.size
+        precip = self.precip_array.astype(dtype, copy=False)
+        evap = self.evap_array.astype(dtype, copy=False)
+        c = self._linear
+        if c is None or c[1] != dt or c[2] != engine.get_engine() or \
+                c[3] != n or c[5] != dtype or \
+                not np.array_equal(c[0], prfunc):
+            iir = self.get_iir(prfunc, dt)
+            if iir is not None:
+                conv = ('time', engine.recursive(precip, iir),
+                        engine.recursive(evap, iir))
+            else:
+                b = self.rfunc.block(prfunc, dt, dtype)
+                method = engine.get_method(n, b.size)
+                if method == 'fft':
+                    nfft = self.get_spectrum('precip', precip, b.size)[0]
+                    conv = ('fft', b.size, nfft, engine.rfft(b, nfft))
+                else:
+                    conv = ('time',
+                            engine.convolve(precip, b, n, method=method),
+                            engine.convolve(evap, b, n, method=method))
+            c = (np.array(prfunc, dtype=float), dt, engine.get_engine(), n,
+                 conv, dtype)
+            self._linear = c
+
+        conv = c[4]
+        if conv[0] == 'time':
+            return wP * conv[1] + wE * conv[2]
+        nb, nfft, B = conv[1:]
+        # the spectrum of wP * P + wE * E is kept for the weights
+        key = (wP, wE, nfft, dtype)
+        if self._linear_spectrum is None or self._linear_spectrum[0] != key:
+            S = wE * self.get_spectrum('evap', evap, nb, nfft=nfft)[1]
+            if wP != 0.0:
+                S = S + wP * self.get_spectrum('precip', precip, nb,
+                                               nfft=nfft)[1]
+            self._linear_spectrum = (key, S)
+        return engine.irfft(self._linear_spectrum[1] * B, nfft)[:n]
+
+    def simulate_array(self, p, dt=1, dtype=np.float64):
+        if isinstance(self.recharge, Linear):
+            self.npoints = self.precip_array.size
+            return self.convolve_linear(p[:-1], 1.0, p[-1], dt, dtype)
+        rseries = self.get_recharge(p[-self.recharge.nparam:], dtype)
         self.npoints = len(rseries)
-        h = pd.Series(fftconvolve(rseries, b, 'full')[:self.npoints],
-                      index=self.stress.index, name=self.name)
-        if tindex is not None:
-            h = h[tindex]
-        return h
+        # the spectrum of the recharge is kept for the recharge parameters
+        key = tuple(p[-self.recharge.nparam:])
+        return self.convolve(
+            rseries, p, p[:-self.recharge.nparam], dt,
+            lambda nb, dtype: self.get_spectrum('recharge', rseries, nb, key),
+            dtype)
+
+    def simulate_ensemble_array(self, P, dt=1, dtype=np.float64):
+        P = np.asarray(P, dtype=float)
+        if any([self.get_iir(p, dt) for p in P[:, :-self.recharge.nparam]]):
+            return TseriesBase.simulate_ensemble_array(self, P, dt, dtype)
+        B = self.rfunc.block_ensemble(P[:, :-self.recharge.nparam], dt,
+                                      dtype)
+        # the soil water balance of all parameter sets is integrated at
+        # once, see RootZoneBase
+        rseries = self.recharge.simulate_ensemble(
+            self.precip_array, self.evap_array, P[:, -self.recharge.nparam:],
+            get_dt(self.freq), dtype)
+        return fftconvolve(rseries, B, 'full', axes=1)[:, :rseries.shape[1]]
+
+    def jacobian_array(self, p, dt=1):
+        # The derivatives to the recharge parameters are left to the
+        # finite differences of the SimulationPlan.
+        if isinstance(self.recharge, Linear):
+            return self.jacobian_linear(p, dt)
+        if self.get_iir(p[:-self.recharge.nparam], dt) is not None:
+            return TseriesBase.jacobian_array(self, p, dt)
+        db = self.rfunc.block_jac(p[:-self.recharge.nparam], dt)
+        rseries = self.get_recharge(p[-self.recharge.nparam:])
+        key = tuple(p[-self.recharge.nparam:])
+        nfft, S = self.get_spectrum('recharge', rseries, db.shape[1], key)
+        jac = np.full((self.nparam, rseries.size), np.nan)
+        jac[:db.shape[0]] = self.fft_convolve(S, db, nfft, rseries.size)
+        return jac
+
+    def jacobian_linear(self, p, dt=1):
+        """Derivatives of the head contribution of the Linear recharge
+        model. The derivative to f is the convolution of the evaporation,
+        the derivatives to the response function are obtained from the
+        spectra of both stresses.
+
+        """
+        jac = np.full((self.nparam, self.precip_array.size), np.nan)
+        jac[-1] = self.convolve_linear(p[:-1], 0.0, 1.0, dt)
+        if self.get_iir(p[:-1], dt) is None:
+            n = self.precip_array.size
+            db = self.rfunc.block_jac(p[:-1], dt)
+            nfft, SP = self.get_spectrum('precip', self.precip_array,
+                                         db.shape[1])
+            nfft, SE = self.get_spectrum('evap', self.evap_array,
+                                         db.shape[1], nfft=nfft)
+            jac[:db.shape[0]] = self.fft_convolve(SP + p[-1] * SE, db, nfft,
+                                                  n)
+        return jac
 
     def get_stress(self, p=None, tindex=None):
         """Returns the stress or stresses of the time series object as a pandas
@@ -410,12 +1080,10 @@ class Recharge(TseriesBase):
 
         # If parameters are not provided, don't calculate the recharge.
         if p is not None:
-            rseries = self.recharge.simulate(self.precip_array,
-                                             self.evap_array,
-                                             p[-self.recharge.nparam:])
+            rseries = self.get_recharge(p[-self.recharge.nparam:])
 
             stress = pd.Series(rseries, index=self.stress.index,
-                               name=self.name)
+                               name=self.name, copy=True)
 
             if tindex is not None:
                 return stress[tindex]
@@ -431,12 +1099,16 @@ class Well(TseriesBase):
 
     Parameters
     ----------
-    stress: pandas.DataFrame
-        Pandas DataFrame object containing the stresses.
+    stress: pandas.DataFrame, pandas.Series or list of pandas.Series
+        The extraction series of the wells, one column for each well.
     rfunc: rfunc class
-        Response function used in the convolution with the stresses.
+        Response function used in the convolution with the stresses, with
+        the parameters A, rho and cS of the Hantush response function.
     name: str
         Name of the stress
+    r: array_like, optional
+        Distance of each well to the observation well. By default the
+        distance is 1 for all wells.
     metadata: dict, optional
         dictionary containing metadata about the stress.
     xy: tuple, optional
@@ -452,50 +1124,99 @@ class Well(TseriesBase):
         'mean'. Currently supported options are: 'interpolate', float,
         and 'mean'. Interpolation is performed with a standard linear
         interpolation.
+    tail_tol: float, optional
+        Error budget for cutting off the response function, see
+        set_tail_tol.
 
     Notes
     -----
     This class implements convolution of multiple series with a the same
     response function. This is often applied when dealing with multiple
-    wells in a time series model.
+    wells in a time series model. The extraction of a well is zero outside
+    the period of its series.
+
+    The parameters are those of the response function at a distance of 1.
+    For a well at distance r the response function has the parameters
+    rho * r and cS, and is scaled with K0(rho * r) / K0(rho), so that
+    its final value is the steady drawdown of Hantush at that distance.
+
+    The block responses of all wells are calculated in one call to
+    rfunc.block_ensemble. The spectra of the extraction series are kept, and
+    the contributions of the wells are summed in the frequency domain, so
+    that one inverse FFT is needed for all wells.
 
     """
 
     def __init__(self, stress, rfunc, name, r=None, metadata=None,
-                 xy=(0, 0), freq=None, fillna='mean', up=True, cutoff=0.99):
-        # Check if number of stresses and radii match
-        if len(stress.keys()) != len(r) and r:
-            warn("The number of stresses applied does not match the number "
-                 "of radii provided.")
-        else:
-            self.r = r
-
-        # Check stresses
-        if type(stress) is pd.Series:
+                 xy=(0, 0), freq=None, fillnan='mean', up=True, cutoff=0.99,
+                 tail_tol=None):
+        if isinstance(stress, pd.Series):
             stress = [stress]
+        elif isinstance(stress, pd.DataFrame):
+            stress = [stress[column] for column in stress.columns]
+        stress = [check_tseries(s, freq, fillnan, name=name) for s in stress]
+
+        if r is None:
+            r = np.ones(len(stress))
+        self.r = np.asarray(r, dtype=float)
+        if self.r.size != len(stress):
+            raise ValueError('The number of stresses (%i) does not match the '
+                             'number of radii (%i).' % (len(stress),
+                                                        self.r.size))
+
+        # the extraction is zero outside the period of each well
+        freq = stress[0].index.freqstr
+        stress = pd.concat(stress, axis=1)
+        stress.columns = ['%s_%i' % (name, i) for i in range(len(self.r))]
+        index = pd.date_range(stress.index.min(), stress.index.max(),
+                              freq=freq)
+        stress = stress.reindex(index).fillna(0.0)
 
         TseriesBase.__init__(self, rfunc, name, xy, metadata,
-                             self.stress.index.min(), self.stress.index.max(),
-                             up, self.stress.mean(), cutoff)
-
-        for i in stress:
-            self.stress.append(check_tseries(stress[i], freq, fillna, name))
-
-        self.freq = self.stress[0].index.freqstr
+                             stress.index.min(), stress.index.max(),
+                             up, stress.sum(axis=1).mean(), cutoff)
+        self.stress = stress
+        self.freq = freq
         self.set_init_parameters()
+        self.set_tail_tol(tail_tol)
 
     def set_init_parameters(self):
         self.parameters = self.rfunc.set_parameters(self.name)
 
-    def simulate(self, p=None, tindex=None, dt=1):
-        h = pd.Series(data=0, index=self.stress[0].index, name=self.name)
-        for i in self.stress:
-            self.npoints = self.stress.index.size
-            b = self.rfunc.block(p, self.r[i])  # nparam-1 depending on rfunc
-            h += fftconvolve(self.stress[i], b, 'full')[:self.npoints]
-        if tindex is not None:
-            h = h[tindex]
-        return h
+    def get_well_parameters(self, p):
+        """Returns the parameters of the response function for each well,
+        as an array of shape (number of wells, nparam).
+
+        """
+        rho = p[1] * self.r
+        A = p[0] * k0(rho) / k0(p[1])
+        return np.column_stack([A, rho, np.full(self.r.size, p[2])])
+
+    def simulate_array(self, p, dt=1, dtype=np.float64):
+        """Simulates the head contribution of all wells at the stress
+        indices.
+
+        Parameters
+        ----------
+        p: 1D array
+           Parameters used for simulation.
+        dt: float, optional
+           Time step of the stress in days.
+        dtype: numpy.dtype, optional
+           Precision of the simulation (numpy.float64 or numpy.float32).
+
+        Returns
+        -------
+        numpy.ndarray
+            The simulated head contribution.
+
+        """
+        B = self.rfunc.block_ensemble(self.get_well_parameters(p), dt, dtype)
+        stress = self.stress.values.T.astype(dtype, copy=False)
+        nfft, S = self.get_spectrum('wells', stress, B.shape[1])
+        n = stress.shape[1]
+        H = (S * engine.rfft(B, nfft)).sum(axis=0)
+        return engine.irfft(H, nfft)[:n]
 
 
 class TseriesStep(TseriesBase):
@@ -574,6 +1295,9 @@ class TseriesNoConv(TseriesBase):
         """
         self.parameters = self.rfunc.set_parameters(self.name)
 
+    def simulate_array(self, p, dt=None, dtype=np.float64):
+        return self.simulate(p, self.stress.index).values.astype(dtype)
+
     def simulate(self, p, tindex=None, dt=None):
         """ Simulates the head contribution, without convolution.
 
@@ -733,7 +1457,60 @@ class NoiseModel:
         """
         innovations = pd.Series(res, index=res.index, name="Innovations")
         # res.values is needed else it gets messed up with the dates
-        innovations[1:] -= np.exp(-delt[1:] / p) * res.values[:-1]
+        alpha = np.exp(-delt[1:] / p).astype(res.dtype, copy=False)
+        innovations[1:] -= alpha * res.values[:-1]
         if tindex is not None:
             innovations = innovations[tindex]
         return innovations
+
+    def simulate_ensemble(self, res, delt, P):
+        """Innovations of many residual series at once.
+
+        Parameters
+        ----------
+        res : numpy.ndarray
+            Residuals of shape (number of members, number of observations).
+        delt : numpy.ndarray
+            Time steps between observations.
+        P : numpy.ndarray
+            Alpha parameters of shape (number of members, nparam).
+
+        Returns
+        -------
+        numpy.ndarray
+            The innovations, with the same shape as res.
+
+        """
+        alpha = np.exp(-delt[1:] / np.asarray(P)[:, -1:]).astype(res.dtype,
+                                                                copy=False)
+        v = res.copy()
+        v[:, 1:] -= alpha * res[:, :-1]
+        return v
+
+    def jacobian(self, res, delt, p, jac):
+        """Derivatives of the innovations with respect to the parameters.
+
+        Parameters
+        ----------
+        res : pandas.Series
+            The residual series.
+        delt : numpy.ndarray
+            Time steps between observations.
+        p : array-like
+            Alpha parameters used by the noisemodel.
+        jac : numpy.ndarray
+            Derivatives of the residuals with respect to all parameters,
+            with one row per parameter. The last row belongs to alpha.
+
+        Returns
+        -------
+        numpy.ndarray
+            Derivatives of the innovations, with the same shape as jac.
+
+        """
+        alpha = p[-1]
+        e = np.exp(-delt[1:] / alpha)
+        jacv = jac.copy()
+        jacv[:, 1:] -= e * jac[:, :-1]
+        jacv[-1, 1:] = -res.values[:-1] * e * delt[1:] / alpha ** 2
+        return jacv
@@ -1,4 +1,7 @@
 import datetime
+import zlib
+
+import numpy as np
 import pandas as pd
 
 
@@ -103,3 +106,50 @@ def get_freqstr(freqstr):
 
     return num, freq
 
+
+def get_sample(tindex, ref_tindex):
+    """Sample the index so that the frequency is not higher than ref_tindex.
+
+    Parameters
+    ----------
+    tindex: pandas.index
+        Pandas index object
+    ref_tindex: pandas.index
+        Pandas index object
+
+    Returns
+    -------
+    ind: numpy.ndarray
+        Sorted and unique positions in tindex of the indices closest to
+        each index in ref_tindex.
+
+    Notes
+    -----
+    Equivalent to interpolating the positions of tindex to ref_tindex with
+    scipy.interpolate.interp1d(kind='nearest', fill_value='extrapolate'),
+    including the rounding of exact midpoints to the lower position, but
+    uses np.searchsorted on the int64 epochs and needs no sort for the
+    unique positions when ref_tindex is monotonic.
+
+    """
+    x = np.asarray(tindex.asi8)
+    t = np.asarray(ref_tindex.asi8)
+    if x.size < 2:
+        return np.zeros(min(x.size, t.size), dtype=int)
+    # midpoints between the indices, in integer arithmetic
+    x_bds = x[:-1] + (x[1:] - x[:-1]) // 2
+    ind = np.searchsorted(x_bds, t, side='left')
+    if ref_tindex.is_monotonic_increasing:
+        keep = np.empty(ind.size, dtype=bool)
+        keep[:1] = True
+        np.not_equal(ind[1:], ind[:-1], out=keep[1:])
+        return ind[keep]
+    else:
+        return np.unique(ind)
+
+
+def checksum(x):
+    """Returns a checksum of the values of the array x.
+
+    """
+    return zlib.crc32(np.ascontiguousarray(x).view(np.uint8))
@@ -1,4 +1,14 @@
-from setuptools import setup, find_packages
+import warnings
+
+from setuptools import setup, find_packages, Extension
+from setuptools.command.build_ext import build_ext
+
+try:
+    from setuptools.errors import CCompilerError, ExecError, PlatformError
+except ImportError:
+    from distutils.errors import CCompilerError
+    from distutils.errors import DistutilsExecError as ExecError
+    from distutils.errors import DistutilsPlatformError as PlatformError
 
 l_d = ''
 try:
@@ -8,6 +18,44 @@ try:
 except:
     pass
 
+
+class BuildExt(build_ext):
+    """Builds the compiled recharge kernels. The installation does not fail
+    when there is no compiler or the kernels do not compile, Pastas then
+    uses the Python kernels (see pastas.recharge.recharge_func.BACKEND).
+
+    """
+
+    def run(self):
+        try:
+            build_ext.run(self)
+        except PlatformError as e:
+            warnings.warn('The recharge kernels are not compiled, the Python '
+                          'kernels are used: %s' % e)
+
+    def build_extension(self, ext):
+        try:
+            build_ext.build_extension(self, ext)
+        except (CCompilerError, ExecError, PlatformError) as e:
+            warnings.warn('The recharge kernels are not compiled, the Python '
+                          'kernels are used: %s' % e)
+
+
+# The recharge kernels are compiled from the .pyx file when Cython 3 is
+# installed, otherwise from the .c file that is shipped with the source. The
+# .c file is generated with Cython 3 and compiles for Python 3.8 and newer.
+try:
+    import Cython
+    from Cython.Build import cythonize
+
+    if int(Cython.__version__.split('.')[0]) < 3:
+        raise ImportError('the kernels need Cython 3')
+    ext_modules = cythonize([Extension('pastas.recharge.recharge_cy',
+                                       ['pastas/recharge/recharge_cy.pyx'])])
+except ImportError:
+    ext_modules = [Extension('pastas.recharge.recharge_cy',
+                             ['pastas/recharge/recharge_cy.c'])]
+
 # Get the version.
 version = {}
 with open("pastas/version.py") as fp:
@@ -28,12 +76,18 @@ setup(
         'Intended Audience :: Science/Research',
         'Intended Audience :: Other Audience',
         'License :: OSI Approved :: MIT License',
-        'Programming Language :: Python :: 2.7',
-        'Programming Language :: Python :: 3.5'
+        'Programming Language :: Python :: 3',
+        'Programming Language :: Python :: 3.8',
+        'Programming Language :: Python :: 3.9',
+        'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11'
     ],
     platforms='Windows, Mac OS-X',
+    python_requires='>=3.8',
     install_requires=['numpy>=1.9', 'matplotlib>=1.5', 'lmfit>=0.9',
                       'pandas>=0.19', 'scipy>=0.17', 'statsmodels>=0.8'],
     packages=find_packages(exclude=[]),
     include_package_data=True,
+    ext_modules=ext_modules,
+    cmdclass={'build_ext': BuildExt},
 )
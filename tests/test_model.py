@@ -0,0 +1,642 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pastas import *
+from pastas.recharge.recharge_func import BACKEND
+
+
+def get_model():
+    rain = pd.read_csv('tests/data/Heibloem_rain_data.dat', skiprows=4,
+                       delim_whitespace=True, parse_dates=['date'],
+                       index_col='date').precip / 1000.0
+    evap = pd.read_csv('tests/data/Maastricht_E_June2015.csv', skiprows=4,
+                       sep=';', parse_dates=['DATE'],
+                       index_col='DATE')['VALUE (m-ref)']
+    oseries = pd.read_csv('tests/data/B58C0698001_0.csv', skiprows=11,
+                          parse_dates=['PEIL DATUM TIJD'],
+                          index_col='PEIL DATUM TIJD',
+                          skipinitialspace=True)['STAND (MV)']
+    oseries = 30.17 - 0.01 * oseries
+
+    ml = Model(oseries)
+    ml.add_tseries(Tseries(rain, Gamma, name='rain'))
+    ml.add_tseries(Tseries(evap, Exponential, name='evap', up=False))
+    return ml
+
+
+def test_simulate_plan():
+    ml = get_model()
+    ml.initialize()
+    p = ml.parameters.initial.values
+    h = ml.simulate(p, ml.tmin, ml.tmax, ml.freq)
+    assert not h.hasnans
+    # the compiled plan and a newly compiled plan give the same result
+    ml.sim_plan = None
+    h2 = ml.simulate(p, ml.tmin, ml.tmax, ml.freq)
+    assert np.allclose(h, h2)
+
+
+def test_simulate_contributions():
+    ml = get_model()
+    p = ml.parameters.initial.values
+    h = ml.simulate(p)
+    c = pd.Series(p[-1], index=h.index)
+    istart = 0
+    for ts in ml.tseriesdict.values():
+        ci = ts.simulate(p[istart: istart + ts.nparam])
+        c = c.add(ci, fill_value=0.0).loc[h.index]
+        istart += ts.nparam
+    assert np.allclose(h, c)
+
+
+def test_residuals():
+    ml = get_model()
+    p = ml.parameters.initial.values
+    res = ml.residuals(p)
+    h = ml.simulate(p)
+    obs = ml.observations()
+    assert np.allclose(res, obs[res.index] - h[res.index])
+
+
+def test_sampler_interpolation():
+    from pastas.plan import SamplingOperator
+    sim_index = pd.date_range('2000-01-01', '2000-03-01', freq='D')
+    obs_index = pd.to_datetime(['1999-12-30', '2000-01-01 06:00',
+                                '2000-02-05', '2000-03-01', '2000-03-05'])
+    sampler = SamplingOperator(sim_index, obs_index)
+    h = np.random.RandomState(0).rand(sim_index.size)
+    assert sampler.interpolate
+    assert np.allclose(sampler.sample(h),
+                       np.interp(obs_index.asi8, sim_index.asi8, h))
+    assert np.allclose(sampler.to_sparse().dot(h), sampler.sample(h))
+
+
+def test_get_sample():
+    from pastas.utils import get_sample
+    tindex = pd.to_datetime(['2000-01-01', '2000-01-03', '2000-01-04',
+                             '2000-01-10'])
+    ref_tindex = pd.date_range('1999-12-30', '2000-01-12', freq='D')
+    # 2000-01-02 is exactly between two indices and goes to the first
+    assert np.array_equal(get_sample(tindex, ref_tindex), [0, 1, 2, 3])
+    assert np.array_equal(get_sample(tindex, ref_tindex[:4]), [0])
+
+
+def test_parameterset():
+    ml = get_model()
+    ml.add_noisemodel(NoiseModel())
+    p = ml.parameters
+    assert len(p) == ml.nparam
+    assert p.slices['evap'] == slice(3, 5)
+    assert np.array_equal(ml.get_parameters('evap'), p.initial[3:5])
+    assert p.to_frame().loc['constant_d', 'name'] == 'constant'
+    # the DataFrame interface
+    p.loc['rain_A', 'initial'] = 500.0
+    p.set_max('evap_A', 10.0)
+    assert p.initial['rain_A'] == 500.0
+    assert p.loc['evap_A', 'pmax'] == 10.0
+    assert np.array_equal(ml.get_parameters('rain'), p.initial[:3])
+    ml.del_tseries('rain')
+    assert len(ml.parameters) == ml.nparam
+    assert list(ml.parameters.slices) == ['evap', 'constant', 'noise']
+
+
+def test_jacobian():
+    ml = get_model()
+    ml.add_noisemodel(NoiseModel())
+    ml.initialize()
+    p = ml.parameters.initial.values
+    for noise in [False, True]:
+        jac = ml.jacobian(p, ml.tmin, ml.tmax, ml.freq, noise=noise)
+        assert jac.shape == (ml.oseries_calib.size, p.size)
+        f = ml.innovations if noise else ml.residuals
+        v0 = f(p, ml.tmin, ml.tmax, ml.freq).values
+        for i in range(p.size):
+            p1 = p.copy()
+            h = 1e-6 * max(1.0, abs(p[i]))
+            p1[i] += h
+            fd = (f(p1, ml.tmin, ml.tmax, ml.freq).values - v0) / h
+            assert np.allclose(jac[:, i], fd, rtol=1e-3,
+                               atol=1e-4 * np.abs(fd).max())
+    # the columns of Hantush and Theis are analytic
+    for rfunc in [Hantush, Theis]:
+        ml = get_model()
+        ml.del_tseries('evap')
+        stress = ml.tseriesdict['rain'].stress['rain']
+        ml.add_tseries(Tseries(stress, rfunc, name='well'))
+        ml.initialize()
+        p = ml.parameters.initial.values
+        ip = ml.parameters.slices['well']
+        ts = ml.tseriesdict['well']
+        assert not np.isnan(ts.jacobian_array(p[ip])).any()
+        jac = ml.jacobian(p, ml.tmin, ml.tmax, ml.freq)
+        v0 = ml.residuals(p, ml.tmin, ml.tmax, ml.freq).values
+        for i in range(ip.start, ip.stop):
+            p1 = p.copy()
+            h = 1e-6 * max(1.0, abs(p[i]))
+            p1[i] += h
+            fd = (ml.residuals(p1, ml.tmin, ml.tmax, ml.freq).values - v0) / h
+            assert np.allclose(jac[:, i], fd, rtol=1e-3,
+                               atol=1e-4 * np.abs(fd).max())
+
+
+def test_collection():
+    ml = get_model()
+    ml.solve(report=False)
+    mc = ModelCollection({'a': get_model(), 'b': get_model()})
+    table = mc.solve_all(workers=2)
+    assert list(table.index) == ['a', 'b']
+    assert table.error.isnull().all()
+    assert np.allclose(table.loc['a', ml.parameters.index].astype(float),
+                       ml.parameters.optimal)
+    assert np.allclose(mc.models['b'].parameters.optimal,
+                       ml.parameters.optimal)
+    assert mc.models['b'].fit.nfev == ml.fit.nfev
+
+
+def test_simulate_ensemble():
+    ml = get_model()
+    p = ml.parameters.initial.values
+    P = p * np.exp(0.1 * np.random.RandomState(0).randn(5, p.size))
+    H = ml.simulate_ensemble(P)
+    for h, p in zip(H, P):
+        assert np.allclose(h, ml.simulate(p))
+
+
+def test_append_data():
+    full = get_model()
+    ml = get_model()
+    cut = pd.Timestamp('2010-01-01')
+    new = {}
+    for name, ts in ml.tseriesdict.items():
+        new[name] = ts.stress.loc[ts.stress.index > cut, name]
+        ts.stress = ts.stress.loc[:cut]
+        ts.tmax = ts.stress.index.max()
+    ml.oseries = ml.oseries.loc[:cut]
+    ml.tmin, ml.tmax = ml.get_tmin_tmax()
+    ml.solve(report=False)
+    p = ml.get_parameters()
+    ml.simulate(p)
+    ml.append_data(full.oseries, new, solve=False)
+    full.initialize()
+    assert ml.tmax == full.tmax
+    assert np.allclose(ml.simulate(p), full.simulate(p))
+    assert np.allclose(ml.residuals(p), full.residuals(p))
+
+
+def test_set_stress():
+    # a stress that is assigned replaces the resampled stress and the
+    # spectrum of the previous stress
+    ml = get_model()
+    ts = ml.tseriesdict['rain']
+    p = ts.parameters.initial.values
+    h_week = ts.at_freq('W').simulate_array(p, 7)
+    ts.simulate_array(p)
+    ts.stress = 2.0 * ts.stress
+    assert np.allclose(ts.at_freq('W').simulate_array(p, 7), 2.0 * h_week)
+    assert np.allclose(ts.simulate_array(p),
+                       np.convolve(ts.stress['rain'].values,
+                                   ts.rfunc.block(p))[:ts.stress.index.size])
+
+
+def test_convolve_tail(monkeypatch):
+    from pastas import convolve as engine
+    ts = get_model().tseriesdict['rain']  # without a recursive form
+    p = ts.parameters.initial.values
+    stress = ts.stress[ts.name].values
+    n0 = stress.size - 100
+    h0 = ts.convolve(stress[:n0], p, p)
+    sizes = []
+    convolve = engine.convolve
+
+    def convolve_size(stress, b, *args, **kwargs):
+        sizes.append(stress.size)
+        return convolve(stress, b, *args, **kwargs)
+
+    monkeypatch.setattr(engine, 'convolve', convolve_size)
+    # only the tail of the extended stress is convolved
+    h = ts.convolve(stress, p, p)
+    assert sizes[-1] < n0
+    assert np.array_equal(h[:n0], h0)
+    assert np.allclose(h, convolve(stress, ts.rfunc.block(p), stress.size))
+    # a changed stress is convolved again
+    stress = stress.copy()
+    stress[0] += 1.0
+    h = ts.convolve(stress, p, p)
+    assert sizes[-1] == stress.size
+    assert np.allclose(h, convolve(stress, ts.rfunc.block(p), stress.size))
+
+
+def test_solve_cache(tmpdir):
+    from pastas.cache import FitSummary
+    cache = SolveCache(str(tmpdir))
+    ml = get_model()
+    ml.solve(report=False, cache=cache)
+    ml2 = get_model()
+    ml2.solve(report=False, cache=cache)
+    assert isinstance(ml2.fit, FitSummary)  # the solver did not run
+    assert np.array_equal(ml.parameters.optimal, ml2.parameters.optimal)
+    assert ml2.fit.nfev == ml.fit.nfev
+    # a changed model is solved again
+    ml3 = get_model()
+    ml3.tseriesdict['rain'].set_initial('rain_a', 50)
+    ml3.solve(report=False, cache=cache)
+    assert len(tmpdir.listdir()) == 2
+
+
+def test_solve_cache_key(tmpdir):
+    from pastas import convolve as engine
+    from pastas import special
+    cache = SolveCache(str(tmpdir))
+
+    def get_key(ml):
+        return cache.get_key(ml, None, None, LeastSquares, True, True, None,
+                             {})
+
+    key = get_key(get_model())
+    assert get_key(get_model()) == key
+    # the settings that change the simulation change the key
+    ml = get_model()
+    ml.tseriesdict['rain'].set_tail_tol(1e-3)
+    assert get_key(ml) != key
+    ml = get_model()
+    ml.dtype = np.dtype(np.float32)
+    assert get_key(ml) != key
+    try:
+        engine.set_engine('fft')
+        assert get_key(get_model()) != key
+    finally:
+        engine.set_engine('auto')
+    try:
+        special.set_tables(True)
+        assert get_key(get_model()) != key
+    finally:
+        special.set_tables(False)
+    # functions are hashed by their name, lambda functions are rejected
+    ml = get_model()
+    key = cache.get_key(ml, None, None, LeastSquares, True, True, None,
+                        dict(loss=np.log1p, options={'b': 1, 'a': 2}))
+    assert cache.get_key(ml, None, None, LeastSquares, True, True, None,
+                         dict(options={'a': 2, 'b': 1}, loss=np.log1p)) == key
+    assert cache.get_key(ml, None, None, LeastSquares, True, True, None,
+                         dict(loss=np.log, options={'a': 2, 'b': 1})) != key
+    with pytest.raises(TypeError):
+        cache.get_key(ml, None, None, LeastSquares, True, True, None,
+                      dict(loss=lambda z: z))
+
+
+def test_desolve_vectorized():
+    # the population is simulated at once, also when the best member is
+    # polished, with the innovations of the noise model
+    ml = get_model()
+    ml.add_noisemodel(NoiseModel())
+    try:
+        ml.solve(solver=DESolve, report=False)
+    except ValueError as e:
+        assert 'constant_d' in str(e)
+    else:
+        assert False, 'the constant has no boundaries'
+    ml.constant.set_min('constant_d', 20.0)
+    ml.constant.set_max('constant_d', 35.0)
+    ml.solve(solver=DESolve, report=False, vectorized=True, maxiter=2,
+             popsize=3, seed=0)
+    v = ml.innovations(ml.parameters.optimal, ml.tmin, ml.tmax)
+    assert np.isclose(ml.fit.fun, np.sum(v ** 2))
+
+
+def test_solve_workers():
+    # the finite differences of the pool give the sequential solution
+    ml = get_model()
+    ml.solve(solver=LeastSquares, jac='2-point', noise=False, report=False)
+    for pool in ['thread', 'process']:
+        ml2 = get_model()
+        ml2.solve(solver=LeastSquares, jac='2-point', noise=False,
+                  report=False, workers=2, pool=pool)
+        assert np.allclose(ml2.parameters.optimal, ml.parameters.optimal,
+                           rtol=1e-4)
+
+
+def test_plan_memoize():
+    ml = get_model()
+    ml.initialize()
+    plan = ml.sim_plan
+    p = ml.parameters.initial.values.copy()
+    h0 = plan.simulate(p).copy()
+    p[0] *= 1.1  # only the contribution of rain is simulated again
+    h1 = plan.simulate(p).copy()
+    assert plan.cache_info()['hits'] == 1
+    assert plan.cache_info()['misses'] == 3
+    plan.memoize = False
+    assert np.array_equal(plan.simulate(p), h1)
+    p[0] /= 1.1
+    assert np.allclose(plan.simulate(p), h0)
+
+
+def test_convolve_engine():
+    from pastas import convolve as engine
+    try:
+        engine.set_engine('fft')
+        ml = get_model()
+        ml.initialize()
+        h0 = ml.simulate()
+        for method in ['direct', 'oa']:
+            engine.set_engine(method)
+            ml = get_model()  # without the contributions of the other engine
+            ml.initialize()
+            assert np.allclose(ml.simulate(), h0)
+    finally:
+        engine.set_engine('auto')
+    assert engine.get_method(1000, 8) == 'direct'
+
+
+def test_convolve_recursive():
+    ml = get_model()
+    ml.tseriesdict['rain'].fix_parameter('rain_n')  # n = 1
+    for ts in ml.tseriesdict.values():
+        p = ts.parameters.initial.values
+        assert ts.get_iir(p) is not None
+        # the recursive filter equals the convolution without a cutoff
+        s = ts.rfunc.step(p, np.arange(1.0, 40 * p[-1]))
+        stress = ts.stress[ts.name].values
+        h = np.convolve(stress, s[1:] - s[:-1])[:stress.size]
+        assert np.allclose(ts.simulate_array(p), h)
+
+
+def test_convolve_recursive_model():
+    # a parameter that is fixed in the parameters of the model enables the
+    # recursive filter of the tseries
+    ml = get_model()
+    ts = ml.tseriesdict['rain']
+    ml.parameters.set_initial('rain_n', 2.0)
+    p = ml.parameters.initial.values
+    h0 = ml.simulate(p).values.copy()
+    assert ts.get_iir(p[:3]) is None
+    ml.parameters.fix_parameter('rain_n')
+    h = ml.simulate(p).values.copy()
+    assert ts.get_iir(p[:3]) is not None
+    # the recursive filter does not cut off the response at 99%
+    assert not np.array_equal(h, h0) and np.abs(h - h0).max() < 0.05
+    # the vary flags of the tseries itself are unchanged
+    assert ts.parameters.loc['rain_n', 'vary']
+    ml.parameters.vary['rain_n'] = True
+    assert np.array_equal(ml.simulate(p).values, h0)
+    assert ts.get_iir(p[:3]) is None
+
+
+def test_well():
+    index = pd.date_range('2000-01-01', '2009-12-31', freq='D')
+    stress = pd.DataFrame(np.random.RandomState(0).rand(index.size, 3),
+                          index=index)
+    r = [0.5, 1.0, 2.0]
+    ts = Well(stress, Hantush, 'wells', r=r, up=False)
+    p = ts.parameters.initial.values
+    h = np.zeros(index.size)
+    for i, pi in enumerate(ts.get_well_parameters(p)):
+        b = ts.rfunc.block(pi)
+        h += np.convolve(stress[i].values, b)[:index.size]
+    assert np.allclose(ts.simulate_array(p), h)
+
+
+def test_special_tables():
+    from scipy import special as sc
+    from pastas import special
+    special.set_tables(True, rtol=1e-10)
+    rng = np.random.RandomState(0)
+    try:
+        x = np.exp(rng.uniform(np.log(1e-10), np.log(700), 100000))
+        assert np.allclose(special.exp1(x), sc.exp1(x), rtol=1e-10, atol=0)
+        for n in [0.3, 1.0, 2.71]:
+            x = np.exp(rng.uniform(np.log(1e-8), np.log(100), 100000))
+            assert np.allclose(special.gammainc(n, x), sc.gammainc(n, x),
+                               rtol=1e-10, atol=0)
+        ml = get_model()
+        p = ml.parameters.initial.values
+        h = ml.simulate(p)
+    finally:
+        special.set_tables(False)
+    assert np.allclose(h, get_model().simulate(p))
+
+
+def test_special_exp1_range(monkeypatch):
+    from scipy import special as sc
+    from pastas import special
+    special.set_tables(True, rtol=1e-10)
+    try:
+        table = special.get_table('exp1')
+        # the relative error is below rtol on a dense grid
+        x = np.exp(np.linspace(np.log(table.xmin), np.log(table.xmax),
+                               1000001))
+        assert np.abs(table(x) / sc.exp1(x) - 1.0).max() <= 1e-10
+        # the whole range up to xmax is interpolated, not only up to
+        # log(xmax)
+        x = np.linspace(6.0, table.xmax, 1000)
+        y = sc.exp1(x)
+
+        def exp1(x):
+            raise AssertionError('scipy.special.exp1 is used')
+
+        monkeypatch.setattr(special.sc, 'exp1', exp1)
+        assert np.allclose(special.exp1(x), y, rtol=1e-10, atol=0)
+    finally:
+        special.set_tables(False)
+
+
+def test_tail_tol():
+    ml = get_model()
+    ts = ml.tseriesdict['rain']
+    p = ts.parameters.initial.values.astype(float)
+    stress = ts.stress['rain'].values
+    t = np.arange(1.0, ts.rfunc.calc_tmax(p, 1 - 1e-12))
+    s = ts.rfunc.step(p, t)
+    h = np.convolve(stress, s[1:] - s[:-1])[:stress.size]
+    nb = 0
+    for tail_tol in [1e-2, 1e-4]:
+        ts.set_tail_tol(tail_tol)
+        # the budget applies to the mean stress of the whole period
+        error = np.abs(ts.simulate_array(p) - h)[t.size:].mean()
+        assert error <= 1.1 * tail_tol
+        assert ts.rfunc.block(p).size > nb
+        nb = ts.rfunc.block(p).size
+    # the step function of Theis keeps increasing, it is cut off where it
+    # increases less than tail_tol per day
+    ts = Tseries(ts.stress['rain'], Theis, name='theis')
+    p = ts.parameters.initial.values.astype(float)
+    p[2] = 100.0
+    nb = 0
+    for tail_tol in [1e-5, 1e-6]:
+        ts.set_tail_tol(tail_tol)
+        tmax = ts.rfunc.calc_tmax(p)
+        s = ts.rfunc.step(p, np.array([tmax - 0.5, tmax + 0.5]))
+        assert np.isclose(np.diff(s)[0], ts.rfunc.tail_tol, rtol=1e-3)
+        assert ts.rfunc.block(p).size > nb
+        nb = ts.rfunc.block(p).size
+
+
+def test_float32():
+    # A float32 model simulates the same heads as a float64 model up to the
+    # rounding of single precision, about 1e-5 m for these heads of 30 m.
+    ml = get_model()
+    ml.solve(report=False)
+    p = ml.get_parameters()
+    P = p * (1 + 0.05 * np.random.RandomState(0).randn(20, p.size))
+    H64 = ml.simulate_ensemble(P)
+    res64 = ml.residuals()
+    ml.dtype = np.dtype(np.float32)
+    H32 = ml.simulate_ensemble(P)
+    res32 = ml.residuals()
+    assert H32.dtype == np.float32 and res32.dtype == np.float32
+    assert np.abs(H32 - H64).max() < 1e-4
+    assert np.abs(res32 - res64).max() < 1e-4
+    # the block responses and the convolutions are single precision too
+    from pastas import convolve as engine
+    for ts in ml.tseriesdict.values():
+        assert ts._contribution[3].dtype == np.float32
+    ts = ml.tseriesdict['rain']
+    b = ts.rfunc.block(p[:3], 1, np.float32)
+    assert b.dtype == np.float32
+    assert ts.rfunc.block_ensemble(P[:, :3], 1, np.float32).dtype == \
+        np.float32
+    stress = ts.stress['rain'].values.astype(np.float32)
+    for method in ['direct', 'fft', 'oa']:
+        h = engine.convolve(stress, b, method=method)
+        assert h.dtype == np.float32
+    nfft, S = ts.stress_spectrum(b.size, np.float32)
+    assert S.dtype == np.complex64
+
+
+@pytest.mark.skipif(BACKEND == 'python',
+                    reason='the recharge kernels are not compiled')
+def test_recharge_backend():
+    # the compiled and the Python recharge kernels give the same recharge
+    from pastas.recharge import recharge, recharge_func
+    ml = get_model()
+    P = ml.tseriesdict['rain'].stress.iloc[:1000, 0].values
+    E = ml.tseriesdict['evap'].stress.iloc[:1000, 0].values
+    rch = recharge_func.Combination()
+    p = [0.26, 1e-2, 3.0, 3.0, 1.5e-3]
+    Rs, Rf = recharge.comb(np.arange(P.size), P, E, *p)[:2]
+    assert np.allclose(rch.simulate(P, E, p), Rs + Rf, rtol=1e-10)
+    # the compiled kernels check the length of E
+    from pastas.recharge import recharge_cy
+    with pytest.raises(ValueError):
+        recharge_cy.comb(np.arange(P.size), P, E[:-1], *p)
+    with pytest.raises(ValueError):
+        recharge_cy.ensemble(P, E[:-1], p[0], p[4], Kp=p[1])
+
+
+def test_recharge_ensemble():
+    # the ensemble solver gives the recharge of each parameter set
+    from pastas.recharge import recharge, recharge_func
+    ml = get_model()
+    P = ml.tseriesdict['rain'].stress.iloc[:1000, 0].values
+    E = ml.tseriesdict['evap'].stress.iloc[:1000, 0].values
+    p = np.array([0.26, 1e-2, 3.0, 3.0, 1.5e-3])
+    p = p * np.exp(0.2 * np.random.RandomState(0).randn(4, p.size))
+    R = recharge.ensemble(P, E, p[:, 0], p[:, 4], Kp=p[:, 1], Beta=p[:, 2],
+                          Gamma=p[:, 3])[0]
+    rch = recharge_func.Combination()
+    assert np.allclose(rch.simulate_ensemble(P, E, p), R, rtol=1e-10)
+    for r, pi in zip(R, p):
+        assert np.allclose(r, rch.simulate(P, E, pi), rtol=1e-10)
+
+
+def test_recharge_bisection():
+    # a dry root zone with Beta < 1 has an infinite derivative at zero, the
+    # Newton iteration then switches to bisection
+    from pastas.recharge import recharge, recharge_func
+    p = (0.01, 0.0, 0.5, 0.0, False, True)
+    s0, epu = 0.002, 0.006
+    counts = [0, 0, 0, 0]
+    s1, converged, bisection = recharge._step(s0, 0.0, epu, 1.0, p, 1,
+                                              counts)
+    assert bisection and counts[1] == 1
+    # the exact solution of the implicit Euler step
+    assert abs(s1 - s0 / (1.0 + epu / (0.5 * p[0]))) < 1e-5
+    # both kernels bisect the same steps
+    P = np.r_[np.full(5, 2e-3), np.zeros(20)]
+    E = np.full(25, 6e-3)
+    rch = recharge_func.Preferential()
+    R = rch.simulate(P, E, [0.01, 0.5, 1e-3])
+    assert rch.last_stats['bisections'] > 0
+    stats = np.zeros(4, dtype=np.intp)
+    R2 = recharge.pref(np.arange(25), P, E, 0.01, 0.5, 1e-3, stats=stats)[0]
+    assert stats[1] == rch.last_stats['bisections']
+    assert np.allclose(R, R2, rtol=1e-10)
+
+
+def test_recharge_stats():
+    # the iterations of the root zone solver are counted in both kernels
+    from pastas.recharge import recharge, recharge_func
+    ml = get_model()
+    P = ml.tseriesdict['rain'].stress.iloc[:1000, 0].values
+    E = ml.tseriesdict['evap'].stress.iloc[:1000, 0].values
+    p = [0.26, 1e-2, 3.0, 3.0, 1.5e-3]
+    counts = np.zeros(4, dtype=np.intp)
+    recharge.comb(np.arange(P.size), P, E, *p, stats=counts)
+    rch = recharge_func.Combination()
+    rch.simulate(P, E, p)
+    rch.simulate_ensemble(P, E, np.array([p, p]))
+    assert rch.last_stats['iterations'] == 2 * counts[0]
+    assert rch.stats['iterations'] == 3 * counts[0] > 0
+    assert rch.stats['calls'] == 2 and rch.stats['time'] > 0.0
+    rch.reset_stats()
+    assert rch.stats['iterations'] == 0 and rch.last_stats is None
+
+
+def test_recharge_dt():
+    # the recharge of hourly stresses equals that of daily stresses
+    from pastas.recharge import recharge_func
+    ml = get_model()
+    P = ml.tseriesdict['rain'].stress.iloc[:1000, 0].values
+    E = ml.tseriesdict['evap'].stress.iloc[:1000, 0].values
+    rch = recharge_func.Combination()
+    p = [0.26, 1e-2, 3.0, 3.0, 1.5e-3]
+    R = rch.simulate(P, E, p)
+    Rh = rch.simulate(np.repeat(P, 24), np.repeat(E, 24), p, dt=1.0 / 24)
+    assert abs(Rh.mean() - R.mean()) < 0.05 * R.mean()
+    # a stiff parameter set is solved with substeps
+    rch.simulate(P, E, [0.05, 0.1, 3.0, 1.0, 1.5e-3])
+    assert rch.last_stats['substeps'] > 0
+    assert rch.last_stats['nonconverged'] == 0
+
+
+def test_recharge_cache():
+    # perturbing the response function reuses the recharge series
+    ml0 = get_model()
+    rain = ml0.tseriesdict['rain'].stress.iloc[:, 0]
+    evap = ml0.tseriesdict['evap'].stress.iloc[:, 0]
+    ml = Model(ml0.oseries)
+    ml.add_tseries(Recharge(rain, evap, Gamma, Combination, name='rch'))
+    ml.initialize()
+    ts = ml.tseriesdict_calib['rch']
+    p = ml.parameters.initial.values.copy()
+    h = ml.simulate(p)
+    ml.jacobian(p)
+    assert ts.cache_info()['misses'] == 1 + ts.recharge.nparam
+    assert ts.cache_info()['hits'] > 0
+    assert np.array_equal(h, ml.simulate(p))
+
+
+def test_recharge_linear():
+    # the two convolutions of Linear equal the convolution of the recharge
+    ml0 = get_model()
+    rain = ml0.tseriesdict['rain'].stress.iloc[:, 0]
+    evap = ml0.tseriesdict['evap'].stress.iloc[:, 0]
+    ml = Model(ml0.oseries)
+    ml.add_tseries(Recharge(rain, evap, Gamma, Linear, name='rch'))
+    ml.initialize()
+    ts = ml.tseriesdict_calib['rch']
+    p = ml.parameters.initial.values.copy()
+    for f in [-1.0, -0.8]:
+        p[3] = f
+        h = ts.simulate_array(p[:4])
+        r = ts.get_stress(p[:4]).values
+        b = ts.rfunc.block(p[:3])
+        assert np.allclose(h, np.convolve(r, b)[:r.size])
+    jac = ts.jacobian_array(p[:4])
+    for i in range(4):
+        p1 = p[:4].copy()
+        step = 1e-6 * max(1.0, abs(p1[i]))
+        p1[i] += step
+        djac = (ts.simulate_array(p1) - h) / step
+        assert np.abs(jac[i] - djac).max() < 1e-4 * np.abs(djac).max()